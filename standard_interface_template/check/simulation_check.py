@@ -128,8 +128,7 @@ class SimulationCheck:
             return
 
         # must have material defined in addition to 'unassigned'
-        df = self._mat_data.coverage_data.to_dataframe()
-        mat_names = df['name'].to_list()
+        mat_names = self._mat_data.column('name').tolist()
         if len(mat_names) < 2:
             problem = 'STOP! No user defined material zones found.'
             description = 'User defined materials are required for this simulation.'
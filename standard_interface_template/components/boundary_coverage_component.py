@@ -4,19 +4,21 @@ import os
 import shutil
 
 # 2. Third party modules
-import pandas as pd
-import xarray as xr
+import numpy as np
 
 # 3. Aquaveo modules
 from xmsapi.dmi import ActionRequest, DialogModality
-from xmscomponents.display.display_options_io import (read_display_option_ids, read_display_options_from_json,
-                                                      write_display_option_ids, write_display_options_to_json)
+from xmscomponents.display.display_options_io import read_display_option_ids, write_display_option_ids
 from xmscomponents.display.xms_display_message import XmsDisplayMessage
 from xmsguipy.data.category_display_option_list import CategoryDisplayOptionList
 from xmsguipy.data.target_type import TargetType
 from xmsguipy.dialogs.category_display_options_list import CategoryDisplayOptionsDialog
 
 # 4. Local modules
+from standard_interface_template.components.display_id_files import (display_id_file, display_options_missing_ids,
+                                                                     display_options_to_write)
+from standard_interface_template.components.display_options_cache import (read_category_list, read_display_options,
+                                                                          write_display_options)
 from standard_interface_template.components.standard_base_component import StandardBaseComponent
 from standard_interface_template.data.boundary_coverage_data import BoundaryCoverageData
 from standard_interface_template.gui.boundary_dialog import BoundaryDialog
@@ -47,6 +49,7 @@ class BoundaryCoverageComponent(StandardBaseComponent):
         #                    [(menu_text, menu_method)...]
         self.tree_commands = [
             ('Display Options...', 'open_display_options'),
+            ('Compact Data', 'compact_data'),
         ]
         self.arc_commands = [
             ('Assign Arc', 'open_assign_arc'),
@@ -55,16 +58,17 @@ class BoundaryCoverageComponent(StandardBaseComponent):
             ('Assign Point', 'open_assign_point'),
         ]
         self.disp_opts_file = os.path.join(os.path.dirname(self.main_file), 'boundary_coverage_display_options.json')
+        self._id_file_comp_ids = {}  # {display option: component ids in its display id file, as read or written}
         if not os.path.isfile(self.main_file):
             # Read the default display options, and save ourselves a copy with a randomized UUID.
             categories = CategoryDisplayOptionList()  # Generates a random UUID key for the display list
             default_file = os.path.join(os.path.dirname(os.path.dirname(__file__)),
                                         'gui', 'resources', 'default_data',
                                         'default_boundary_coverage_display_options.json')
-            json_dict = read_display_options_from_json(default_file)
+            json_dict = read_display_options(default_file)
             json_dict['comp_uuid'] = os.path.basename(os.path.dirname(self.main_file))
             categories.from_dict(json_dict)
-            write_display_options_to_json(self.disp_opts_file, categories)
+            write_display_options(self.disp_opts_file, categories)
             # Save our display list UUID to the main file
             self.data.info.attrs['display_uuid'] = categories.uuid
             self.data.commit()
@@ -100,7 +104,6 @@ class BoundaryCoverageComponent(StandardBaseComponent):
         if save_type == 'DUPLICATE':
             json_dict = self.duplicate_display_opts(new_path, os.path.basename(self.disp_opts_file))
             data = BoundaryCoverageData(new_main_file)
-            data.load_all()
             data.info.attrs['cov_uuid'] = ''
             data.info.attrs['display_uuid'] = json_dict['uuid']
             data.commit()
@@ -121,7 +124,7 @@ class BoundaryCoverageComponent(StandardBaseComponent):
                   text.
                 - action_requests (:obj:`list` of :obj:`xmsapi.dmi.ActionRequest`): List of actions for XMS to perform.
         """
-        self.data.commit()
+        self.data.commit_later()
         id_dir = os.path.join(os.path.dirname(self.main_file), 'display_ids')
         os.mkdir(id_dir)
 
@@ -165,14 +168,12 @@ class BoundaryCoverageComponent(StandardBaseComponent):
             comp_ids = read_display_option_ids(initial_comp_file)
             os.remove(initial_att_file)
             os.remove(initial_comp_file)
-            for att_id, comp_id in zip(att_ids, comp_ids):
-                self.update_component_id(TargetType.arc, att_id, comp_id)
             id_dir = os.path.join(os.path.dirname(self.main_file), 'display_ids')
             os.mkdir(id_dir)
-            self.update_id_files()
+            self.update_component_ids(TargetType.arc, att_ids, comp_ids)  # Writes the display id files.
 
         self.data.info.attrs['cov_uuid'] = self.cov_uuid
-        self.data.commit()
+        self.data.commit_later()
         # Send the display message to XMS.
         self.display_option_list.append(
             XmsDisplayMessage(file=self.disp_opts_file, edit_uuid=self.cov_uuid)
@@ -218,29 +219,20 @@ class BoundaryCoverageComponent(StandardBaseComponent):
                     comp_id = selected_comp_ids[0] if selected_comp_ids else -1
                 except KeyError:
                     comp_id = -1  # No component ids assigned for any of the selected arcs
-        single_arc = self.data.coverage_data.where(self.data.coverage_data.comp_id == comp_id, drop=True)
-        if single_arc.user_option.size == 0:
-            # Here we are using component id 0 for default values.
-            single_arc = self.data.coverage_data.where(self.data.coverage_data.comp_id == 0, drop=True)
-        dialog = BoundaryDialog(win_cont, icon, 'Arc Dialog', single_arc.user_text.item(0),
-                                single_arc.user_option.item(0))
+        if self.data.row_of(comp_id) is None:
+            comp_id = 0  # Here we are using component id 0 for default values.
+        dialog = BoundaryDialog(win_cont, icon, 'Arc Dialog', self.data.value(comp_id, 'user_text'),
+                                self.data.value(comp_id, 'user_option'))
         if dialog.exec():
             dlg_data = dialog.get_dialog_data_dict()
             edit = dlg_data['user_edit']
             option = dlg_data['user_display']
-            new_comp_id = int(self.data.coverage_data.comp_id.max() + 1)
-            new_values = []
-            for arc_id in arc_ids:
-                self.update_component_id(TargetType.arc, arc_id, new_comp_id)
-                new_values.append([new_comp_id, option, edit])
-                new_comp_id += 1
-            values_dataset = pd.DataFrame(new_values, columns=['comp_id', 'user_option', 'user_text']).to_xarray()
-            self.data.coverage_data = xr.concat([self.data.coverage_data, values_dataset], 'index')
-            self.update_id_files()
+            new_comp_id = self.data.get_or_add_comp_id(option, edit)
+            self.update_component_ids(TargetType.arc, arc_ids, new_comp_id)
             self.display_option_list.append(
                 XmsDisplayMessage(file=self.disp_opts_file, edit_uuid=self.cov_uuid)
             )
-            self.data.commit()
+            self.data.commit_later()
 
         # Delete the id dumped by xms files.
         shutil.rmtree(os.path.join(os.path.dirname(self.main_file), 'temp'), ignore_errors=True)
@@ -286,29 +278,20 @@ class BoundaryCoverageComponent(StandardBaseComponent):
                     comp_id = selected_comp_ids[0] if selected_comp_ids else -1
                 except KeyError:
                     comp_id = -1  # No component ids assigned for any of the selected points
-        single_point = self.data.coverage_data.where(self.data.coverage_data.comp_id == comp_id, drop=True)
-        if single_point.user_option.size == 0:
-            # Here we are using component id 0 for default values.
-            single_point = self.data.coverage_data.where(self.data.coverage_data.comp_id == 0, drop=True)
-        dialog = BoundaryDialog(win_cont, icon, 'Point Dialog', single_point.user_text.item(0),
-                                single_point.user_option.item(0))
+        if self.data.row_of(comp_id) is None:
+            comp_id = 0  # Here we are using component id 0 for default values.
+        dialog = BoundaryDialog(win_cont, icon, 'Point Dialog', self.data.value(comp_id, 'user_text'),
+                                self.data.value(comp_id, 'user_option'))
         if dialog.exec():
             dlg_data = dialog.get_dialog_data_dict()
             edit = dlg_data['user_edit']
             option = dlg_data['user_display']
-            new_comp_id = int(self.data.coverage_data.comp_id.max() + 1)
-            new_values = []
-            for point_id in point_ids:
-                self.update_component_id(TargetType.point, point_id, new_comp_id)
-                new_values.append([new_comp_id, option, edit])
-                new_comp_id += 1
-            values_dataset = pd.DataFrame(new_values, columns=['comp_id', 'user_option', 'user_text']).to_xarray()
-            self.data.coverage_data = xr.concat([self.data.coverage_data, values_dataset], 'index')
-            self.update_id_files()
+            new_comp_id = self.data.get_or_add_comp_id(option, edit)
+            self.update_component_ids(TargetType.point, point_ids, new_comp_id)
             self.display_option_list.append(
                 XmsDisplayMessage(file=self.disp_opts_file, edit_uuid=self.cov_uuid)
             )
-            self.data.commit()
+            self.data.commit_later()
 
         # Delete the id dumped by xms files.
         shutil.rmtree(os.path.join(os.path.dirname(self.main_file), 'temp'), ignore_errors=True)
@@ -332,9 +315,7 @@ class BoundaryCoverageComponent(StandardBaseComponent):
                   text.
                 - action_requests (:obj:`list` of :obj:`xmsapi.dmi.ActionRequest`): List of actions for XMS to perform.
         """
-        categories = CategoryDisplayOptionList()
-        json_dict = read_display_options_from_json(self.disp_opts_file)
-        categories.from_dict(json_dict)
+        categories = read_category_list(self.disp_opts_file)
         categories_list = [categories]
 
         dlg = CategoryDisplayOptionsDialog(categories_list, win_cont)
@@ -344,7 +325,7 @@ class BoundaryCoverageComponent(StandardBaseComponent):
             # write files
             category_lists = dlg.get_category_lists()
             for category_list in category_lists:
-                write_display_options_to_json(self.disp_opts_file, category_list)
+                write_display_options(self.disp_opts_file, category_list)
                 self.display_option_list.append(
                     XmsDisplayMessage(
                         file=self.disp_opts_file, edit_uuid=self.cov_uuid,
@@ -353,23 +334,102 @@ class BoundaryCoverageComponent(StandardBaseComponent):
                 break  # only one list
         return [], []
 
-    def update_id_files(self):
-        """Writes the display id files."""
-        df = self.data.coverage_data.to_dataframe()
-        disp_names = BoundaryCoverageData.display_list
-        for i in range(len(disp_names)):
-            self._write_id_file(disp_names[i], df)
+    def compact_data(self, query, params, win_cont, icon):
+        """
+        Removes attribute rows that are no longer assigned to any arc or point.
+
+        Args:
+            query (:obj:`xmsapi.dmi.Query`): Object for communicating with XMS.
+            params (:obj:`list` of :obj:`str`): A list of parameters add to the ActionRequest. Unused by this method.
+            win_cont (:obj:`PySide2.QtWidgets.QWidget`): The window container. Unused by this method.
+            icon (:obj:`PySide2.QtGui.QIcon`): Icon to show in the dialog title. Unused by this method.
+
+        Returns:
+            (:obj:`tuple`): tuple containing:
+                - messages (:obj:`list` of :obj:`tuple` of :obj:`str`): List of tuples with the first element of the
+                  tuple being the message level (DEBUG, ERROR, WARNING, INFO) and the second element being the message
+                  text.
+                - action_requests (:obj:`list` of :obj:`xmsapi.dmi.ActionRequest`): List of actions for XMS to perform.
+        """
+        num_removed = self.compact(query)
+        return [('INFO', f'Removed {num_removed} unused boundary condition attribute rows.')], []
+
+    def compact(self, query):
+        """
+        Removes the attribute rows not referenced by the current feature to component id map.
+
+        Args:
+            query (:obj:`xmsapi.dmi.Query`): Object for communicating with XMS, at the component context.
+
+        Returns:
+            (int): The number of rows removed.
+        """
+        target_types = [TargetType.arc, TargetType.point]
+        for target_type in target_types:
+            self.query_for_all_component_ids(query, target_type)
+        cov_comp_ids = self.comp_to_xms.get(self.cov_uuid, {})
+        live_comp_ids = set()
+        for target_type in target_types:
+            live_comp_ids.update(cov_comp_ids.get(target_type, {}).keys())
+
+        num_removed = self.data.compact(live_comp_ids)
+        if num_removed:
+            self.update_id_files()
+            self.display_option_list.append(XmsDisplayMessage(file=self.disp_opts_file, edit_uuid=self.cov_uuid))
+            self.data.commit_later()
+        return num_removed
+
+    def update_id_files(self, disp_names=None):
+        """
+        Writes the display id files.
+
+        Args:
+            disp_names (:obj:`list` of str): The display options whose component ids changed. All of them are written if
+                None. Display options without a file yet are always written.
+        """
+        id_dir = os.path.join(os.path.dirname(self.main_file), 'display_ids')
+        comp_ids_by_option = self.data.ids_by_value('user_option')
+        for disp_name in display_options_to_write(id_dir, BoundaryCoverageData.display_list, disp_names):
+            comp_ids = comp_ids_by_option.get(disp_name, np.empty(0, dtype='i4'))
+            self._write_id_file(disp_name, comp_ids.astype('i4').tolist())
+
+    def update_assigned_id_files(self, comp_ids):
+        """
+        Writes the display id files of the display options of component ids that are not in their file yet.
+
+        Args:
+            comp_ids (:obj:`list` of int): The component ids just assigned to features.
+        """
+        id_dir = os.path.join(os.path.dirname(self.main_file), 'display_ids')
+        if not os.path.isdir(id_dir):
+            return  # Written when the display ids folder is created.
+        disp_name_of = {comp_id: self.data.value(comp_id, 'user_option') for comp_id in comp_ids}
+        self.update_id_files(display_options_missing_ids(comp_ids, disp_name_of, self._read_id_file))
+
+    def _read_id_file(self, disp_name):
+        """
+        Read the component ids of a single id file.
+
+        Args:
+            disp_name (str): The display option name.
+
+        Returns:
+            (:obj:`set` of int): The component ids in the file, empty if there is no file.
+        """
+        if disp_name not in self._id_file_comp_ids:
+            id_file = display_id_file(os.path.join(os.path.dirname(self.main_file), 'display_ids'), disp_name)
+            comp_ids = read_display_option_ids(id_file) if os.path.isfile(id_file) else []
+            self._id_file_comp_ids[disp_name] = {int(comp_id) for comp_id in comp_ids}
+        return self._id_file_comp_ids[disp_name]
 
-    def _write_id_file(self, disp_name, df):
+    def _write_id_file(self, disp_name, comp_ids):
         """
         Write a single id file.
 
         Args:
             disp_name (str): The display option name.
-            df (:obj:`pandas.DataFrame`): The dataframe containing user options, to base the display categories off of,
-            and the component ids.
+            comp_ids (:obj:`list` of int): The component ids using the display option.
         """
-        df1 = df.loc[df['user_option'] == disp_name]
-        ids = df1['comp_id'].astype(dtype='i4').to_list()
-        id_file = os.path.join(os.path.dirname(self.main_file), f'display_ids/{disp_name}.display_ids')
-        write_display_option_ids(id_file, ids)
+        id_file = display_id_file(os.path.join(os.path.dirname(self.main_file), 'display_ids'), disp_name)
+        write_display_option_ids(id_file, comp_ids)
+        self._id_file_comp_ids[disp_name] = set(comp_ids)
@@ -5,12 +5,11 @@ import os
 # 2. Third party modules
 
 # 3. Aquaveo modules
-from xmscomponents.display.display_options_io import read_display_options_from_json, write_display_options_to_json
 from xmscomponents.display.xms_display_message import DrawType, XmsDisplayMessage
-from xmsguipy.data.category_display_option_list import CategoryDisplayOptionList
 from xmsguipy.dialogs.category_display_options_list import CategoryDisplayOptionsDialog
 
 # 4. Local modules
+from standard_interface_template.components.display_options_cache import read_category_list, write_display_options
 from standard_interface_template.components.materials_mapped_component import MaterialsMappedComponent
 
 
@@ -86,9 +85,7 @@ class BoundaryMappedComponent(MaterialsMappedComponent):
                   text.
                 - action_requests (:obj:`list` of :obj:`xmsapi.dmi.ActionRequest`): List of actions for XMS to perform.
         """
-        categories = CategoryDisplayOptionList()
-        json_dict = read_display_options_from_json(self.disp_opts_file)
-        categories.from_dict(json_dict)
+        categories = read_category_list(self.disp_opts_file)
         categories_list = [categories]
 
         dlg = CategoryDisplayOptionsDialog(categories_list, win_cont)
@@ -98,7 +95,7 @@ class BoundaryMappedComponent(MaterialsMappedComponent):
             # write files
             category_lists = dlg.get_category_lists()
             for category_list in category_lists:
-                write_display_options_to_json(self.disp_opts_file, category_list)
+                write_display_options(self.disp_opts_file, category_list)
                 self.display_option_list.append(
                     XmsDisplayMessage(file=self.disp_opts_file, draw_type=DrawType.draw_at_locations)
                 )
@@ -0,0 +1,105 @@
+"""Names of the display id files, and which of them must be written when component ids or materials change."""
+# 1. Standard python modules
+import os
+
+# 2. Third party modules
+
+# 3. Aquaveo modules
+
+# 4. Local modules
+
+__copyright__ = "(C) Copyright Aquaveo 2020"
+__license__ = "All rights reserved"
+
+
+def display_id_file(id_dir, display_option):
+    """
+    Get the display id file of a display option.
+
+    Args:
+        id_dir (str): The display ids folder of the component.
+        display_option (str): The display option name.
+
+    Returns:
+        (str): The file listing the component ids drawn with the display option.
+    """
+    return os.path.join(id_dir, f'{display_option}.display_ids')
+
+
+def material_id_file(id_dir, material_id):
+    """
+    Get the display id file of a material.
+
+    Args:
+        id_dir (str): The display ids folder of the component.
+        material_id (int): The material id.
+
+    Returns:
+        (str): The file holding the material id.
+    """
+    return os.path.join(id_dir, f'material_{material_id}.matid')
+
+
+def display_options_to_write(id_dir, display_options, changed=None):
+    """
+    Get the display options whose display id files must be written.
+
+    Args:
+        id_dir (str): The display ids folder of the component.
+        display_options (:obj:`list` of str): All the display option names.
+        changed (:obj:`list` of str): The display options whose component ids changed, or None if all of them did.
+
+    Returns:
+        (:obj:`list` of str): The changed display options and the display options without a file yet, in the order of
+        display_options.
+    """
+    return [
+        display_option for display_option in display_options
+        if changed is None or display_option in changed or not os.path.isfile(display_id_file(id_dir, display_option))
+    ]
+
+
+def display_options_missing_ids(comp_ids, display_option_of, listed_ids):
+    """
+    Get the display options of component ids that their display id files do not list yet.
+
+    Args:
+        comp_ids (:obj:`list` of int): The component ids just assigned to features.
+        display_option_of (:obj:`dict`): The display option of each component id, None if it has no attributes.
+        listed_ids (:obj:`callable`): Given a display option, returns the set of component ids in its file. Only
+            called for the display options of comp_ids.
+
+    Returns:
+        (:obj:`list` of str): The sorted display options whose files must be written.
+    """
+    display_options = set()
+    for comp_id in comp_ids:
+        display_option = display_option_of.get(comp_id)
+        if display_option is not None and comp_id not in listed_ids(display_option):
+            display_options.add(display_option)
+    return sorted(display_options)
+
+
+def material_id_files_to_update(id_dir, old_ids, new_ids):
+    """
+    Get the material display id files to write and to remove after the materials are edited.
+
+    A material's file only holds its id, so it does not change while the material exists.
+
+    Args:
+        id_dir (str): The display ids folder of the component.
+        old_ids (:obj:`list` of int): The material ids before editing.
+        new_ids (:obj:`list` of int): The material ids after editing.
+
+    Returns:
+        (:obj:`tuple`): The ids of the added materials and of the materials without a file yet, and the ids of the
+        deleted materials.
+    """
+    kept_ids = set(new_ids)
+    deleted_ids = [mat_id for mat_id in old_ids if mat_id not in kept_ids]
+    old_ids = set(old_ids)
+    write_ids = [
+        mat_id for mat_id in new_ids
+        if mat_id >= 0 and (mat_id not in old_ids or not os.path.isfile(material_id_file(id_dir, mat_id)))
+    ]
+    return write_ids, deleted_ids
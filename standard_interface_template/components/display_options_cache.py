@@ -0,0 +1,113 @@
+"""In-process cache of parsed display options files."""
+# 1. Standard python modules
+import os
+import threading
+
+# 2. Third party modules
+
+# 3. Aquaveo modules
+from xmscomponents.display.display_options_io import read_display_options_from_json, write_display_options_to_json
+from xmsguipy.data.category_display_option_list import CategoryDisplayOptionList
+
+# 4. Local modules
+
+__copyright__ = "(C) Copyright Aquaveo 2020"
+__license__ = "All rights reserved"
+
+
+_cache_lock = threading.Lock()
+_cache = {}  # {normalized filename: (modification time, size, parsed json dict)}
+
+
+def _file_key(filename):
+    """
+    Get the key of a file in the cache.
+
+    Args:
+        filename (str): The file name.
+
+    Returns:
+        (str): The normalized absolute path of the file.
+    """
+    return os.path.normcase(os.path.abspath(filename))
+
+
+def _copy_json(value):
+    """
+    Copy parsed JSON, so the cached value is not changed by edits to the copy.
+
+    Args:
+        value: A dict, list or scalar parsed from JSON.
+
+    Returns:
+        The copy.
+    """
+    if isinstance(value, dict):
+        return {key: _copy_json(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_json(item) for item in value]
+    return value
+
+
+def _store(filename):
+    """
+    Parse a display options file and cache it, keyed by its current modification time and size.
+
+    Args:
+        filename (str): The display options JSON file.
+
+    Returns:
+        (dict): The cached dict. Do not modify.
+    """
+    stat = os.stat(filename)
+    json_dict = read_display_options_from_json(filename)
+    with _cache_lock:
+        _cache[_file_key(filename)] = (stat.st_mtime_ns, stat.st_size, json_dict)
+    return json_dict
+
+
+def read_display_options(filename):
+    """
+    Read a display options file, parsing it only if it changed since it was last read or written.
+
+    Args:
+        filename (str): The display options JSON file.
+
+    Returns:
+        (dict): The display options. The caller may modify it.
+    """
+    stat = os.stat(filename)
+    with _cache_lock:
+        entry = _cache.get(_file_key(filename))
+    if entry is not None and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+        json_dict = entry[2]
+    else:
+        json_dict = _store(filename)
+    return _copy_json(json_dict)
+
+
+def read_category_list(filename):
+    """
+    Read the category display option list of a display options file.
+
+    Args:
+        filename (str): The display options JSON file.
+
+    Returns:
+        (:obj:`CategoryDisplayOptionList`): The category list. The caller may modify it.
+    """
+    categories = CategoryDisplayOptionList()
+    categories.from_dict(read_display_options(filename))
+    return categories
+
+
+def write_display_options(filename, categories):
+    """
+    Write a display options file and update its cached value.
+
+    Args:
+        filename (str): The display options JSON file.
+        categories (:obj:`CategoryDisplayOptionList`): The category list to write.
+    """
+    write_display_options_to_json(filename, categories)
+    _store(filename)
@@ -0,0 +1,149 @@
+"""Sorted arrays of the component ids assigned to coverage features."""
+# 1. Standard python modules
+
+# 2. Third party modules
+import numpy as np
+
+# 3. Aquaveo modules
+
+# 4. Local modules
+
+__copyright__ = "(C) Copyright Aquaveo 2020"
+__license__ = "All rights reserved"
+
+
+class FeatureIdMap:
+    """
+    The component id of every feature of one type in a coverage, for looking up many features at once.
+
+    Attributes:
+        att_ids (:obj:`numpy.ndarray`): The sorted XMS feature ids.
+        comp_ids (:obj:`numpy.ndarray`): The component id of each feature in att_ids.
+    """
+
+    def __init__(self, att_ids, comp_ids):
+        """
+        Constructor.
+
+        Args:
+            att_ids (:obj:`list`): The XMS feature ids.
+            comp_ids (:obj:`list`): The component id of each feature.
+        """
+        att_ids = np.asarray(att_ids, dtype=np.int64)
+        order = np.argsort(att_ids, kind='stable')
+        self.att_ids = att_ids[order]
+        self.comp_ids = np.asarray(comp_ids, dtype=np.int64)[order]
+
+    @classmethod
+    def from_comp_to_xms(cls, comp_to_xms):
+        """
+        Build the map from a component's component id to XMS feature ids dict.
+
+        Args:
+            comp_to_xms (:obj:`dict`): The component id to the list of XMS feature ids assigned to it.
+
+        Returns:
+            (:obj:`FeatureIdMap`): The map.
+        """
+        att_ids = []
+        comp_ids = []
+        for comp_id, feature_ids in comp_to_xms.items():
+            att_ids.extend(feature_ids)
+            comp_ids.extend([comp_id] * len(feature_ids))
+        return cls(att_ids, comp_ids)
+
+    def to_comp_to_xms(self):
+        """
+        Get the component id to XMS feature ids dict this map was built from.
+
+        Returns:
+            (:obj:`dict`): The component id to the sorted list of XMS feature ids assigned to it.
+        """
+        order = np.argsort(self.comp_ids, kind='stable')
+        comp_ids, starts = np.unique(self.comp_ids[order], return_index=True)
+        groups = np.split(self.att_ids[order], starts[1:])
+        return {comp_id: group.tolist() for comp_id, group in zip(comp_ids.tolist(), groups) if len(group)}
+
+    def update(self, att_ids, comp_ids):
+        """
+        Sets the component ids of some features, adding the features not in the map yet.
+
+        Features already in the map are changed in place, so updating them does not rebuild the arrays.
+
+        Args:
+            att_ids (:obj:`numpy.ndarray`): The XMS feature ids. If an id is repeated, its last component id is used.
+            comp_ids (:obj:`numpy.ndarray`): The new component id of each feature.
+        """
+        att_ids, last = np.unique(np.asarray(att_ids, dtype=np.int64)[::-1], return_index=True)
+        comp_ids = np.asarray(comp_ids, dtype=np.int64)[::-1][last]
+        slots = np.searchsorted(self.att_ids, att_ids)
+        found = slots < len(self.att_ids)
+        found[found] = self.att_ids[slots[found]] == att_ids[found]
+        self.comp_ids[slots[found]] = comp_ids[found]
+        if not found.all():
+            added = FeatureIdMap(np.concatenate([self.att_ids, att_ids[~found]]),
+                                 np.concatenate([self.comp_ids, comp_ids[~found]]))
+            self.att_ids, self.comp_ids = added.att_ids, added.comp_ids
+
+    def get_comp_ids(self, att_ids, default=0):
+        """
+        Get the component ids of features.
+
+        Args:
+            att_ids (:obj:`list`): The XMS feature ids.
+            default (int): The component id of features without one (or with a negative one).
+
+        Returns:
+            (:obj:`numpy.ndarray`): The component id of each feature.
+        """
+        att_ids = np.asarray(att_ids, dtype=np.int64)
+        if len(self.att_ids) == 0:
+            return np.full(len(att_ids), default, dtype=np.int64)
+        slots = np.minimum(np.searchsorted(self.att_ids, att_ids), len(self.att_ids) - 1)
+        comp_ids = self.comp_ids[slots]
+        found = (self.att_ids[slots] == att_ids) & (comp_ids >= 0)
+        return np.where(found, comp_ids, default)
+
+    def get_comp_id(self, att_id, default=0):
+        """
+        Get the component id of a feature.
+
+        Args:
+            att_id (int): The XMS feature id.
+            default (int): The component id if the feature does not have one (or has a negative one).
+
+        Returns:
+            (int): The component id.
+        """
+        return int(self.get_comp_ids([att_id], default)[0])
+
+
+def move_features(comp_to_xms, comp_of_att, att_ids, comp_ids):
+    """
+    Moves features to new component ids in a component id to XMS feature ids dict, in one pass over the features.
+
+    Each feature is dropped from the list of its old component id and appended to the list of its new one. Only the
+    lists of the old component ids are touched, so the cost does not depend on the number of other features.
+
+    Args:
+        comp_to_xms (:obj:`dict`): The component id to the list of XMS feature ids assigned to it. Updated in place.
+        comp_of_att (:obj:`dict`): The XMS feature id to its component id, for the features in comp_to_xms. Updated in
+            place.
+        att_ids (:obj:`list` of int): The XMS feature ids.
+        comp_ids (:obj:`list` of int): The new component id of each feature.
+    """
+    removed = {}  # {old component id: XMS feature ids leaving it}
+    for att_id, comp_id in dict(zip(att_ids, comp_ids)).items():  # The last component id of a repeated feature
+        old_comp_id = comp_of_att.get(att_id)
+        if old_comp_id == comp_id:
+            continue
+        if old_comp_id is not None:
+            removed.setdefault(old_comp_id, set()).add(att_id)
+        comp_of_att[att_id] = comp_id
+        comp_to_xms.setdefault(comp_id, []).append(att_id)
+    for old_comp_id, moved in removed.items():
+        kept = [att_id for att_id in comp_to_xms[old_comp_id] if att_id not in moved]
+        if kept:
+            comp_to_xms[old_comp_id] = kept
+        else:
+            del comp_to_xms[old_comp_id]
@@ -0,0 +1,134 @@
+"""Copy a component folder to a save location, skipping files that are already up to date there."""
+# 1. Standard python modules
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import os
+import shutil
+
+# 2. Third party modules
+
+# 3. Aquaveo modules
+
+# 4. Local modules
+
+__copyright__ = "(C) Copyright Aquaveo 2020"
+__license__ = "All rights reserved"
+
+
+FINGERPRINT_BYTES = 64 * 1024  # Bytes read from each end of a file to fingerprint it.
+LARGE_FILE_BYTES = 8 * 1024 * 1024  # Files at least this big are copied in parallel.
+COPY_THREADS = 4
+
+
+def file_fingerprint(filename, size):
+    """
+    Get a fingerprint of the start and end of a file.
+
+    Args:
+        filename (str): The file.
+        size (int): The size of the file.
+
+    Returns:
+        (str): The fingerprint.
+    """
+    digest = hashlib.blake2b(str(size).encode(), digest_size=16)
+    with open(filename, 'rb') as file:
+        digest.update(file.read(FINGERPRINT_BYTES))
+        if size > 2 * FINGERPRINT_BYTES:
+            file.seek(size - FINGERPRINT_BYTES)
+        digest.update(file.read(FINGERPRINT_BYTES))
+    return digest.hexdigest()
+
+
+def _is_up_to_date(src_stat, src, dst):
+    """
+    Check if a file was already copied and has not changed since.
+
+    Args:
+        src_stat (:obj:`os.stat_result`): The status of the source file.
+        src (str): The source file.
+        dst (str): The destination file.
+
+    Returns:
+        (bool): True if the destination has the size, modification time and fingerprint of the source.
+    """
+    try:
+        dst_stat = os.stat(dst)
+    except OSError:
+        return False
+    if dst_stat.st_size != src_stat.st_size or dst_stat.st_mtime_ns != src_stat.st_mtime_ns:
+        return False
+    return file_fingerprint(src, src_stat.st_size) == file_fingerprint(dst, dst_stat.st_size)
+
+
+def _copy_file(src, dst):
+    """
+    Copy a file and its modification time, replacing the destination only once the copy is complete.
+
+    The data is copied by the kernel where it can, which lets file systems that support it share the blocks
+    copy-on-write. Files are never hard linked, because the component files in the temporary folder are changed in
+    place after a save.
+
+    Args:
+        src (str): The source file.
+        dst (str): The destination file.
+    """
+    partial = f'{dst}.partial'
+    try:
+        copied = False
+        if hasattr(os, 'copy_file_range'):
+            try:
+                with open(src, 'rb') as src_file, open(partial, 'wb') as dst_file:
+                    remaining = os.fstat(src_file.fileno()).st_size
+                    while remaining > 0:
+                        count = os.copy_file_range(src_file.fileno(), dst_file.fileno(), remaining)
+                        if count == 0:
+                            break
+                        remaining -= count
+                copied = remaining == 0
+            except OSError:
+                copied = False  # Not supported between these file systems.
+        if not copied:
+            shutil.copyfile(src, partial)
+        shutil.copystat(src, partial)
+        os.replace(partial, dst)
+    except BaseException:
+        if os.path.exists(partial):
+            os.remove(partial)
+        raise
+
+
+def copy_folder(src_dir, dst_dir):
+    """
+    Copy the files of a folder and its subfolders, skipping those already up to date at the destination.
+
+    Files at the destination that are not in the source are left alone.
+
+    Args:
+        src_dir (str): The folder to copy.
+        dst_dir (str): The destination folder. It is created if needed.
+
+    Returns:
+        (:obj:`list` of str): The destination files that were copied.
+    """
+    small_files = []
+    large_files = []
+    for root, _, files in os.walk(src_dir):
+        dst_root = os.path.join(dst_dir, os.path.relpath(root, src_dir))
+        os.makedirs(dst_root, exist_ok=True)
+        for file in files:
+            src = os.path.join(root, file)
+            dst = os.path.join(dst_root, file)
+            src_stat = os.stat(src)
+            if _is_up_to_date(src_stat, src, dst):
+                continue
+            (large_files if src_stat.st_size >= LARGE_FILE_BYTES else small_files).append((src, dst))
+
+    for src, dst in small_files:
+        _copy_file(src, dst)
+    if len(large_files) > 1:
+        with ThreadPoolExecutor(max_workers=min(COPY_THREADS, len(large_files))) as executor:
+            list(executor.map(lambda paths: _copy_file(*paths), large_files))
+    elif large_files:
+        _copy_file(*large_files[0])
+    return [dst for _, dst in small_files + large_files]
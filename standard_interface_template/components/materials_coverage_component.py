@@ -8,8 +8,7 @@ from PySide2.QtGui import QColor
 
 # 3. Aquaveo modules
 from xmsapi.dmi import ActionRequest, DialogModality
-from xmscomponents.display.display_options_io import (read_display_option_ids, read_display_options_from_json,
-                                                      write_display_option_ids, write_display_options_to_json)
+from xmscomponents.display.display_options_io import read_display_option_ids, write_display_option_ids
 from xmscomponents.display.xms_display_message import XmsDisplayMessage
 from xmsguipy.data.category_display_option import CategoryDisplayOption
 from xmsguipy.data.category_display_option_list import CategoryDisplayOptionList
@@ -17,6 +16,8 @@ from xmsguipy.data.polygon_texture import PolygonOptions, PolygonTexture
 from xmsguipy.data.target_type import TargetType
 
 # 4. Local modules
+from standard_interface_template.components.display_id_files import material_id_file, material_id_files_to_update
+from standard_interface_template.components.display_options_cache import read_display_options, write_display_options
 from standard_interface_template.components.standard_base_component import StandardBaseComponent
 from standard_interface_template.data.materials_coverage_data import MaterialsCoverageData
 from standard_interface_template.gui.assign_poly_material_dialog import AssignPolyMaterialDialog
@@ -59,10 +60,10 @@ class MaterialsCoverageComponent(StandardBaseComponent):
             default_file = os.path.join(os.path.dirname(os.path.dirname(__file__)),
                                         'gui', 'resources', 'default_data',
                                         'default_materials_coverage_display_options.json')
-            json_dict = read_display_options_from_json(default_file)
+            json_dict = read_display_options(default_file)
             json_dict['comp_uuid'] = os.path.basename(os.path.dirname(self.main_file))
             categories.from_dict(json_dict)
-            write_display_options_to_json(self.disp_opts_file, categories)
+            write_display_options(self.disp_opts_file, categories)
             # Save our display list UUID to the main file
             self.data.info.attrs['display_uuid'] = categories.uuid
             self.data.commit()
@@ -98,7 +99,6 @@ class MaterialsCoverageComponent(StandardBaseComponent):
         if save_type == 'DUPLICATE':
             json_dict = self.duplicate_display_opts(new_path, os.path.basename(self.disp_opts_file))
             data = MaterialsCoverageData(new_main_file)
-            data.load_all()
             data.info.attrs['cov_uuid'] = ''
             data.info.attrs['display_uuid'] = json_dict['uuid']
             data.commit()
@@ -119,7 +119,7 @@ class MaterialsCoverageComponent(StandardBaseComponent):
                   text.
                 - action_requests (:obj:`list` of :obj:`xmsapi.dmi.ActionRequest`): List of actions for XMS to perform.
         """
-        self.data.commit()
+        self.data.commit_later()
         id_dir = os.path.join(os.path.dirname(self.main_file), 'display_ids')
         os.mkdir(id_dir)
 
@@ -158,16 +158,15 @@ class MaterialsCoverageComponent(StandardBaseComponent):
             comp_ids = read_display_option_ids(initial_comp_file)
             os.remove(initial_att_file)
             os.remove(initial_comp_file)
-            for att_id, comp_id in zip(att_ids, comp_ids):
-                self.update_component_id(TargetType.polygon, att_id, comp_id)
+            self.update_component_ids(TargetType.polygon, att_ids, comp_ids)
             id_dir = os.path.join(os.path.dirname(self.main_file), 'display_ids')
             os.mkdir(id_dir)
             categories = self._get_category_list()
-            write_display_options_to_json(self.disp_opts_file, categories)
-            self.update_display_id_files([], list(self.data.coverage_data.material_id.values))
+            write_display_options(self.disp_opts_file, categories)
+            self.update_display_id_files([], self.data.column('material_id').tolist())
 
         self.data.info.attrs['cov_uuid'] = self.cov_uuid
-        self.data.commit()
+        self.data.commit_later()
         # Send the display message to XMS.
         self.display_option_list.append(
             XmsDisplayMessage(file=self.disp_opts_file, edit_uuid=self.cov_uuid)
@@ -216,24 +215,22 @@ class MaterialsCoverageComponent(StandardBaseComponent):
                         multi_label = 'Multiple polygons will be assigned the same material.'
                 except KeyError:
                     comp_id = -1  # No component ids assigned for any of the selected polygons
-        single_polygon = self.data.coverage_data.where(self.data.coverage_data.material_id == comp_id, drop=True)
-        material_names = list(self.data.coverage_data.name.values)
-        material_ids = list(self.data.coverage_data.material_id.values)
-        if single_polygon.user_option.size == 0:
+        material_names = self.data.column('name').tolist()
+        material_ids = self.data.column('material_id').tolist()
+        material_index = self.data.row_of(comp_id)
+        if material_index is None:
             # Here we are using component id 0 for default values.
-            single_polygon = self.data.coverage_data.where(self.data.coverage_data.material_id == 0, drop=True)
-        material_index = material_names.index(single_polygon.name[0])
+            material_index = self.data.row_of(0)
         dialog = AssignPolyMaterialDialog(win_cont, icon, 'Assign Material', multi_label,
                                           material_names, material_index)
         if dialog.exec_():
             new_material_index = dialog.get_selected_material()
             new_material_id = int(material_ids[new_material_index])
-            for polygon_id in polygon_ids:
-                self.update_component_id(TargetType.polygon, polygon_id, new_material_id)
+            self.update_component_ids(TargetType.polygon, polygon_ids, new_material_id)
             self.display_option_list.append(
                 XmsDisplayMessage(file=self.disp_opts_file, edit_uuid=self.cov_uuid)
             )
-            self.data.commit()
+            self.data.commit_later()
 
         # Delete the id dumped by xms files.
         shutil.rmtree(os.path.join(os.path.dirname(self.main_file), 'temp'), ignore_errors=True)
@@ -257,15 +254,15 @@ class MaterialsCoverageComponent(StandardBaseComponent):
                   text.
                 - action_requests (:obj:`list` of :obj:`xmsapi.dmi.ActionRequest`): List of actions for XMS to perform.
         """
-        ids = list(self.data.coverage_data.material_id.values)
+        ids = self.data.column('material_id').tolist()
         dlg = MaterialsDialog('Materials', win_cont, icon, self.data)
         if dlg.exec_():
-            new_ids = list(self.data.coverage_data.material_id.values)
+            new_ids = self.data.column('material_id').tolist()
             deleted_ids = [int(x) for x in self.update_display_id_files(ids, new_ids)]
             self.unassign_materials(query, deleted_ids)
             # write files
             category_list = self._get_category_list()
-            write_display_options_to_json(self.disp_opts_file, category_list)
+            write_display_options(self.disp_opts_file, category_list)
             self.display_option_list.append(
                 XmsDisplayMessage(
                     file=self.disp_opts_file, edit_uuid=self.cov_uuid,
@@ -284,12 +281,12 @@ class MaterialsCoverageComponent(StandardBaseComponent):
         category_list.target_type = TargetType.polygon
         category_list.comp_uuid = self.uuid
         category_list.uuid = str(self.data.info.attrs['display_uuid'])
-        texture_list = list(self.data.coverage_data.texture.values)
-        red_list = list(self.data.coverage_data.red.values)
-        green_list = list(self.data.coverage_data.green.values)
-        blue_list = list(self.data.coverage_data.blue.values)
-        name_list = list(self.data.coverage_data.name.values)
-        id_list = list(self.data.coverage_data.material_id.values)
+        texture_list = self.data.column('texture').tolist()
+        red_list = self.data.column('red').tolist()
+        green_list = self.data.column('green').tolist()
+        blue_list = self.data.column('blue').tolist()
+        name_list = self.data.column('name').tolist()
+        id_list = self.data.column('material_id').tolist()
         for texture, red, green, blue, name, material_id in zip(texture_list, red_list, green_list, blue_list,
                                                                 name_list, id_list):
             category = CategoryDisplayOption()
@@ -310,6 +307,9 @@ class MaterialsCoverageComponent(StandardBaseComponent):
         """
         Update the display files.
 
+        Only the files of added materials and of materials without a file are written, and the files of deleted
+        materials removed. A material's file only holds its id, so it does not change while the material exists.
+
         Args:
             old_ids (list): list of ids before editing materials.
             new_ids (list): list of current material ids.
@@ -317,20 +317,12 @@ class MaterialsCoverageComponent(StandardBaseComponent):
         Returns:
             (list) : deleted ids.
         """
-        deleted_ids = old_ids
         path = os.path.join(os.path.dirname(self.main_file), 'display_ids')
-        for mat_id in new_ids:
-            if mat_id >= 0:
-                id_file = f'material_{mat_id}.matid'
-                filename = os.path.join(path, id_file)
-                write_display_option_ids(filename, [mat_id])
-            if mat_id in deleted_ids:
-                deleted_ids.remove(mat_id)
-
+        write_ids, deleted_ids = material_id_files_to_update(path, old_ids, new_ids)
+        for mat_id in write_ids:
+            write_display_option_ids(material_id_file(path, mat_id), [mat_id])
         for mat_id in deleted_ids:
-            id_file = f'material_{mat_id}.matid'
-            filename = os.path.join(path, id_file)
-            os.remove(filename)
+            os.remove(material_id_file(path, mat_id))
         return deleted_ids
 
     def unassign_materials(self, query, delete_ids):
@@ -347,8 +339,5 @@ class MaterialsCoverageComponent(StandardBaseComponent):
         self.query_for_all_component_ids(query, TargetType.polygon)
         if self.cov_uuid in self.comp_to_xms and TargetType.polygon in self.comp_to_xms[self.cov_uuid]:
             poly_map = self.comp_to_xms[self.cov_uuid][TargetType.polygon]
-            for mat in delete_ids:
-                if mat in poly_map:
-                    for att_id in poly_map[mat]:
-                        self.update_component_id(TargetType.polygon, att_id,
-                                                 MaterialsCoverageData.unassigned_material_id)
+            att_ids = [att_id for mat in delete_ids for att_id in poly_map.get(mat, [])]
+            self.update_component_ids(TargetType.polygon, att_ids, MaterialsCoverageData.unassigned_material_id)
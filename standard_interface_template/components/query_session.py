@@ -0,0 +1,203 @@
+"""QuerySession class."""
+# 1. Standard python modules
+import time
+
+# 2. Third party modules
+
+# 3. Aquaveo modules
+
+# 4. Local modules
+
+__copyright__ = "(C) Copyright Aquaveo 2020"
+__license__ = "All rights reserved"
+
+
+class QuerySession:
+    """
+    Wraps a Query for the length of one operation, counting and timing its round trips to XMS.
+
+    Results of get() are memoized by the items selected since the context was last set to a named context, so asking
+    for the same thing twice only goes to XMS once. The context the query starts at is named 'start'. After setting
+    any other context, or adding to the build, results are not memoized until a named context is set again.
+
+    Other Query methods are passed through uncounted.
+
+    Attributes:
+        query (:obj:`xmsapi.dmi.Query`): The wrapped query.
+        stats (:obj:`dict`): The operation name to the [number of calls, seconds spent] of the round trips.
+        memoized (int): The number of gets answered without a round trip.
+    """
+
+    START_CONTEXT = 'start'
+
+    def __init__(self, query):
+        """
+        Constructor.
+
+        Args:
+            query (:obj:`xmsapi.dmi.Query`): Object for communicating with XMS.
+        """
+        self.query = query
+        self.stats = {}
+        self.memoized = 0
+        self._contexts = {}  # {id(context): (name, context)}
+        self._path = (self.START_CONTEXT,)  # Named context and items selected since, None if unknown
+        self._results = {}  # {(path, args): result}
+
+    def __getattr__(self, name):
+        """
+        Gets an attribute of the wrapped query.
+
+        Args:
+            name (str): The attribute.
+
+        Returns:
+            The attribute of the query.
+        """
+        return getattr(self.query, name)
+
+    @property
+    def round_trips(self):
+        """
+        Get the number of round trips made to XMS.
+
+        Returns:
+            (int): The number of round trips.
+        """
+        return sum(count for count, _ in self.stats.values())
+
+    def _call(self, operation, method, *args):
+        """
+        Calls a method of the query, counting and timing it.
+
+        Args:
+            operation (str): The name the round trip is counted under.
+            method: The bound method of the query.
+            *args: The arguments of the method.
+
+        Returns:
+            The result of the method.
+        """
+        start = time.perf_counter()
+        try:
+            return method(*args)
+        finally:
+            stat = self.stats.setdefault(operation, [0, 0.0])
+            stat[0] += 1
+            stat[1] += time.perf_counter() - start
+
+    def name_context(self, context, name):
+        """
+        Names a context, so results of gets made after setting it can be memoized.
+
+        The context must not be changed afterwards.
+
+        Args:
+            context (:obj:`xmsapi.dmi.Context`): The context.
+            name (str): The name.
+        """
+        self._contexts[id(context)] = (name, context)  # Keep the context so its id is not reused.
+
+    def get_context(self):
+        """
+        Gets the current context of the query.
+
+        Returns:
+            (:obj:`xmsapi.dmi.Context`): The context.
+        """
+        return self._call('get_context', self.query.get_context)
+
+    def set_context(self, context):
+        """
+        Sets the current context of the query.
+
+        Args:
+            context (:obj:`xmsapi.dmi.Context`): The context.
+        """
+        named = self._contexts.get(id(context))
+        self._path = (named[0],) if named and named[1] is context else None
+        self._call('set_context', self.query.set_context, context)
+
+    def select(self, item):
+        """
+        Selects an item from the current context.
+
+        Args:
+            item (str): The item.
+
+        Returns:
+            The result of the select.
+        """
+        result = self._call('select', self.query.select, item)
+        if self._path is not None:
+            self._path += (item,)
+        return result
+
+    def get(self, *args):
+        """
+        Gets values from the current context, reusing the result of an earlier identical get.
+
+        Args:
+            *args: The arguments of the get.
+
+        Returns:
+            (:obj:`dict`): The result of the get.
+        """
+        if self._path is None:
+            return self.get_uncached(*args)
+        key = (self._path, args)
+        if key in self._results:
+            self.memoized += 1
+            return self._results[key]
+        self._results[key] = self.get_uncached(*args)
+        return self._results[key]
+
+    def get_uncached(self, *args):
+        """
+        Gets values from the current context, without memoizing them. Use for results XMS creates each time, like files.
+
+        Args:
+            *args: The arguments of the get.
+
+        Returns:
+            (:obj:`dict`): The result of the get.
+        """
+        return self._call('get', self.query.get, *args)
+
+    def add(self, *args):
+        """
+        Adds items to the build.
+
+        Args:
+            *args: The arguments of the add.
+
+        Returns:
+            (:obj:`list`): The added vertices.
+        """
+        self._path = None
+        return self._call('add', self.query.add, *args)
+
+    def add_root_vertex_instance(self, *args):
+        """
+        Adds a root vertex to the build.
+
+        Args:
+            *args: The arguments of the add.
+
+        Returns:
+            The added vertex.
+        """
+        self._path = None
+        return self._call('add_root_vertex_instance', self.query.add_root_vertex_instance, *args)
+
+    def summary(self):
+        """
+        Get a description of the round trips made so far.
+
+        Returns:
+            (str): The description.
+        """
+        total = sum(seconds for _, seconds in self.stats.values())
+        operations = ', '.join(f'{operation}: {count} in {seconds:.3f}s'
+                               for operation, (count, seconds) in sorted(self.stats.items()))
+        return f'{self.round_trips} XMS round trips in {total:.3f}s ({operations}), {self.memoized} gets memoized.'
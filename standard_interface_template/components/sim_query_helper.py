@@ -14,6 +14,7 @@ from xmsguipy.tree import tree_util
 # 4. Local modules
 from standard_interface_template.components.boundary_coverage_component import BoundaryCoverageComponent
 from standard_interface_template.components.materials_coverage_component import MaterialsCoverageComponent
+from standard_interface_template.components.query_session import QuerySession
 
 __copyright__ = "(C) Copyright Aquaveo 2020"
 __license__ = "All rights reserved"
@@ -27,9 +28,10 @@ class SimQueryHelper:
         Constructor.
 
         Args:
-            query (:obj:`xmsapi.dmi.Query`): Object for communicating with XMS.
+            query (:obj:`xmsapi.dmi.Query`): Object for communicating with XMS. Its round trips are counted, and
+                repeated gets memoized, for the life of the helper.
         """
-        self._query = query
+        self._query = QuerySession(query) if query is not None else None
         self._start_context = None
         self._sim_uuid = None
         self.sim_comp_file = ''
@@ -41,6 +43,7 @@ class SimQueryHelper:
             from standard_interface_template.components.simulation_component import SimulationComponent
             self.sim_component = SimulationComponent(self.sim_comp_file)
             self._start_context = self._query.get_context()
+            self._query.name_context(self._start_context, QuerySession.START_CONTEXT)
             self._query.select('Parent')
             self.sim_uuid = self._query.get('uuid')['uuid'][0].get_as_string()
             self._query.set_context(self._start_context)
@@ -56,6 +59,7 @@ class SimQueryHelper:
         self.materials_coverage = None
         self.boundary_conditions_component = None
         self.material_component = None
+        self._loaded_feature_ids = set()  # {(component, target_type)}
 
     def get_simulation_data(self, warn_if_no_mesh):
         """
@@ -69,6 +73,12 @@ class SimQueryHelper:
         self.get_materials_coverage()
         self._get_coverage_comp_ids()
         self._query.set_context(self._start_context)
+        self.log_query_stats()
+
+    def log_query_stats(self):
+        """Logs the number and duration of the round trips made to XMS so far."""
+        if self._query is not None:
+            self._logger.info(self._query.summary())
 
     def get_solution_data(self):
         """
@@ -219,7 +229,7 @@ class SimQueryHelper:
         Returns the file dict for the feature type (point, arc, or polygon).
 
         Args:
-            query (:obj:`xmsapi.dmi.Query`): Object for communicating with XMS.
+            query (:obj:`QuerySession`): Object for communicating with XMS.
             component: The component.
             target_type (TargetType): The feature type (arc, polygon etc).
 
@@ -227,7 +237,7 @@ class SimQueryHelper:
             See description.
         """
         key = f'{component.uuid}#{component.cov_uuid}#{int(target_type)}'
-        id_res = query.get(key)[key]
+        id_res = query.get_uncached(key)[key]  # XMS writes new id files for every get.
         file_dict = {}
         if id_res and id_res[0][0].items():
             file_dict = {
@@ -238,14 +248,17 @@ class SimQueryHelper:
 
     def _get_all_feature_ids_comp_ids(self, component, target_type):
         """
-        Gets all the xms arc ids and component ids.
+        Gets all the xms arc ids and component ids, unless this helper already got them for the component.
 
         Args:
             component (:obj:`StandardBaseComponent`): E.g. BoundaryCoverageComponent, MaterialsCoverageComponent.
             target_type (TargetType): The feature type (arc, polygon etc).
         """
+        if (component, target_type) in self._loaded_feature_ids:
+            return
         self._logger.info('Getting feature ids and component ids for coverage.')
         self.load_component_feature_ids(self._query, component, target_type)
+        self._loaded_feature_ids.add((component, target_type))
 
     def _get_all_point_and_arc_ids_comp_ids(self, component):
         """
@@ -254,22 +267,27 @@ class SimQueryHelper:
         Args:
             component (derived from Component): The Component.
         """
-        self._logger.info('Getting arc ids and component ids for bc coverage.')
-        self.load_component_point_and_arc_ids(self._query, component)
+        self._get_all_feature_ids_comp_ids(component, TargetType.point)
+        self._get_all_feature_ids_comp_ids(component, TargetType.arc)
 
     @staticmethod
     def load_component_feature_ids(query, component, target_type):
         """
         Loads the component feature (arc, polygon etc.) ids.
 
+        The id files are read into the arrays of the component's feature id map, without building the component id to
+        XMS id dicts.
+
         Args:
-            query (:obj:`xmsapi.dmi.Query`): Object for communicating with XMS.
+            query (:obj:`QuerySession`): Object for communicating with XMS.
             component (:obj:`StandardBaseComponent`): E.g. BoundaryCoverageComponent, MaterialsCoverageComponent.
             target_type (TargetType): The feature type (arc, polygon etc).
         """
         file_dict = SimQueryHelper.get_feature_file_dict(query, component, target_type)
-        component.load_coverage_component_id_map(file_dict)
-        SimQueryHelper._remove_id_files(file_dict)
+        try:
+            component.load_feature_id_map(target_type, next(iter(file_dict.values()), None))
+        finally:
+            SimQueryHelper._remove_id_files(file_dict)
 
     @staticmethod
     def load_component_point_and_arc_ids(query, obs_comp):
@@ -277,14 +295,11 @@ class SimQueryHelper:
         Loads the component feature ids.
 
         Args:
-            query (:obj:`xmsapi.dmi.Query`): Object for communicating with XMS.
+            query (:obj:`QuerySession`): Object for communicating with XMS.
             obs_comp (ObstructionComponent): The ObstructionComponent.
         """
-        file_dict_points = SimQueryHelper.get_feature_file_dict(query, obs_comp, TargetType.point)
-        file_dict_arcs = SimQueryHelper.get_feature_file_dict(query, obs_comp, TargetType.arc)
-        file_dict = {**file_dict_points, **file_dict_arcs}
-        obs_comp.load_coverage_component_id_map(file_dict)
-        SimQueryHelper._remove_id_files(file_dict)
+        SimQueryHelper.load_component_feature_ids(query, obs_comp, TargetType.point)
+        SimQueryHelper.load_component_feature_ids(query, obs_comp, TargetType.arc)
 
     def _query_select_component_coverage_ids(self, coverage_xml_str, coverage_comp_xml_str):
         """
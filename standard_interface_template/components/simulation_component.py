@@ -63,7 +63,7 @@ class SimulationComponent(StandardBaseComponent):
             dlg_data = dialog.get_dialog_data_dict()
             self.data.info.attrs['user_text'] = dlg_data['user_edit']
             self.data.info.attrs['user_option'] = dlg_data['user_type']
-            self.data.commit()
+            self.data.commit_later()
         return [], []
 
     def create_snap_preview(self, query, params, win_cont, icon):
@@ -1,21 +1,23 @@
 """Base class for components class."""
 # 1. Standard python modules
-from distutils.dir_util import copy_tree
 import os
 import shutil
 import uuid
 
 # 2. Third party modules
+import numpy as np
 
 # 3. Aquaveo modules
 from xmsapi.dmi import ActionRequest, DialogModality, MenuItem
 from xmscomponents.bases.coverage_component_base import CoverageComponentBase
-from xmscomponents.display.display_options_io import read_display_options_from_json, write_display_options_to_json
+from xmscomponents.display.display_options_io import read_display_option_ids
 from xmscomponents.display.xms_display_message import DrawType, XmsDisplayMessage
 from xmsguipy.data.category_display_option_list import CategoryDisplayOptionList
 
 # 4. Local modules
-
+from standard_interface_template.components.display_options_cache import read_display_options, write_display_options
+from standard_interface_template.components.feature_id_map import FeatureIdMap, move_features
+from standard_interface_template.components.folder_copy import copy_folder
 
 __copyright__ = "(C) Copyright Aquaveo 2020"
 __license__ = "All rights reserved"
@@ -42,6 +44,8 @@ class StandardBaseComponent(CoverageComponentBase):
         self.uuid = os.path.basename(os.path.dirname(self.main_file))
         self.disp_opts_file = ''
         self.cov_uuid = ''
+        self._feature_id_maps = {}  # {target_type: FeatureIdMap}
+        self._comp_of_att = {}  # {(cov_uuid, target_type): {XMS feature id: component id}} of comp_to_xms
 
     def save_to_location(self, new_path, save_type):
         """
@@ -70,12 +74,17 @@ class StandardBaseComponent(CoverageComponentBase):
         messages = []
         action_requests = []
 
+        # Write any commit still pending, so the saved files are up to date.
+        if self.data is not None:
+            self.data.flush()
+
         # Check if we are already in the new location
         new_main_file = os.path.join(new_path, os.path.basename(self.main_file))
         if os.path.normcase(new_main_file) == os.path.normcase(self.main_file):
             return self.main_file, [], []
 
-        copy_tree(os.path.dirname(self.main_file), os.path.dirname(new_main_file))
+        # Files already saved and unchanged since are not copied again.
+        copy_folder(os.path.dirname(self.main_file), os.path.dirname(new_main_file))
 
         return new_main_file, messages, action_requests
 
@@ -285,6 +294,109 @@ class StandardBaseComponent(CoverageComponentBase):
             shutil.rmtree(temp_dir, ignore_errors=True)  # Delete the id files if no menus were added.
         return [], actions
 
+    def load_coverage_component_id_map(self, file_dict):
+        """
+        Loads the XMS feature id to component id files, replacing the lookup arrays built from the previous ids.
+
+        Args:
+            file_dict (:obj:`dict`): Key is stringified entity type and value is tuple of xms and component id files.
+        """
+        super().load_coverage_component_id_map(file_dict)
+        self._feature_id_maps.clear()
+        self._comp_of_att.clear()
+
+    def load_feature_id_map(self, target_type, id_files):
+        """
+        Loads the XMS feature id and component id files of one feature type straight into lookup arrays.
+
+        Unlike load_coverage_component_id_map, the ids are not added to comp_to_xms. Use get_feature_id_map to look
+        them up.
+
+        Args:
+            target_type (:obj:`xmsguipy.data.target_type.TargetType`): The feature type.
+            id_files (:obj:`tuple`): The XMS feature id file and component id file, or None if the coverage has no
+                features of the type.
+
+        Returns:
+            (:obj:`FeatureIdMap`): The component id of every feature of the type.
+        """
+        att_ids = np.empty(0, dtype=np.int64)
+        comp_ids = np.empty(0, dtype=np.int64)
+        if id_files and all(id_files):
+            att_ids = np.asarray(read_display_option_ids(id_files[0]), dtype=np.int64)
+            comp_ids = np.asarray(read_display_option_ids(id_files[1]), dtype=np.int64)
+        self._feature_id_maps[target_type] = FeatureIdMap(att_ids, comp_ids)
+        return self._feature_id_maps[target_type]
+
+    def update_component_id(self, target_type, att_id, comp_id):
+        """
+        Sets the component id of a feature.
+
+        Args:
+            target_type (:obj:`xmsguipy.data.target_type.TargetType`): The feature type.
+            att_id (int): The XMS feature id.
+            comp_id (int): The new component id.
+        """
+        self.update_component_ids(target_type, [att_id], comp_id)
+
+    def update_component_ids(self, target_type, att_ids, comp_ids):
+        """
+        Sets the component ids of many features at once.
+
+        The ids sent to XMS, comp_to_xms and the feature id lookup arrays are updated in one pass over the features,
+        so the cost grows with the number of features updated, not the number in the coverage. The display id files of
+        the assigned component ids are written afterwards, if they need to be.
+
+        Args:
+            target_type (:obj:`xmsguipy.data.target_type.TargetType`): The feature type.
+            att_ids (:obj:`list`): The XMS feature ids.
+            comp_ids (:obj:`list`): The new component id of each feature, or a single component id for all of them.
+        """
+        att_ids = np.asarray(att_ids, dtype=np.int64).ravel()
+        comp_ids = np.broadcast_to(np.asarray(comp_ids, dtype=np.int64), att_ids.shape)
+        att_id_list = att_ids.tolist()
+        comp_id_list = comp_ids.tolist()
+        self.update_ids.setdefault(self.cov_uuid, {}).setdefault(target_type, {}).update(zip(att_id_list, comp_id_list))
+
+        comp_to_xms = self.comp_to_xms.setdefault(self.cov_uuid, {}).setdefault(target_type, {})
+        comp_of_att = self._comp_of_att.get((self.cov_uuid, target_type))
+        if comp_of_att is None:  # Built once per loaded id map.
+            comp_of_att = {att_id: comp_id for comp_id, ids in comp_to_xms.items() for att_id in ids}
+            self._comp_of_att[(self.cov_uuid, target_type)] = comp_of_att
+        move_features(comp_to_xms, comp_of_att, att_id_list, comp_id_list)
+        if target_type in self._feature_id_maps:  # Keep the lookup arrays, which may hold more than comp_to_xms.
+            self._feature_id_maps[target_type].update(att_ids, comp_ids)
+        self.update_assigned_id_files(sorted(set(comp_id_list)))
+
+    def update_assigned_id_files(self, comp_ids):
+        """
+        Writes the display id files that change when features are assigned component ids.
+
+        Components whose display id files depend on the assigned component ids override this.
+
+        Args:
+            comp_ids (:obj:`list` of int): The component ids just assigned to features.
+        """
+        pass
+
+    def get_feature_id_map(self, target_type):
+        """
+        Gets sorted feature id and component id arrays of the features of a type, for looking up many at once.
+
+        Unless they were loaded by load_feature_id_map, the arrays are built from the loaded component id map the
+        first time they are requested.
+
+        Args:
+            target_type (:obj:`xmsguipy.data.target_type.TargetType`): The feature type.
+
+        Returns:
+            (:obj:`FeatureIdMap`): The component id of every feature of the type.
+        """
+        if target_type not in self._feature_id_maps:
+            comp_to_xms = self.comp_to_xms.get(self.cov_uuid, {}).get(target_type, {})
+            self._feature_id_maps[target_type] = FeatureIdMap.from_comp_to_xms(comp_to_xms)
+        return self._feature_id_maps[target_type]
+
     def query_for_all_component_ids(self, query, target_type, cleanup=True):
         """
         Query XMS for a dump of all the current component ids of the specified entity type.
@@ -331,11 +443,11 @@ class StandardBaseComponent(CoverageComponentBase):
             (json_dict): dict containing the display options.
         """
         fname = os.path.join(new_path, disp_opts_fname)
-        json_dict = read_display_options_from_json(fname)
+        json_dict = read_display_options(fname)
         if 'uuid' in json_dict:
             json_dict['uuid'] = str(uuid.uuid4())
             json_dict['comp_uuid'] = os.path.basename(new_path)
             categories = CategoryDisplayOptionList()  # Generates a random UUID key for the display list
             categories.from_dict(json_dict)
-            write_display_options_to_json(fname, categories)
+            write_display_options(fname, categories)
         return json_dict
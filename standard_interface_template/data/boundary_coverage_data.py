@@ -2,19 +2,20 @@
 # 1. Standard python modules
 
 # 2. Third party modules
+import numpy as np
 import pandas as pd
 
 # 3. Aquaveo modules
-from xmscomponents.bases.xarray_base import XarrayBase
 
 # 4. Local modules
+from standard_interface_template.data.coverage_data_base import CoverageDataBase
 
 
 __copyright__ = "(C) Copyright Aquaveo 2020"
 __license__ = "All rights reserved"
 
 
-class BoundaryCoverageData(XarrayBase):
+class BoundaryCoverageData(CoverageDataBase):
     """
     Manages data file for the hidden coverage component.
 
@@ -30,7 +31,6 @@ class BoundaryCoverageData(XarrayBase):
         Args:
             filename (str): The name of the main file that data is stored in.
         """
-        self._cov_data = None
         super().__init__(filename.strip('"\''))
         self.info.attrs['FILE_TYPE'] = 'STANDARD_COVERAGE'
         if 'cov_uuid' not in self.info.attrs:
@@ -41,7 +41,7 @@ class BoundaryCoverageData(XarrayBase):
             self.info.attrs['display_uuid'] = ''
         else:
             self.display_uuid = self.info.attrs['display_uuid']
-        self.load_all()
+        self.close()  # The coverage data is read when it is first used.
 
     def load_all(self):
         """Loads all datasets from the file."""
@@ -49,29 +49,51 @@ class BoundaryCoverageData(XarrayBase):
         _ = self.coverage_data
         self.close()
 
-    @property
-    def coverage_data(self):
+    def get_or_add_comp_id(self, user_option, user_text):
         """
-        Get the coverage dataset.
+        Gets the component id of a set of attributes, adding a row for them if no feature uses them yet.
+
+        Features assigned the same attributes share one component id, so the coverage data grows with the number of
+        distinct attribute sets instead of the number of assigned features. Component id 0 holds the defaults and is
+        never shared.
+
+        Args:
+            user_option (str): The option.
+            user_text (str): The text.
 
         Returns:
-            (:obj:`xarray.Dataset`): The cov_data list dataset.
+            (int): The component id.
         """
-        if self._cov_data is None:
-            self._cov_data = self.get_dataset('cov_data', False)
-            if self._cov_data is None:
-                self._cov_data = self._default_cov_data()
-        return self._cov_data
-
-    @coverage_data.setter
-    def coverage_data(self, value):
+        with self._write_behind_lock:
+            comp_ids = self.column('comp_id')
+            match = (comp_ids > 0) & self.matches('user_option', user_option) & self.matches('user_text', user_text)
+            if match.any():
+                return int(comp_ids[match][0])
+            new_comp_id = int(comp_ids.max() + 1) if comp_ids.size else 1
+            values = pd.DataFrame([[new_comp_id, user_option, user_text]],
+                                  columns=['comp_id', 'user_option', 'user_text'])
+            self.append_rows(values.to_xarray())
+            return new_comp_id
+
+    def compact(self, live_comp_ids):
         """
-        Sets the coverage data.
+        Removes the rows no feature uses anymore.
 
         Args:
-            value: The coverage data.
+            live_comp_ids (:obj:`iterable`): The component ids currently assigned to features. The default row
+                (component id 0) is always kept.
+
+        Returns:
+            (int): The number of rows removed.
         """
-        self._cov_data = value
+        with self._write_behind_lock:
+            cov_data = self.coverage_data
+            comp_ids = cov_data.comp_id.values.astype(np.int64)
+            keep = np.isin(comp_ids, np.asarray(list(live_comp_ids), dtype=np.int64)) | (comp_ids == 0)
+            df = cov_data.to_dataframe()[keep].sort_values('comp_id', kind='stable').reset_index(drop=True)
+            df.index.name = 'index'
+            self.coverage_data = df.to_xarray()
+            return len(comp_ids) - len(df)
 
     @staticmethod
     def _default_cov_data():
@@ -84,14 +106,10 @@ class BoundaryCoverageData(XarrayBase):
         default_data = {'comp_id': [0], 'user_option': 'A', 'user_text': 'Hello World!'}
         return pd.DataFrame(default_data).to_xarray()
 
-    def commit(self):
+    def _write_datasets(self):
         """Save in memory datasets to the NetCDF file."""
-        super().commit()
-
-        self._drop_h5_groups(['cov_data'])
-        # write
-        if self._cov_data is not None:
-            self._cov_data.to_netcdf(self._filename, group='cov_data', mode='a')
+        super()._write_datasets()
+        self._commit_coverage_data()
 
     def close(self):
         """Closes the H5 file and does not write any data that is in memory."""
@@ -0,0 +1,188 @@
+"""Tables stored in NetCDF groups along unlimited, chunked dimensions so new rows can be appended in place."""
+# 1. Standard python modules
+import hashlib
+
+# 2. Third party modules
+import h5py
+import numpy as np
+import pandas as pd
+
+# 3. Aquaveo modules
+
+# 4. Local modules
+
+__copyright__ = "(C) Copyright Aquaveo 2020"
+__license__ = "All rights reserved"
+
+
+TABLE_DIM = 'index'
+TABLE_CHUNK_ROWS = 1024
+STRING_TABLE_SUFFIX = '_strings'
+
+
+def write_table(filename, group, dataset):
+    """
+    Write a table to a group of a NetCDF file, along unlimited dimensions so rows can be appended later.
+
+    The group must not already exist in the file.
+
+    Args:
+        filename (str): The NetCDF file.
+        group (str): The group to write.
+        dataset (:obj:`xarray.Dataset`): The table. Every variable is one-dimensional.
+    """
+    encoding = {name: {'chunksizes': (TABLE_CHUNK_ROWS,)} for name in dataset.variables}
+    dataset.to_netcdf(filename, group=group, mode='a', unlimited_dims=list(dataset.dims), encoding=encoding)
+
+
+def encode_strings(dataset, names, tables=None):
+    """
+    Replace string columns with integer codes into tables of their distinct strings.
+
+    The table of column 'name' is stored as the variable 'name_strings', along its own dimension.
+
+    Args:
+        dataset (:obj:`xarray.Dataset`): The table with the string columns.
+        names (:obj:`list` of str): The string columns to encode.
+        tables (:obj:`dict`): Column name to the strings already in its table. New strings are added after them, so
+            stored codes stay valid. Missing tables start empty.
+
+    Returns:
+        (:obj:`tuple`): The encoded table, and the column name to the list of strings of each table.
+    """
+    tables = tables or {}
+    new_tables = {}
+    for name in names:
+        values = dataset[name].values
+        row_codes, uniques = pd.factorize(values)
+        code_of = {string: code for code, string in enumerate(tables.get(name, []))}
+        unique_codes = [code_of.setdefault(string, len(code_of)) for string in uniques.tolist()]
+        if (row_codes < 0).any():  # Missing values are stored as empty strings.
+            unique_codes.append(code_of.setdefault('', len(code_of)))
+        codes = np.asarray(unique_codes, dtype=np.int32)[row_codes]
+        table_name = f'{name}{STRING_TABLE_SUFFIX}'
+        new_tables[name] = list(code_of)
+        dataset = dataset.assign({
+            name: (dataset[name].dims, codes),
+            table_name: (table_name, np.asarray(new_tables[name], dtype=object)),
+        })
+    return dataset, new_tables
+
+
+def decode_strings(dataset, names):
+    """
+    Replace integer code columns written by encode_strings with their strings.
+
+    Columns that are not encoded, as in files written before encoding was used, are left as they are.
+
+    Args:
+        dataset (:obj:`xarray.Dataset`): The table read from the file.
+        names (:obj:`list` of str): The string columns to decode.
+
+    Returns:
+        (:obj:`tuple`): The decoded table, and the column name to the (codes, list of strings) of each decoded column.
+    """
+    codes = {}
+    for name in names:
+        table_name = f'{name}{STRING_TABLE_SUFFIX}'
+        if table_name not in dataset.variables or dataset[name].dtype.kind not in 'iu':
+            continue
+        table = dataset[table_name].values.tolist()
+        row_codes = dataset[name].values.astype(np.int32)
+        strings = np.asarray(table, dtype=object)[row_codes] if table else np.full(len(row_codes), '', dtype=object)
+        dataset = dataset.drop_vars(table_name).assign({name: (dataset[name].dims, strings)})
+        codes[name] = (row_codes, table)
+    return dataset, codes
+
+
+def table_fingerprint(dataset):
+    """
+    Get a fingerprint of the contents of a table.
+
+    The row index is left out, and numbers and strings are fingerprinted the same whatever their stored type, so a
+    table has the same fingerprint before and after a round trip through the file.
+
+    Args:
+        dataset (:obj:`xarray.Dataset`): The table.
+
+    Returns:
+        (str): The fingerprint.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for name in sorted(str(name) for name in dataset.variables):
+        if name == TABLE_DIM:
+            continue
+        values = dataset[name].values
+        if values.dtype.kind in 'OUS':
+            strings = [str(value) for value in values.tolist()]
+            digest.update(f'{name}:str:{len(values)}\n'.encode())
+            digest.update(np.array([len(string) for string in strings], dtype=np.int64).tobytes())
+            digest.update(''.join(strings).encode())
+        else:
+            digest.update(f'{name}:num:{len(values)}\n'.encode())
+            digest.update(np.asarray(values, dtype=np.float64).tobytes())
+    return digest.hexdigest()
+
+
+def _can_append(h5_dataset, values):
+    """
+    Check if rows of values can be appended to a stored column.
+
+    Args:
+        h5_dataset (:obj:`h5py.Dataset`): The stored column.
+        values (:obj:`numpy.ndarray`): The column in memory.
+
+    Returns:
+        (bool): True if the column is resizable and its type can hold the values.
+    """
+    if h5_dataset.ndim != 1 or values.ndim != 1 or h5_dataset.maxshape[0] is not None:
+        return False
+    if h5py.check_string_dtype(h5_dataset.dtype) is not None:
+        return h5_dataset.dtype.kind == 'O' and values.dtype.kind in 'OUS'
+    return values.dtype.kind in 'biuf' and np.can_cast(values.dtype, h5_dataset.dtype, 'same_kind')
+
+
+def append_table_rows(filename, group, dataset, stored_sizes):
+    """
+    Append the rows of a table that are not in the file yet.
+
+    Nothing is written unless the stored group has the same columns as the table, each resizable and as long as its
+    dimension's stored size. The caller must then rewrite the group with write_table.
+
+    Args:
+        filename (str): The NetCDF file.
+        group (str): The group holding the table.
+        dataset (:obj:`xarray.Dataset`): The table. The first rows of each column must match the rows in the file.
+        stored_sizes (:obj:`dict`): The length of each dimension in the file.
+
+    Returns:
+        (bool): True if the file now holds the table, False if the group must be rewritten.
+    """
+    sizes = dict(dataset.sizes)
+    if set(sizes) != set(stored_sizes) or any(sizes[dim] < size for dim, size in stored_sizes.items()):
+        return False
+    with h5py.File(filename, 'a') as h5_file:
+        h5_group = h5_file.get(group)
+        if h5_group is None:
+            return False
+        stored_names = {name for name, item in h5_group.items() if isinstance(item, h5py.Dataset)}
+        if stored_names != set(dataset.variables):
+            return False
+        columns = {name: dataset[name] for name in dataset.variables}
+        for name, column in columns.items():
+            h5_dataset = h5_group[name]
+            if column.ndim != 1 or h5_dataset.shape[0] != stored_sizes[column.dims[0]] or \
+                    not _can_append(h5_dataset, column.values):
+                return False
+        for name, column in columns.items():
+            stored_rows = stored_sizes[column.dims[0]]
+            num_rows = sizes[column.dims[0]]
+            if num_rows == stored_rows:
+                continue
+            new_values = column.values[stored_rows:]
+            if new_values.dtype.kind in 'US':
+                new_values = new_values.astype(object)
+            h5_dataset = h5_group[name]
+            h5_dataset.resize((num_rows,))
+            h5_dataset[stored_rows:] = new_values
+    return True
@@ -0,0 +1,313 @@
+"""Base class for the coverage component data classes."""
+# 1. Standard python modules
+import abc
+
+# 2. Third party modules
+import numpy as np
+import pandas as pd
+import xarray as xr
+
+# 3. Aquaveo modules
+
+# 4. Local modules
+from standard_interface_template.data.chunked_table import (
+    append_table_rows, decode_strings, encode_strings, TABLE_DIM, table_fingerprint, write_table
+)
+from standard_interface_template.data.write_behind import WriteBehindBase
+
+
+__copyright__ = "(C) Copyright Aquaveo 2020"
+__license__ = "All rights reserved"
+
+
+def _read_only(dataset):
+    """
+    Get a dataset whose columns cannot be changed in place.
+
+    Args:
+        dataset (:obj:`xarray.Dataset`): The dataset. Its own arrays are left writeable.
+
+    Returns:
+        (:obj:`xarray.Dataset`): A shallow copy of the dataset with read-only views of its columns.
+    """
+    dataset = dataset.copy(deep=False)
+    for name in dataset.data_vars:
+        variable = dataset.variables[name]
+        variable.data = variable.values.view()
+        variable.values.flags.writeable = False
+    return dataset
+
+
+class CoverageDataBase(WriteBehindBase, metaclass=abc.ABCMeta):
+    """
+    Coverage data with an id to row index and NumPy views of its columns.
+
+    The index and column views are built the first time they are needed and thrown away whenever the coverage data
+    is replaced through the coverage_data setter. Every change to the coverage data must go through the setter or
+    append_rows: the getter returns a copy with read-only columns, so changing it in place raises and replacing its
+    columns leaves the coverage data as it was.
+
+    The coverage data and the views of it are only changed while holding the write behind lock, so a commit running
+    in the background sees them consistently.
+
+    The coverage data is stored along an unlimited dimension. Rows added with append_rows are appended to the file
+    on commit, while coverage data replaced through the setter is rewritten. The string columns in encoded_columns
+    are stored as integer codes into a table of their distinct strings, and decoded when read.
+
+    Attributes:
+        id_column (str): Name of the column holding the id of each row.
+        encoded_columns (:obj:`tuple` of str): Names of the string columns with few distinct values.
+    """
+    id_column = 'comp_id'
+    encoded_columns = ('user_option', 'user_text')
+
+    def __init__(self, filename):
+        """
+        Initializes the data class.
+
+        Args:
+            filename (str): The name of the main file that data is stored in.
+        """
+        self._cov_data = None
+        self._columns = {}
+        self._row_of_id = None
+        self._codes = {}  # {column name: (codes, list of strings)}
+        self._string_tables = {}  # {column name: list of strings stored in the file}
+        self._stored_sizes = None  # {dimension: length in the file}, None if the file must be rewritten
+        self._cov_data_fingerprint = None
+        super().__init__(filename)
+
+    @property
+    def coverage_data(self):
+        """
+        Get the coverage dataset.
+
+        Returns:
+            (:obj:`xarray.Dataset`): A shallow copy of the cov_data list dataset, with read-only columns. Set the
+            coverage data to change it.
+        """
+        with self._write_behind_lock:
+            if self._cov_data is None:
+                stored = self.get_dataset('cov_data', False)
+                if stored is None:
+                    self._cov_data = _read_only(self._default_cov_data())
+                else:
+                    stored.load().close()  # Read it all now and release the file, so it can be written.
+                    cov_data, self._codes = decode_strings(stored, self.encoded_columns)
+                    self._cov_data = _read_only(cov_data)
+                    self._string_tables = {name: table for name, (_, table) in self._codes.items()}
+                    self._stored_sizes = dict(stored.sizes)
+            return self._cov_data.copy(deep=False)
+
+    @coverage_data.setter
+    def coverage_data(self, value):
+        """
+        Sets the coverage data.
+
+        Args:
+            value (:obj:`xarray.Dataset`): The coverage data. Its arrays are kept, so do not change them afterwards.
+        """
+        with self._write_behind_lock:
+            self._cov_data = _read_only(value)
+            self._columns = {}
+            self._row_of_id = None
+            self._codes = {}
+            self._stored_sizes = None
+            self._cov_data_fingerprint = None
+
+    @staticmethod
+    @abc.abstractmethod
+    def _default_cov_data():
+        """
+        Creates a default coverage data set.
+
+        Returns:
+            (:obj:`xarray.Dataset`): The coverage dataset.
+        """
+
+    def append_rows(self, rows):
+        """
+        Adds rows to the end of the coverage data.
+
+        Unlike setting the coverage data, the rows already in the file are kept and only the new rows are written on
+        commit.
+
+        Args:
+            rows (:obj:`xarray.Dataset`): The rows to add, with the same columns as the coverage data.
+        """
+        with self._write_behind_lock:
+            stored_sizes = self._stored_sizes
+            self.coverage_data = xr.concat([self.coverage_data, rows], TABLE_DIM)
+            self._stored_sizes = stored_sizes
+
+    def cov_data_fingerprint(self):
+        """
+        Get a fingerprint of the coverage data.
+
+        The fingerprint stored on the last commit is used while the coverage data has not been read, so the table is
+        not loaded just to fingerprint it.
+
+        Returns:
+            (str): The fingerprint.
+        """
+        with self._write_behind_lock:
+            if self._cov_data is None and self.info.attrs.get('cov_data_fingerprint'):
+                return str(self.info.attrs['cov_data_fingerprint'])
+            if self._cov_data_fingerprint is None:
+                self._cov_data_fingerprint = table_fingerprint(self.coverage_data)
+            return self._cov_data_fingerprint
+
+    def _update_fingerprint(self, digest):
+        """
+        Add the coverage data to a fingerprint.
+
+        Args:
+            digest (:obj:`hashlib.blake2b`): The fingerprint being computed.
+        """
+        digest.update(self.cov_data_fingerprint().encode())
+
+    def _write_datasets(self):
+        """Save in memory datasets to the NetCDF file, with the fingerprint of the coverage data."""
+        if self._cov_data is not None:
+            self.info.attrs['cov_data_fingerprint'] = self.cov_data_fingerprint()
+        super()._write_datasets()
+
+    def _commit_coverage_data(self):
+        """Writes the coverage data to the file, appending the new rows when the stored rows are unchanged."""
+        with self._write_behind_lock:
+            cov_data, stored_sizes, string_tables = self._cov_data, self._stored_sizes, self._string_tables
+        if cov_data is None:
+            return  # Never loaded, so the file is up to date.
+        encoded = None
+        if stored_sizes is not None:
+            # Keep the stored strings' codes so only new rows and new strings are appended.
+            encoded, tables = encode_strings(cov_data, self.encoded_columns, string_tables)
+            if not append_table_rows(self._filename, 'cov_data', encoded, stored_sizes):
+                encoded = None
+        if encoded is None:
+            encoded, tables = encode_strings(cov_data, self.encoded_columns)
+            self._drop_h5_groups(['cov_data'])
+            write_table(self._filename, 'cov_data', encoded)
+        with self._write_behind_lock:
+            if self._cov_data is cov_data:  # Otherwise the next commit finds the sizes stale and rewrites the table.
+                self._string_tables = tables
+                self._stored_sizes = dict(encoded.sizes)
+
+    def column(self, name):
+        """
+        Get the values of a column.
+
+        Args:
+            name (str): The column name.
+
+        Returns:
+            (:obj:`numpy.ndarray`): The column values, in row order. Do not modify.
+        """
+        with self._write_behind_lock:
+            values = self._columns.get(name)
+            if values is None:
+                values = self.coverage_data[name].values
+                self._columns[name] = values
+            return values
+
+    def row_of(self, item_id):
+        """
+        Get the row of an id.
+
+        Args:
+            item_id (int): The id.
+
+        Returns:
+            (int): The index of the first row with the id, or None if no row has it.
+        """
+        with self._write_behind_lock:
+            if self._row_of_id is None:
+                row_of_id = {}
+                for row, value in enumerate(self.column(self.id_column).tolist()):
+                    row_of_id.setdefault(int(value), row)
+                self._row_of_id = row_of_id
+            return self._row_of_id.get(int(item_id))
+
+    def value(self, item_id, name, default=None):
+        """
+        Get the value of a column for an id.
+
+        Args:
+            item_id (int): The id.
+            name (str): The column name.
+            default: The value returned if no row has the id.
+
+        Returns:
+            The value from the first row with the id, or default.
+        """
+        row = self.row_of(item_id)
+        if row is None:
+            return default
+        return self.column(name)[row:row + 1].tolist()[0]  # A Python value, for numeric and string columns
+
+    def codes(self, name):
+        """
+        Get a string column as integer codes into a list of its distinct strings.
+
+        Args:
+            name (str): The column name.
+
+        Returns:
+            (:obj:`tuple`): The code of each row and the list of strings. Do not modify.
+        """
+        with self._write_behind_lock:
+            codes = self._codes.get(name)
+            if codes is None:
+                row_codes, uniques = pd.factorize(self.column(name))
+                codes = (row_codes, uniques.tolist())
+                self._codes[name] = codes
+            return codes
+
+    def matches(self, name, value):
+        """
+        Get the rows where a column has a value.
+
+        The encoded string columns are compared by their integer codes.
+
+        Args:
+            name (str): The column name.
+            value: The value to match.
+
+        Returns:
+            (:obj:`numpy.ndarray`): True for each row with the value.
+        """
+        if name not in self.encoded_columns:
+            return self.column(name) == value
+        row_codes, strings = self.codes(name)
+        if value not in strings:
+            return np.zeros(len(row_codes), dtype=bool)
+        return row_codes == strings.index(value)
+
+    def ids_by_value(self, name):
+        """
+        Group the ids of the rows by the value of a column, in one pass.
+
+        Args:
+            name (str): The column name.
+
+        Returns:
+            (:obj:`dict`): Each value of the column to the ids of its rows, in row order.
+        """
+        row_codes, values = self.codes(name)
+        order = np.argsort(row_codes, kind='stable')
+        bounds = np.searchsorted(row_codes[order], np.arange(len(values) + 1))
+        ids = self.column(self.id_column)[order]
+        return {value: ids[bounds[code]:bounds[code + 1]] for code, value in enumerate(values)}
+
+    def ids_where(self, name, value):
+        """
+        Get the ids of the rows where a column has a value.
+
+        Args:
+            name (str): The column name.
+            value: The value to match.
+
+        Returns:
+            (:obj:`numpy.ndarray`): The ids of the matching rows, in row order.
+        """
+        return self.column(self.id_column)[self.matches(name, value)]
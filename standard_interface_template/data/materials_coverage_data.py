@@ -2,19 +2,21 @@
 # 1. Standard python modules
 
 # 2. Third party modules
+import numpy as np
 import pandas as pd
+import xarray as xr
 
 # 3. Aquaveo modules
-from xmscomponents.bases.xarray_base import XarrayBase
 
 # 4. Local modules
+from standard_interface_template.data.coverage_data_base import CoverageDataBase
 
 
 __copyright__ = "(C) Copyright Aquaveo 2020"
 __license__ = "All rights reserved"
 
 
-class MaterialsCoverageData(XarrayBase):
+class MaterialsCoverageData(CoverageDataBase):
     """
     Manages data file for the hidden coverage component.
 
@@ -30,6 +32,7 @@ class MaterialsCoverageData(XarrayBase):
         column_green (int): The column index of the green column in the dataframe.
         column_blue (int): The column index of the blue column in the dataframe.
     """
+    id_column = 'material_id'
     unassigned_material_id = -1
     display_list = ['A', 'B', 'C']
     column_id = 0
@@ -48,7 +51,8 @@ class MaterialsCoverageData(XarrayBase):
         Args:
             filename (str): The name of the main file that data is stored in.
         """
-        self._cov_data = None
+        self._cell_materials = None
+        self._cell_materials_changed = False
         super().__init__(filename.strip('"\''))
         self.info.attrs['FILE_TYPE'] = 'STANDARD_COVERAGE'
         if 'cov_uuid' not in self.info.attrs:
@@ -59,37 +63,64 @@ class MaterialsCoverageData(XarrayBase):
             self.info.attrs['display_uuid'] = ''
         else:
             self.display_uuid = self.info.attrs['display_uuid']
-        self.load_all()
+        self.close()  # The coverage data is read when it is first used.
 
     def load_all(self):
         """Loads all datasets from the file."""
         _ = self.info
         _ = self.coverage_data
+        _ = self.cell_materials
         self.close()
 
     @property
-    def coverage_data(self):
+    def cell_materials(self):
         """
-        Get the coverage dataset.
+        Get the material of each grid cell, as mapped when the coverage was created.
 
         Returns:
-            (:obj:`xarray.Dataset`): The cov_data list dataset.
+            (:obj:`xarray.Dataset`): The cell_materials dataset, or None if the cell materials are not known.
         """
-        if self._cov_data is None:
-            self._cov_data = self.get_dataset('cov_data', False)
-            if self._cov_data is None:
-                self._cov_data = self._default_cov_data()
-        return self._cov_data
-
-    @coverage_data.setter
-    def coverage_data(self, value):
+        with self._write_behind_lock:
+            if self._cell_materials is None:
+                self._cell_materials = self.get_dataset('cell_materials', False)
+                if self._cell_materials is not None:
+                    self._cell_materials.load().close()
+            return self._cell_materials
+
+    def set_cell_materials(self, cell_materials, grid_fingerprint, polygons_fingerprint):
         """
-        Sets the coverage data.
+        Sets the material of each grid cell.
 
         Args:
-            value (:obj:): The coverage data.
+            cell_materials (:obj:`list`): The material id of each cell of the grid.
+            grid_fingerprint (str): Fingerprint of the grid the cells belong to.
+            polygons_fingerprint (str): Fingerprint of the coverage polygons and their materials the cell materials
+                were derived from.
         """
-        self._cov_data = value
+        attrs = {'grid_fingerprint': grid_fingerprint, 'polygons_fingerprint': polygons_fingerprint}
+        cell_materials = np.asarray(cell_materials, dtype=np.int32)
+        with self._write_behind_lock:
+            self._cell_materials = xr.Dataset({'material_id': ('cell', cell_materials)}, attrs=attrs)
+            self._cell_materials_changed = True
+
+    def get_cell_materials(self, grid_fingerprint, polygons_fingerprint):
+        """
+        Gets the material of each grid cell if they are still valid for a grid and the coverage polygons.
+
+        Args:
+            grid_fingerprint (str): Fingerprint of the grid being mapped to.
+            polygons_fingerprint (str): Fingerprint of the current coverage polygons and their materials.
+
+        Returns:
+            (:obj:`numpy.ndarray`): The material id of each cell, or None if they are not known or out of date.
+        """
+        dataset = self.cell_materials
+        if dataset is None:
+            return None
+        if dataset.attrs.get('grid_fingerprint') != grid_fingerprint or \
+                dataset.attrs.get('polygons_fingerprint') != polygons_fingerprint:
+            return None
+        return np.asarray(dataset['material_id'].values, dtype=np.int32)
 
     @staticmethod
     def _default_cov_data():
@@ -103,17 +134,19 @@ class MaterialsCoverageData(XarrayBase):
                         'texture': [1], 'red': [0], 'green': [0], 'blue': [0]}
         return pd.DataFrame(default_data).to_xarray()
 
-    def commit(self):
+    def _write_datasets(self):
         """Save in memory datasets to the NetCDF file."""
-        super().commit()
-
-        self._drop_h5_groups(['cov_data'])
-        # write
-        if self._cov_data is not None:
-            self._cov_data.to_netcdf(self._filename, group='cov_data', mode='a')
+        super()._write_datasets()
+        self._commit_coverage_data()
+        if self._cell_materials_changed:
+            self._drop_h5_groups(['cell_materials'])
+            self._cell_materials.to_netcdf(self._filename, group='cell_materials', mode='a')
+            self._cell_materials_changed = False
 
     def close(self):
         """Closes the H5 file and does not write any data that is in memory."""
         super().close()
         if self._cov_data is not None:
             self._cov_data.close()
+        if self._cell_materials is not None:
+            self._cell_materials.close()
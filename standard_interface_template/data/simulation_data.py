@@ -4,16 +4,16 @@
 # 2. Third party modules
 
 # 3. Aquaveo modules
-from xmscomponents.bases.xarray_base import XarrayBase
 
 # 4. Local modules
+from standard_interface_template.data.write_behind import WriteBehindBase
 
 
 __copyright__ = "(C) Copyright Aquaveo 2020"
 __license__ = "All rights reserved"
 
 
-class SimulationData(XarrayBase):
+class SimulationData(WriteBehindBase):
     """Manages data file for the hidden simulation component."""
 
     def __init__(self, filename):
@@ -0,0 +1,154 @@
+"""Base class for data classes whose commits can be written behind, from a background thread."""
+# 1. Standard python modules
+import atexit
+import hashlib
+import os
+import threading
+
+# 2. Third party modules
+
+# 3. Aquaveo modules
+from xmscomponents.bases.xarray_base import XarrayBase
+
+# 4. Local modules
+
+
+__copyright__ = "(C) Copyright Aquaveo 2020"
+__license__ = "All rights reserved"
+
+
+WRITE_BEHIND_DELAY = 0.5  # Seconds without another commit_later before the data is written.
+REVISION_ATTR = 'revision'
+CONTENT_FINGERPRINT_ATTRS = (REVISION_ATTR, 'cov_data_fingerprint')  # Attributes describing, not making, the content
+
+_pending_lock = threading.Lock()
+_pending = {}  # {normalized filename: WriteBehindBase}
+
+
+def _file_key(filename):
+    """
+    Get the key of a file in the pending commits.
+
+    Args:
+        filename (str): The file name.
+
+    Returns:
+        (str): The normalized absolute path of the file.
+    """
+    return os.path.normcase(os.path.abspath(filename))
+
+
+def flush_pending(filename=None):
+    """
+    Write the pending commits of a file, or of every file.
+
+    Called before a data class reads its file, and when the interpreter exits.
+
+    Args:
+        filename (str): The file to write the pending commit of. All pending commits are written if None.
+    """
+    with _pending_lock:
+        if filename is None:
+            pending = list(_pending.values())
+        else:
+            pending = [data for data in [_pending.get(_file_key(filename))] if data is not None]
+    for data in pending:
+        data.flush()
+
+
+atexit.register(flush_pending)
+
+
+class WriteBehindBase(XarrayBase):
+    """
+    Data class that can defer its commits to a background thread.
+
+    commit_later() returns immediately. The data is committed once no other commit_later has been requested for
+    WRITE_BEHIND_DELAY seconds, so several commits in quick succession are written once. flush() writes a pending
+    commit before returning.
+
+    Every commit increments the revision stored in the info attributes. Together with fingerprint() it lets cached
+    results be checked against the data they were computed from.
+    """
+
+    def __init__(self, filename):
+        """
+        Initializes the data class.
+
+        Args:
+            filename (str): The name of the main file that data is stored in.
+        """
+        flush_pending(filename)  # Read what another instance has not written yet.
+        self._write_behind_lock = threading.RLock()
+        self._write_behind_timer = None
+        super().__init__(filename)
+
+    def commit(self):
+        """Save in memory datasets to the NetCDF file now, replacing any pending commit."""
+        with self._write_behind_lock:
+            self._cancel_pending()
+            self.info.attrs[REVISION_ATTR] = self.revision + 1
+            self._write_datasets()
+
+    @property
+    def revision(self):
+        """
+        Get the number of times the data has been committed.
+
+        Returns:
+            (int): The revision.
+        """
+        return int(self.info.attrs.get(REVISION_ATTR, 0))
+
+    def fingerprint(self):
+        """
+        Get a fingerprint of the data's content, including changes not committed yet.
+
+        Returns:
+            (str): The fingerprint.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        for key in sorted(self.info.attrs):
+            if key not in CONTENT_FINGERPRINT_ATTRS:
+                digest.update(f'{key}={self.info.attrs[key]}\n'.encode())
+        self._update_fingerprint(digest)
+        return digest.hexdigest()
+
+    def _update_fingerprint(self, digest):
+        """
+        Add the datasets to a fingerprint. Derived classes with more datasets override this.
+
+        Args:
+            digest (:obj:`hashlib.blake2b`): The fingerprint being computed.
+        """
+        pass
+
+    def _write_datasets(self):
+        """Save in memory datasets to the NetCDF file. Derived classes writing more datasets override this."""
+        super().commit()
+
+    def commit_later(self):
+        """Commit the data from a background thread, coalesced with any other commit requested soon after."""
+        with self._write_behind_lock:
+            self._cancel_pending()
+            self._write_behind_timer = threading.Timer(WRITE_BEHIND_DELAY, self.flush)
+            self._write_behind_timer.daemon = True  # Flushed by the exit handler instead of being waited for.
+            with _pending_lock:
+                _pending[_file_key(self._filename)] = self
+            self._write_behind_timer.start()
+
+    def _cancel_pending(self):
+        """Cancel the pending commit, if any."""
+        if self._write_behind_timer is None:
+            return
+        self._write_behind_timer.cancel()
+        self._write_behind_timer = None
+        with _pending_lock:
+            if _pending.get(_file_key(self._filename)) is self:
+                del _pending[_file_key(self._filename)]
+
+    def flush(self):
+        """Commit the data now if a commit is pending."""
+        with self._write_behind_lock:
+            if self._write_behind_timer is not None:
+                self.commit()
@@ -21,6 +21,7 @@ class BoundaryConditionsReader:
         self.data = {'comp_id': [], 'user_option': [], 'user_text': []}
         self.arcs = {}
         self.nodes = []
+        self.points = {}  # {point id: {'user_option': str, 'user_text': str, 'node': int}}
 
     def read(self, filename):
         """
@@ -31,6 +32,7 @@ class BoundaryConditionsReader:
         """
         with open(filename) as file:
             arc_id = 0
+            point_id = 0
             for line in file:
                 if line.startswith('#'):
                     continue
@@ -47,3 +49,8 @@ class BoundaryConditionsReader:
                     grid_points = [int(point) - 1 for point in line_parts[1:]]
                     self.arcs[arc_id] = grid_points
                     self.nodes.extend(grid_points)
+                elif card == 'POINT_BC':
+                    point_id = int(line_parts[1])
+                    self.points[point_id] = {'user_option': line_parts[2], 'user_text': line_parts[3], 'node': -1}
+                elif card == 'Node:':
+                    self.points[point_id]['node'] = int(line_parts[1]) - 1
@@ -13,36 +13,48 @@ __license__ = "All rights reserved"
 
 class BoundaryConditionsWriter:
     """A class for writing out boundary condition data for the Standard Interface Template."""
-    def __init__(self, file_name, arc_to_ids, arc_points, bc_component):
+    def __init__(self, file_name, mapping_result, bc_component):
         """
         Constructor.
 
         Args:
             file_name (str): The name of the file to write.
-            arc_to_ids (dict): The arc to component id of the boundary conditions component.
-            arc_points (dict): The arc to node ids of the grid.
+            mapping_result (:obj:`MappingResult`): The component id and node ids of the grid of each mapped arc and
+                point.
             bc_component (BoundaryCoverageComponent): The boundary conditions data to export.
         """
         self._file_name = file_name
         self._data = bc_component
-        self._arc_to_component_id = arc_to_ids
-        self._arc_to_node_ids = arc_points
+        self._mapping_result = mapping_result
 
     def write(self):
         """Write the simulation file."""
         with open(self._file_name, 'w') as file:
             file.write('###This is a boundary conditions file for Standard Interface Template.###\n')
-            df = self._data.data.coverage_data.to_dataframe()
-            for arc, component_id in self._arc_to_component_id.items():
-                df_row = df.loc[df['comp_id'] == component_id]
-                if df_row.empty:
-                    # Write default values.
-                    file.write(f'BC {arc} A "Hello World!"\n')
-                else:
-                    # Write values.
-                    file.write(f'BC {arc} {df_row.user_option[0]} "{df_row.user_text[0]}"\n')
+            data = self._data.data
+            for arc, component_id, nodes in self._mapping_result.arcs():
+                file.write(f'BC {arc} {self._values(data, component_id)}\n')
                 file.write('Points:')
-                if arc in self._arc_to_node_ids:
-                    for node in self._arc_to_node_ids[arc]:
-                        file.write(f' {node + 1}')
+                file.write(''.join(f' {node}' for node in (nodes + 1).tolist()))
                 file.write('\n')
+            for point, component_id, node in self._mapping_result.points():
+                file.write(f'POINT_BC {point} {self._values(data, component_id)}\n')
+                file.write(f'Node: {node + 1}\n')
+
+    @staticmethod
+    def _values(data, component_id):
+        """
+        Get the option and text written for a boundary condition.
+
+        Args:
+            data (:obj:`BoundaryCoverageData`): The boundary conditions coverage data.
+            component_id (int): The component id of the arc or point.
+
+        Returns:
+            (str): The option and quoted text.
+        """
+        if data.row_of(component_id) is None:
+            # Write default values.
+            return 'A "Hello World!"'
+        # Write values.
+        return f'{data.value(component_id, "user_option")} "{data.value(component_id, "user_text")}"'
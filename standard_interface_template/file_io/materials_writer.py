@@ -13,31 +13,31 @@ __license__ = "All rights reserved"
 
 class MaterialsWriter:
     """A class for writing out material data for the Standard Interface Template."""
-    def __init__(self, file_name, mat_grid_cells, mat_component):
+    def __init__(self, file_name, mapping_result, mat_component):
         """
         Constructor.
 
         Args:
             file_name (str): The name of the file to write.
-            mat_grid_cells (:obj:`dict`): The material to cell ids of the grid that use that material.
+            mapping_result (:obj:`MappingResult`): The mapped cell ids of the grid that use each material.
             mat_component (:obj:`MaterialsCoverageComponent`): The material data to export.
         """
         self._file_name = file_name
         self._data = mat_component
-        self._material_to_cells = mat_grid_cells
+        self._mapping_result = mapping_result
 
     def write(self):
         """Write the materials file."""
         with open(self._file_name, 'w') as file:
             file.write('###This is a materials file for Standard Interface Template.###\n')
-            mat_ids = list(self._data.data.coverage_data.material_id.values)
-            names = list(self._data.data.coverage_data.name.values)
-            options = list(self._data.data.coverage_data.user_option.values)
-            texts = list(self._data.data.coverage_data.user_text.values)
+            mat_ids = self._data.data.column('material_id').tolist()
+            names = self._data.data.column('name').tolist()
+            options = self._data.data.column('user_option').tolist()
+            texts = self._data.data.column('user_text').tolist()
             for mat_id, name, option, text in zip(mat_ids, names, options, texts):
                 file.write(f'Material: "{name}" {option} "{text}"\n')
-                if mat_id in self._material_to_cells:
+                if self._mapping_result.has_material(mat_id):
+                    cells = self._mapping_result.cells_of_material(mat_id) + 1
                     file.write('Cells:')
-                    for cell_id in self._material_to_cells[mat_id]:
-                        file.write(f' {cell_id + 1}')
+                    file.write(''.join(f' {cell_id}' for cell_id in cells.tolist()))
                     file.write('\n')
@@ -5,6 +5,7 @@
 
 # 3. Aquaveo modules
 from xmsapi.dmi import Query
+from xmsguipy.data.target_type import TargetType
 
 # 4. Local modules
 from standard_interface_template.check.simulation_check import SimulationCheck
@@ -63,6 +64,7 @@ class CheckThread:
         self._sim_query_helper.get_geometry(False)
         self._sim_query_helper.get_boundary_conditions_coverage()
         self._sim_query_helper.get_materials_coverage()
+        self._sim_query_helper.log_query_stats()
 
     def _get_data(self):
         """Set member variables from data in SimQueryHelper."""
@@ -73,8 +75,7 @@ class CheckThread:
         bc = self._sim_query_helper.boundary_conditions_component
         if bc:
             self.bc_data = bc.data
-            if bc.cov_uuid in bc.comp_to_xms:
-                self.bc_comp_ids_to_arc_ids = bc.comp_to_xms[bc.cov_uuid]
+            self.bc_comp_ids_to_arc_ids = bc.get_feature_id_map(TargetType.arc).to_comp_to_xms()
         mat = self._sim_query_helper.material_component
         if mat:
             self.mat_data = mat.data
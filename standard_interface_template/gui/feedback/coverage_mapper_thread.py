@@ -52,6 +52,7 @@ class CoverageMapperThread(QThread):
             worker.do_map()
 
             query_helper.add_mapped_components_to_xms()
+            query_helper.log_query_stats()
 
         except:  # noqa
             self._logger.exception('Error generating snap:')
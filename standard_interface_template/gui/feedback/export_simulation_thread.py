@@ -108,21 +108,18 @@ class ExportSimulationThread(QThread):
         base_name = f'{self.simulation_name}.example_materials'
         file_name = os.path.join(self.out_dir, base_name)
         self.files_exported.append(f'Materials "{base_name}"')
-        writer = MaterialsWriter(file_name=file_name,
-                                 mat_grid_cells=self.coverage_mapper.material_comp_id_to_grid_cell_ids,
+        writer = MaterialsWriter(file_name=file_name, mapping_result=self.coverage_mapper.mapping_result,
                                  mat_component=self.sim_query_helper.material_component)
         writer.write()
         self._logger.info('Success writing Standard Interface Template material file.')
 
     def export_boundary_conditions(self):
         """Exports the Standard Interface Template boundary conditions file."""
-        arc_to_grid = self.coverage_mapper.bc_arc_id_to_grid_ids
-        arc_to_comp_id = self.coverage_mapper.bc_arc_id_to_comp_id
         self._logger.info('Writing Standard Interface Template boundary conditions file.')
         base_name = f'{self.simulation_name}.example_boundary'
         file_name = os.path.join(self.out_dir, base_name)
         self.files_exported.append(f'Boundary_Conditions "{base_name}"')
-        writer = BoundaryConditionsWriter(file_name=file_name, arc_to_ids=arc_to_comp_id, arc_points=arc_to_grid,
+        writer = BoundaryConditionsWriter(file_name=file_name, mapping_result=self.coverage_mapper.mapping_result,
                                           bc_component=self.coverage_mapper.bc_component)
         writer.write()
         self._logger.info('Success writing Standard Interface Template boundary conditions file.')
@@ -20,6 +20,7 @@ from standard_interface_template.components.boundary_coverage_component import (
                                                                                 BC_COVERAGE_INITIAL_COMP_ID_FILE,
                                                                                 BoundaryCoverageComponent)
 from standard_interface_template.components.coverage_arc_builder import CoverageArcBuilder
+from standard_interface_template.components.feature_id_map import FeatureIdMap
 from standard_interface_template.components.materials_coverage_component import (MAT_COVERAGE_INITIAL_ATT_ID_FILE,
                                                                                  MAT_COVERAGE_INITIAL_COMP_ID_FILE,
                                                                                  MaterialsCoverageComponent)
@@ -28,6 +29,8 @@ from standard_interface_template.file_io.boundary_conditions_reader import Bound
 from standard_interface_template.file_io.geometry_reader import GeometryReader
 from standard_interface_template.file_io.materials_reader import MaterialsReader
 from standard_interface_template.file_io.simulation_reader import SimulationReader
+from standard_interface_template.mapping.grid_arrays import GridArrays
+from standard_interface_template.mapping.snap_cache import polygon_fingerprint, polygon_materials, polygons_fingerprint
 
 
 __copyright__ = "(C) Copyright Aquaveo 2020"
@@ -185,6 +188,10 @@ class ImportSimulationThread(QThread):
         """
         self._boundary_conditions_reader = BoundaryConditionsReader()
         self._boundary_conditions_reader.read(filename)
+        num_points = len(self._boundary_conditions_reader.points)
+        if num_points:
+            self._logger.warning(f'{num_points} point boundary conditions were not imported. Only arc boundary '
+                                 f'conditions are imported.')
 
         self._build_bc_coverage()
 
@@ -200,7 +207,7 @@ class ImportSimulationThread(QThread):
         bc_component.data.commit()
 
         # Write component id and BC arc att ids to a file so we can initialize them in get_initial_display_options
-        ids = list(bc_component.data.coverage_data.comp_id.values)
+        ids = bc_component.data.column('comp_id').tolist()
         id_file = os.path.join(bc_comp_dir, BC_COVERAGE_INITIAL_ATT_ID_FILE)
         write_display_option_ids(id_file, ids)
         id_file = os.path.join(bc_comp_dir, BC_COVERAGE_INITIAL_COMP_ID_FILE)
@@ -271,7 +278,6 @@ class ImportSimulationThread(QThread):
         mat_main_file = os.path.join(mat_comp_dir, 'materials_coverage_comp.nc')
         mat_component = MaterialsCoverageComponent(mat_main_file)
         mat_component.data.coverage_data = pandas.DataFrame.from_dict(self._materials_reader.data).to_xarray()
-        mat_component.data.commit()
 
         # Write component id and polygon att ids to a file so we can initialize them in get_initial_display_options
         att_ids = []
@@ -282,6 +288,10 @@ class ImportSimulationThread(QThread):
             non_default_poly_ids = [poly_id for poly_id in poly_ids if poly_id > 0]
             att_ids.extend(non_default_poly_ids)
             comp_ids.extend([mat_id for _ in range(len(non_default_poly_ids))])
+
+        # Keep the material of each cell so mapping this coverage back to the grid does not need to snap it.
+        self._store_cell_materials(mat_component, cell_materials, FeatureIdMap(att_ids, comp_ids))
+        mat_component.data.commit()
         id_file = os.path.join(mat_comp_dir, MAT_COVERAGE_INITIAL_ATT_ID_FILE)
         write_display_option_ids(id_file, att_ids)
         id_file = os.path.join(mat_comp_dir, MAT_COVERAGE_INITIAL_COMP_ID_FILE)
@@ -292,6 +302,24 @@ class ImportSimulationThread(QThread):
         self._mat_do_comp.set_unique_name_and_model_name('Materials_Coverage_Component', 'StandardInterfaceTemplate')
         self._mat_do_comp.set_main_file(mat_main_file)
 
+    def _store_cell_materials(self, mat_component, cell_materials, poly_materials):
+        """
+        Stores the material of each cell with the materials coverage.
+
+        Args:
+            mat_component (:obj:`MaterialsCoverageComponent`): The materials coverage component.
+            cell_materials (:obj:`list`): The material id of each grid cell.
+            poly_materials (:obj:`FeatureIdMap`): The material id of each polygon with a material.
+        """
+        polys = self._mat_cov.GetPolygons()
+        poly_ids = [poly.get_id() for poly in polys]
+        fingerprints = [polygon_fingerprint(poly) for poly in polys]
+        comp_ids = polygon_materials(poly_ids, poly_materials)
+        grid_fingerprint = GridArrays(self._geometry_reader.cogrid.ugrid).fingerprint
+        cell_materials = [max(material, 0) for material in cell_materials]
+        mat_component.data.set_cell_materials(cell_materials, grid_fingerprint,
+                                              polygons_fingerprint(poly_ids, fingerprints, comp_ids))
+
     def _build_bc_coverage(self):
         """Create the data_objects Boundary Conditions Coverage from data imported from the *.example_boundary file."""
         self._logger.info('Building Boundary Conditions coverage geometry...')
@@ -65,7 +65,9 @@ class MaterialsDialog(QDialog):
 
     def _setup_ui_materials_view(self):
         """Sets up the table view for the materials."""
-        self.widgets['table_view'] = MaterialTableWidget(self, self.material_data.coverage_data.to_dataframe())
+        # The table is edited in place, so give it a copy of the read-only coverage data.
+        data_frame = self.material_data.coverage_data.to_dataframe().copy()
+        self.widgets['table_view'] = MaterialTableWidget(self, data_frame)
         self.widgets['main_vert_layout'].addWidget(self.widgets['table_view'])
 
     def _setup_ui_bottom_button_box(self):
@@ -92,5 +94,5 @@ class MaterialsDialog(QDialog):
     def accept(self):
         """Save material properties."""
         self.material_data.coverage_data = self.widgets['table_view'].model.data_frame.to_xarray()
-        self.material_data.commit()
+        self.material_data.commit_later()
         super().accept()
@@ -5,11 +5,11 @@ import shutil
 import uuid
 
 # 2. Third party modules
+import numpy as np
 
 # 3. Aquaveo modules
-from data_objects.parameters import Component
+from data_objects.parameters import Component, FilterLocation
 from xms.snap.snap_exterior_arc import SnapExteriorArc
-from xmscomponents.display.display_options_io import (read_display_options_from_json, write_display_options_to_json)
 from xmscomponents.display.display_options_io import write_display_option_line_locations
 from xmsguipy.data.category_display_option_list import CategoryDisplayOptionList
 from xmsguipy.data.line_style import LineStyle
@@ -17,6 +17,12 @@ from xmsguipy.data.target_type import TargetType
 
 # 4. Local modules
 from standard_interface_template.components.boundary_mapped_component import BoundaryMappedComponent
+from standard_interface_template.components.display_options_cache import read_display_options, write_display_options
+from standard_interface_template.mapping.exterior_boundary import ExteriorBoundary
+from standard_interface_template.mapping.node_spatial_hash import NodeSpatialHash
+from standard_interface_template.mapping.simplify import DISPLAY_TOLERANCE_FACTOR, simplify_polyline
+from standard_interface_template.mapping.snap_cache import (arc_fingerprint, arc_locations, SNAP_CACHE_FILE,
+                                                             SnapCache)
 
 __copyright__ = "(C) Copyright Aquaveo 2020"
 __license__ = "All rights reserved"
@@ -34,28 +40,53 @@ class BoundaryMapper:
             generate_snap (bool): Flag for whether to generate the snap component.
         """
         self._generate_snap = generate_snap
-        self._logger = coverage_mapper._logger
+        self._logger = coverage_mapper._logger.getChild('boundary_conditions')
         self._co_grid = coverage_mapper.co_grid
+        self._grid_arrays = coverage_mapper.grid_arrays
         self._bc_component_file = coverage_mapper.bc_component.main_file
         self._coverage_xml_str = 'boundary_conditions_coverage'
         self._coverage_comp_xml_str = 'StandardInterfaceTemplate#Boundary_Coverage_Component'
         self._new_comp_unique_name = 'Boundary_Mapped_Component'
         self._bc_coverage = coverage_mapper.bc_coverage
         self._bc_component = coverage_mapper.bc_component
-        self._snap_arc = SnapExteriorArc()
-        self._snap_arc.set_grid(grid=self._co_grid, target_cells=False)
+        self._exterior_boundary = None
+        self._snap_arc = None
+        self._snap_cache = SnapCache(os.path.join(os.path.dirname(self._bc_component_file), SNAP_CACHE_FILE),
+                                     coverage_mapper.grid_arrays.fingerprint)
         self._comp_main_file = ''
         self._arc_to_grid_points = {}
-        self.arc_id_to_grid_ids = {}
-        self._arc_id_to_comp_id = {}
+        self._mapping_result = coverage_mapper.mapping_result
         self._comp_path = ''
         self._grid_wkt = wkt
         self.bc_mapped_comp_uuid = None
         self.bc_mapped_comp_display_uuid = None
+        # None picks the tolerance from the mesh resolution, 0.0 draws every snapped node.
+        self.display_tolerance = None
 
     def do_map(self):
-        """Creates the mapped bc component."""
+        """
+        Creates the mapped bc component.
+
+        Returns:
+            (:obj:`tuple`): The data_objects component and the mapped component, or (None, None) if no snap preview is
+            generated.
+        """
+        self.snap()
+        return self.create_snap_component()
+
+    def snap(self):
+        """Maps the arcs and points to grid nodes. Uses the C++ grid, so only call from one thread at a time."""
         self._get_grid_points_from_arcs()
+        self._get_grid_nodes_from_points()
+
+    def create_snap_component(self):
+        """
+        Writes the snap preview of the mapped arcs. Only uses the snapped points, so safe to call from any thread.
+
+        Returns:
+            (:obj:`tuple`): The data_objects component and the mapped component, or (None, None) if no snap preview is
+            generated.
+        """
         if self._generate_snap:
             self._create_component_folder_and_copy_display_options()
             self._create_drawing()
@@ -79,38 +110,103 @@ class BoundaryMapper:
 
     def _get_grid_points_from_arcs(self):
         """Uses xmssnap to get the points from arcs."""
-        self._logger.info('Boundary Condition coverage to mesh.')
+        self._logger.info('Mapping boundary condition coverage to mesh.')
         arcs = self._bc_coverage.get_arcs()
         bc_data = self._bc_component.data
-        df = bc_data.coverage_data.to_dataframe()
-        arc_index = 0
-        arc_index_to_arc_id = {}
-        for arc in arcs:
-            arc_index += 1
-            arc_id = arc.get_id()
-            arc_index_to_arc_id[arc_index] = arc_id
-            comp_id = self._bc_component.get_comp_id(TargetType.arc, arc_id)
-            if comp_id is None or comp_id < 0:
+        arc_ids = [arc.get_id() for arc in arcs]
+        comp_ids = self._bc_component.get_feature_id_map(TargetType.arc).get_comp_ids(arc_ids, default=-1).tolist()
+        snapped_arc_indices = []
+        snapped_comp_ids = []
+        snapped_nodes = []
+        for arc_index, (arc, arc_id, comp_id) in enumerate(zip(arcs, arc_ids, comp_ids), start=1):
+            if comp_id < 0:
                 comp_id = 0
                 display_name = 'A'
             else:
-                df2 = df.loc[df['comp_id'] == comp_id]
-                if not df2.empty:
-                    display_name = df2.user_option.iloc[0]
-                else:
-                    display_name = 'A'
+                display_name = bc_data.value(comp_id, 'user_option', 'A')
 
-            snap_output = self._snap_arc.get_snapped_points(arc)
+            snap_output = self._get_snapped_points(arc)
             if 'location' not in snap_output or not snap_output['location']:
                 self._logger.warning(f'Unable to snap arc id: {arc_id} to mesh.')
                 continue
-            self.arc_id_to_grid_ids[arc_index] = snap_output['id']
-            self._arc_id_to_comp_id[arc_index] = comp_id
-            points = [item for sublist in snap_output['location'] for item in sublist]
+            snapped_arc_indices.append(arc_index)
+            snapped_comp_ids.append(comp_id)
+            snapped_nodes.append(snap_output['id'])
+            if not self._generate_snap:
+                continue
 
+            points = self._display_points(snap_output['location'])
             if display_name not in self._arc_to_grid_points:
                 self._arc_to_grid_points[display_name] = []
             self._arc_to_grid_points[display_name].append(points)
+        self._mapping_result.set_arc_nodes(snapped_arc_indices, snapped_comp_ids, snapped_nodes)
+        self._snap_cache.save(arc_ids)
+
+    def _get_grid_nodes_from_points(self):
+        """Maps each point of the coverage to its nearest grid node."""
+        points = self._bc_coverage.get_points(FilterLocation.PT_LOC_DISJOINT)
+        if not points:
+            self._mapping_result.set_point_nodes([], [], [])
+            return
+
+        self._logger.info('Mapping boundary condition points to mesh.')
+        point_ids = [point.get_id() for point in points]
+        locations = [(point.get_x(), point.get_y()) for point in points]
+        comp_ids = self._bc_component.get_feature_id_map(TargetType.point).get_comp_ids(point_ids)
+        node_hash = NodeSpatialHash(self._grid_arrays.locations)
+        self._mapping_result.set_point_nodes(point_ids, comp_ids, node_hash.nearest_nodes(locations))
+
+    def _display_points(self, locations):
+        """
+        Gets the points drawn for a snapped arc.
+
+        Only the snap preview is simplified, the exported node strings always use every snapped node.
+
+        Args:
+            locations (:obj:`list`): The locations of the snapped grid points.
+
+        Returns:
+            (:obj:`list`): The flat [x, y, z, ...] locations to draw.
+        """
+        tolerance = self.display_tolerance
+        if tolerance is None:
+            tolerance = DISPLAY_TOLERANCE_FACTOR * self._grid_arrays.edge_length
+        return simplify_polyline(np.asarray(locations, dtype=np.float64), tolerance).reshape(-1).tolist()
+
+    def _get_snapped_points(self, arc):
+        """
+        Gets the grid points snapped to an arc, only snapping the arc if it was added or modified since the last run.
+
+        Arcs are snapped with the exterior boundary index of the grid, built the first time an arc needs snapping.
+
+        Args:
+            arc (:obj:`data_objects.parameters.Arc`): The arc to snap.
+
+        Returns:
+            (:obj:`dict`): The snapped grid point 'id' and 'location' lists.
+        """
+        arc_id = arc.get_id()
+        fingerprint = arc_fingerprint(arc)
+        cached = self._snap_cache.get(arc_id, fingerprint)
+        if cached is not None:
+            return {'id': cached[0].tolist(), 'location': cached[1].tolist()}
+
+        if self._exterior_boundary is None:
+            self._exterior_boundary = ExteriorBoundary(self._grid_arrays)
+        snapped = self._exterior_boundary.snap(arc_locations(arc))
+        if snapped is not None:
+            ids, locations = snapped[0].tolist(), snapped[1].tolist()
+        else:
+            # The arc's ends are on different boundary loops, snap to the same node or are too far from the boundary,
+            # let xmssnap sort it out.
+            if self._snap_arc is None:
+                self._snap_arc = SnapExteriorArc()
+                self._snap_arc.set_grid(grid=self._co_grid, target_cells=False)
+            snap_output = self._snap_arc.get_snapped_points(arc)
+            ids = snap_output.get('id', [])
+            locations = snap_output.get('location', [])
+        self._snap_cache.set(arc_id, fingerprint, ids, locations)
+        return {'id': list(ids), 'location': [list(location) for location in locations]}
 
     def _create_component_folder_and_copy_display_options(self):
         """Creates the folder for the mapped bc component and copies the display options from the bc coverage."""
@@ -130,9 +226,8 @@ class BoundaryMapper:
         bc_comp_display_file = os.path.join(bc_comp_path, 'boundary_coverage_display_options.json')
         comp_display_file = os.path.join(self._comp_path, 'boundary_coverage_display_options.json')
         if os.path.isfile(bc_comp_display_file):
-            shutil.copyfile(bc_comp_display_file, comp_display_file)
             categories = CategoryDisplayOptionList()  # Generates a random UUID key for the display list
-            json_dict = read_display_options_from_json(comp_display_file)
+            json_dict = read_display_options(bc_comp_display_file)  # Written below, so no need to copy it first.
             if self.bc_mapped_comp_display_uuid is None:
                 json_dict['uuid'] = str(uuid.uuid4())  # pragma: no cover
             else:
@@ -148,7 +243,7 @@ class BoundaryMapper:
                 category.options.width = 4
                 category.label_on = False
 
-            write_display_options_to_json(comp_display_file, categories)
+            write_display_options(comp_display_file, categories)
             self._comp_main_file = comp_display_file
         else:
             self._logger.info('Could not find boundary_coverage_display_options.json file')  # pragma: no cover
@@ -8,6 +8,9 @@ import logging
 
 # 4. Local modules
 from standard_interface_template.mapping.boundary_mapper import BoundaryMapper
+from standard_interface_template.mapping.grid_arrays import GridArrays
+from standard_interface_template.mapping.mapping_result import MappingResult
+from standard_interface_template.mapping.mapping_stages import run_mapping_stages
 from standard_interface_template.mapping.material_mapper import MaterialMapper
 
 __copyright__ = "(C) Copyright Aquaveo 2020"
@@ -32,61 +35,90 @@ class CoverageMapper:
         self.grid_uuid = query_helper.grid_uuid
         self.grid_wkt = query_helper.grid_wkt
         self.component_folder = query_helper.component_folder
+        self.grid_arrays = GridArrays(self.co_grid.ugrid) if self.co_grid else None
 
         self.material_coverage = query_helper.materials_coverage
         self.material_component = query_helper.material_component
-        self.material_comp_id_to_grid_cell_ids = None
-        self.material_names = None
         self.mapped_material_uuid = None
         self.mapped_material_display_uuid = None
 
         self.bc_coverage = query_helper.boundary_conditions_coverage
         self.bc_component = query_helper.boundary_conditions_component
-        self.bc_arc_id_to_grid_ids = None
-        self.bc_arc_id_to_comp_id = None
-        self.bc_arc_id_to_bc_id = None
         self.bc_mapped_comp_uuid = None
         self.bc_mapped_comp_display_uuid = None
 
+        self.mapping_result = MappingResult()
         self.query_helper = query_helper
 
     def do_map(self):
         """Creates the snap preview of coverages onto the mesh."""
-        try:
-            self._map_materials()
-            self._map_boundary_conditions()
-        except:  # pragma: no cover  # noqa
-            self._logger.exception('Error generating snap.')  # pragma: no cover
-
-    def _map_materials(self):
-        """Maps the materials from the material coverage to the mesh."""
+        # Snap one coverage at a time, then let the mappers write their display files side by side.
+        stages = [
+            ('materials', self._snap_materials, self._write_materials),
+            ('boundary_conditions', self._snap_boundary_conditions, self._write_boundary_conditions),
+        ]
+        self.query_helper.mapped_comps.extend(run_mapping_stages(stages, self._logger))
+
+    def _snap_materials(self):
+        """
+        Maps the materials from the material coverage to the mesh.
+
+        Returns:
+            (:obj:`MaterialMapper`): The mapper, or None if there is no material coverage.
+        """
         if self.material_coverage is None:
-            return
-        self._logger.info('Mapping materials coverage to mesh.')
+            return None
+        self._logger.getChild('materials').info('Mapping materials coverage to mesh.')
         mapper = MaterialMapper(self, wkt=self.grid_wkt, generate_snap=self._generate_snap)
         mapper.mapped_comp_uuid = self.mapped_material_uuid
         mapper.mapped_material_display_uuid = self.mapped_material_display_uuid
-        self.material_comp_id_to_grid_cell_ids = mapper._poly_to_cells
-        mat_data = self.material_component.data
-        self.material_names = mat_data.coverage_data.to_dataframe()['name'].tolist()
-        do_comp, comp = mapper.do_map()
+        mapper.snap()
+        return mapper
+
+    def _write_materials(self, mapper):
+        """
+        Writes the snap preview of the materials.
+
+        Args:
+            mapper (:obj:`MaterialMapper`): The mapper that snapped the materials.
+
+        Returns:
+            (:obj:`tuple`): The mapped component to add to XMS, or None if there is no snap preview to add.
+        """
+        do_comp, comp = mapper.create_snap_component()
+        self._logger.getChild('materials').info('Finished mapping materials coverage to mesh.')
         if do_comp is not None:
-            self.query_helper.mapped_comps.append((do_comp, [comp.get_display_options_action()],
-                                                  'materials_mapped_component'))
-        self._logger.info('Finished mapping materials coverage to mesh.')
+            return do_comp, [comp.get_display_options_action()], 'materials_mapped_component'
+        return None
 
-    def _map_boundary_conditions(self):
-        """Maps the boundary conditions from the boundary conditions coverage to the mesh."""
+    def _snap_boundary_conditions(self):
+        """
+        Maps the boundary conditions from the boundary conditions coverage to the mesh.
+
+        Returns:
+            (:obj:`BoundaryMapper`): The mapper, or None if there is no boundary conditions coverage.
+        """
         if self.bc_coverage is None:
-            return
-        self._logger.info('Mapping bc coverage to mesh.')
+            return None
+        self._logger.getChild('boundary_conditions').info('Mapping bc coverage to mesh.')
         mapper = BoundaryMapper(self, wkt=self.grid_wkt, generate_snap=self._generate_snap)
         mapper.bc_mapped_comp_uuid = self.bc_mapped_comp_uuid
         mapper.bc_mapped_comp_display_uuid = self.bc_mapped_comp_display_uuid
-        self.bc_arc_id_to_grid_ids = mapper.arc_id_to_grid_ids
-        self.bc_arc_id_to_comp_id = mapper._arc_id_to_comp_id
-        do_comp, comp = mapper.do_map()
+        mapper.snap()
+        return mapper
+
+    def _write_boundary_conditions(self, mapper):
+        """
+        Writes the snap preview of the boundary conditions.
+
+        Args:
+            mapper (:obj:`BoundaryMapper`): The mapper that snapped the boundary conditions.
+
+        Returns:
+            (:obj:`tuple`): The mapped component to add to XMS, or None if there is no snap preview to add.
+        """
+        do_comp, comp = mapper.create_snap_component()
+        self._logger.getChild('boundary_conditions').info('Finished mapping boundary conditions coverage to mesh.')
         if do_comp is not None:
-            self.query_helper.mapped_comps.append((do_comp, [comp.get_display_options_action()],
-                                                  'boundary_mapped_component'))
-        self._logger.info('Finished mapping boundary conditions coverage to mesh.')
+            return do_comp, [comp.get_display_options_action()], 'boundary_mapped_component'
+        return None
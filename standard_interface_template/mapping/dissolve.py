@@ -0,0 +1,233 @@
+"""Merge adjacent grid cells into outline polygons."""
+# 1. Standard python modules
+
+# 2. Third party modules
+import numpy as np
+
+# 3. Aquaveo modules
+
+# 4. Local modules
+
+__copyright__ = "(C) Copyright Aquaveo 2020"
+__license__ = "All rights reserved"
+
+
+def _cell_edges(grid_arrays, cell_ids):
+    """
+    Get the edges of cells, all oriented counterclockwise.
+
+    Args:
+        grid_arrays (:obj:`GridArrays`): The grid.
+        cell_ids (:obj:`numpy.ndarray`): The cells.
+
+    Returns:
+        (:obj:`tuple`): The start and end point ids of every edge of the cells.
+    """
+    sizes = grid_arrays.cell_sizes[cell_ids]
+    keep = sizes >= 3
+    cell_ids, sizes = cell_ids[keep], sizes[keep]
+    if len(cell_ids) == 0:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+
+    # Position of every point of the selected cells in cell_points, and of the point after it around its cell.
+    edge_offsets = np.zeros(len(sizes) + 1, dtype=np.int64)
+    np.cumsum(sizes, out=edge_offsets[1:])
+    edge_cells = np.repeat(np.arange(len(sizes)), sizes)
+    position = np.arange(edge_offsets[-1]) - edge_offsets[edge_cells]
+    first = grid_arrays.cell_point_offsets[cell_ids][edge_cells]
+    starts = grid_arrays.cell_points[first + position]
+    ends = grid_arrays.cell_points[first + (position + 1) % sizes[edge_cells]]
+
+    # Reverse the edges of clockwise cells so shared edges of neighboring cells always run in opposite directions.
+    x, y = grid_arrays.locations[:, 0], grid_arrays.locations[:, 1]
+    cross = x[starts] * y[ends] - x[ends] * y[starts]
+    clockwise = np.add.reduceat(cross, edge_offsets[:-1]) < 0.0
+    flip = clockwise[edge_cells]
+    starts, ends = np.where(flip, ends, starts), np.where(flip, starts, ends)
+    return starts, ends
+
+
+def _boundary_edges(starts, ends, num_points):
+    """
+    Remove the edges shared by two cells.
+
+    Args:
+        starts (:obj:`numpy.ndarray`): The start point id of each edge.
+        ends (:obj:`numpy.ndarray`): The end point id of each edge.
+        num_points (int): The number of points in the grid.
+
+    Returns:
+        (:obj:`tuple`): The start and end point ids of the edges used by only one cell.
+    """
+    keys = np.minimum(starts, ends) * num_points + np.maximum(starts, ends)
+    _, inverse, counts = np.unique(keys, return_inverse=True, return_counts=True)
+    boundary = counts[inverse] == 1
+    return starts[boundary], ends[boundary]
+
+
+def _chain_rings(starts, ends):
+    """
+    Join boundary edges end to end into closed rings.
+
+    Args:
+        starts (:obj:`numpy.ndarray`): The start point id of each boundary edge.
+        ends (:obj:`numpy.ndarray`): The end point id of each boundary edge.
+
+    Returns:
+        (:obj:`list`): The point ids of each ring, without the first point repeated.
+    """
+    order = np.argsort(starts, kind='stable')
+    sorted_starts = starts[order]
+    # Where the outgoing edges of each edge's end point begin in order. A point where two rings touch has more than
+    # one outgoing edge, so keep a cursor to the next unused one.
+    next_first = np.searchsorted(sorted_starts, ends).tolist()
+    sorted_starts = sorted_starts.tolist()
+    order = order.tolist()
+    ends = ends.tolist()
+    starts = starts.tolist()
+    cursor = {}
+    used = [False] * len(starts)
+    rings = []
+    for first_edge in order:
+        if used[first_edge]:
+            continue
+        ring = []
+        edge = first_edge
+        while edge is not None and not used[edge]:
+            used[edge] = True
+            ring.append(starts[edge])
+            point = ends[edge]
+            index = cursor.get(point, next_first[edge])
+            edge = None
+            while index < len(sorted_starts) and sorted_starts[index] == point:
+                candidate = order[index]
+                index += 1
+                if not used[candidate]:
+                    edge = candidate
+                    break
+            cursor[point] = index
+        if len(ring) >= 3:
+            rings.append(ring)
+    return rings
+
+
+def signed_area(ring_locs):
+    """
+    Get the signed area of a ring.
+
+    Args:
+        ring_locs (:obj:`numpy.ndarray`): The (n, 3) locations of the ring, not closed.
+
+    Returns:
+        (float): The area, positive if the ring is counterclockwise.
+    """
+    x, y = ring_locs[:, 0], ring_locs[:, 1]
+    return 0.5 * float(np.dot(x, np.roll(y, -1)) - np.dot(np.roll(x, -1), y))
+
+
+def _contains(ring_locs, point):
+    """
+    Check if a point is inside a ring.
+
+    Args:
+        ring_locs (:obj:`numpy.ndarray`): The (n, 3) locations of the ring, not closed.
+        point (:obj:`numpy.ndarray`): The point location.
+
+    Returns:
+        (bool): True if the point is inside the ring.
+    """
+    x1, y1 = ring_locs[:, 0], ring_locs[:, 1]
+    x2, y2 = np.roll(x1, -1), np.roll(y1, -1)
+    px, py = point[0], point[1]
+    straddles = (y1 > py) != (y2 > py)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        x_cross = x1 + (py - y1) * (x2 - x1) / (y2 - y1)
+    return bool(np.count_nonzero(straddles & (px < x_cross)) % 2)
+
+
+def _drop_collinear(ring_locs):
+    """
+    Remove the points of a ring that lie on the straight line between their neighbors.
+
+    Args:
+        ring_locs (:obj:`numpy.ndarray`): The (n, 3) locations of the ring, not closed.
+
+    Returns:
+        (:obj:`numpy.ndarray`): The locations of the ring's corners.
+    """
+    to_prev = np.roll(ring_locs, 1, axis=0)[:, :2] - ring_locs[:, :2]
+    to_next = np.roll(ring_locs, -1, axis=0)[:, :2] - ring_locs[:, :2]
+    cross = to_prev[:, 0] * to_next[:, 1] - to_prev[:, 1] * to_next[:, 0]
+    scale = np.linalg.norm(to_prev, axis=1) * np.linalg.norm(to_next, axis=1)
+    dot = np.einsum('ij,ij->i', to_prev, to_next)
+    corner = (np.abs(cross) > 1e-12 * scale) | (dot > 0.0)
+    return ring_locs[corner] if np.count_nonzero(corner) >= 3 else ring_locs
+
+
+def _flatten(ring_locs):
+    """
+    Get the flat, closed location list of a ring.
+
+    Args:
+        ring_locs (:obj:`numpy.ndarray`): The (n, 3) locations of the ring, not closed.
+
+    Returns:
+        (:obj:`list`): The [x, y, z, ...] locations with the first point repeated at the end.
+    """
+    return np.concatenate([ring_locs, ring_locs[:1]]).reshape(-1).tolist()
+
+
+def boundary_loops(grid_arrays, cell_ids):
+    """
+    Get the loops of points around the area covered by cells.
+
+    Args:
+        grid_arrays (:obj:`GridArrays`): The grid.
+        cell_ids (:obj:`numpy.ndarray`): The cells.
+
+    Returns:
+        (:obj:`list`): The point ids of each loop, without the first point repeated. Loops around the outside of the
+        area are counterclockwise and loops around holes are clockwise.
+    """
+    starts, ends = _cell_edges(grid_arrays, np.asarray(cell_ids, dtype=np.int64))
+    starts, ends = _boundary_edges(starts, ends, len(grid_arrays.locations))
+    return [np.asarray(loop, dtype=np.int64) for loop in _chain_rings(starts, ends)]
+
+
+def dissolve_cells(grid_arrays, cell_ids):
+    """
+    Merge cells into the outline polygons of the area they cover.
+
+    Edges shared by two of the cells cancel out, and the remaining boundary edges are joined into rings with their
+    collinear points removed.
+    Counterclockwise rings are outer boundaries and clockwise rings are holes, which are given to the smallest outer
+    ring containing them.
+
+    Args:
+        grid_arrays (:obj:`GridArrays`): The grid.
+        cell_ids (:obj:`numpy.ndarray`): The cells to merge.
+
+    Returns:
+        (:obj:`list`): The polygons as dicts of flat, closed 'outer' locations and a list of 'inner' locations, as
+        used by write_display_option_polygon_locations.
+    """
+    outers = []
+    holes = []
+    for ring in boundary_loops(grid_arrays, cell_ids):
+        ring_locs = _drop_collinear(grid_arrays.locations[ring])
+        area = signed_area(ring_locs)
+        if area > 0.0:
+            outers.append((area, ring_locs))
+        elif area < 0.0:
+            holes.append(ring_locs)
+
+    outers.sort(key=lambda outer: outer[0])  # Smallest first, so a hole goes to its innermost container.
+    polygons = [{'outer': _flatten(ring_locs), 'inner': []} for _, ring_locs in outers]
+    for hole_locs in holes:
+        # The midpoint of an edge of the hole is inside its container but not on the container's boundary.
+        test_point = (hole_locs[0] + hole_locs[1]) / 2.0
+        for polygon, (_, outer_locs) in zip(polygons, outers):
+            if _contains(outer_locs, test_point):
+                polygon['inner'].append(_flatten(hole_locs))
+                break
+    return polygons
@@ -0,0 +1,143 @@
+"""Index of a grid's exterior boundary for snapping arcs to it."""
+# 1. Standard python modules
+
+# 2. Third party modules
+import numpy as np
+
+# 3. Aquaveo modules
+
+# 4. Local modules
+from standard_interface_template.mapping.dissolve import boundary_loops, signed_area
+from standard_interface_template.mapping.node_spatial_hash import NodeSpatialHash
+
+__copyright__ = "(C) Copyright Aquaveo 2020"
+__license__ = "All rights reserved"
+
+
+def _point_at_half_length(locations):
+    """
+    Get the point halfway along a polyline.
+
+    Args:
+        locations (:obj:`numpy.ndarray`): The (n, 3) locations of the polyline.
+
+    Returns:
+        (:obj:`numpy.ndarray`): The xy location halfway along the polyline.
+    """
+    xy = locations[:, :2]
+    lengths = np.concatenate([[0.0], np.cumsum(np.hypot(*np.diff(xy, axis=0).T))])
+    return np.array([np.interp(lengths[-1] / 2.0, lengths, xy[:, 0]), np.interp(lengths[-1] / 2.0, lengths, xy[:, 1])])
+
+
+class ExteriorBoundary:
+    """
+    The exterior boundary loops of a grid, with the distance along each loop and a spatial index of the boundary nodes.
+
+    Only the counterclockwise loops around the outside of the grid are kept, loops around holes and islands in the grid
+    are not part of the exterior boundary.
+
+    An arc is snapped by finding the boundary nodes nearest its two ends and taking the nodes between them along the
+    loop, in the direction that follows the arc. Both ends must be within the tolerance of their boundary node.
+
+    Attributes:
+        loop_nodes (:obj:`numpy.ndarray`): The grid node ids of all the loops, one loop after the other.
+        loop_offsets (:obj:`numpy.ndarray`): Offsets of each loop's nodes in loop_nodes.
+        distances (:obj:`numpy.ndarray`): The distance along its loop of each node in loop_nodes.
+        loop_lengths (:obj:`numpy.ndarray`): The perimeter of each loop.
+        tolerance (float): The farthest an arc's end can be from the boundary node it snaps to.
+    """
+
+    def __init__(self, grid_arrays, tolerance=None):
+        """
+        Constructor.
+
+        Args:
+            grid_arrays (:obj:`GridArrays`): The grid.
+            tolerance (float): The farthest an arc's end can be from the boundary node it snaps to. Defaults to the
+                mean length of the boundary edges.
+        """
+        self._locations = grid_arrays.locations
+        loops = [loop for loop in boundary_loops(grid_arrays, np.arange(grid_arrays.cell_count))
+                 if signed_area(self._locations[loop]) > 0.0]
+        sizes = [len(loop) for loop in loops]
+        self.loop_offsets = np.zeros(len(loops) + 1, dtype=np.int64)
+        np.cumsum(sizes, out=self.loop_offsets[1:])
+        self.loop_nodes = np.concatenate(loops) if loops else np.empty(0, dtype=np.int64)
+        self._loop_of_node = np.repeat(np.arange(len(loops)), sizes)
+
+        # Length of the edge from each node to the next one around its loop.
+        xy = self._locations[self.loop_nodes, :2]
+        next_index = np.arange(len(self.loop_nodes)) + 1
+        next_index[self.loop_offsets[1:] - 1] = self.loop_offsets[:-1]
+        edge_lengths = np.hypot(*(xy[next_index] - xy).T)
+        totals = np.cumsum(edge_lengths)
+        loop_starts = np.concatenate([[0.0], totals])[self.loop_offsets[:-1]]
+        self.distances = totals - edge_lengths - np.repeat(loop_starts, sizes)
+        self.loop_lengths = np.add.reduceat(edge_lengths, self.loop_offsets[:-1]) if loops else np.empty(0)
+        if tolerance is None:
+            tolerance = float(edge_lengths.mean()) if loops else 0.0
+        self.tolerance = tolerance
+
+        self._node_hash = NodeSpatialHash(xy, node_ids=np.arange(len(self.loop_nodes)))
+
+    def _path(self, start, end, forward):
+        """
+        Get the positions in loop_nodes from one node to another along their loop.
+
+        Args:
+            start (int): Position of the first node in loop_nodes.
+            end (int): Position of the last node in loop_nodes.
+            forward (bool): True to go in the loop's direction, False to go against it.
+
+        Returns:
+            (:obj:`numpy.ndarray`): The positions in loop_nodes, from start to end.
+        """
+        loop = self._loop_of_node[start]
+        first = self.loop_offsets[loop]
+        size = self.loop_offsets[loop + 1] - first
+        local_start, local_end = start - first, end - first
+        if forward:
+            steps = np.arange((local_end - local_start) % size + 1)
+            return first + (local_start + steps) % size
+        steps = np.arange((local_start - local_end) % size + 1)
+        return first + (local_start - steps) % size
+
+    def snap(self, arc_locations):
+        """
+        Get the boundary nodes an arc follows.
+
+        Args:
+            arc_locations (:obj:`numpy.ndarray`): The (n, 3) locations of the arc's nodes and vertices, in order.
+
+        Returns:
+            (:obj:`tuple`): The grid node ids and their locations, or None if the arc's ends are not nearest to the
+            same boundary loop, are nearest the same boundary node or are farther than the tolerance from it.
+        """
+        arc_locations = np.asarray(arc_locations, dtype=np.float64).reshape(-1, 3)
+        if len(self.loop_nodes) == 0 or len(arc_locations) < 2:
+            return None
+        start, end = self._node_hash.nearest_nodes(arc_locations[[0, -1]]).tolist()
+        if start == end or self._loop_of_node[start] != self._loop_of_node[end]:
+            return None
+        gaps = np.hypot(*(self._locations[self.loop_nodes[[start, end]], :2] - arc_locations[[0, -1], :2]).T)
+        if (gaps > self.tolerance).any():
+            return None
+
+        # Go around the loop the way whose halfway point is nearest the arc's halfway point.
+        loop = self._loop_of_node[start]
+        perimeter = self.loop_lengths[loop]
+        forward_length = (self.distances[end] - self.distances[start]) % perimeter
+        arc_middle = _point_at_half_length(arc_locations)
+        best = None
+        for forward, length in ((True, forward_length), (False, perimeter - forward_length)):
+            offset = length / 2.0 if forward else -length / 2.0
+            middle_distance = (self.distances[start] + offset) % perimeter
+            first = self.loop_offsets[loop]
+            loop_distances = self.distances[first:self.loop_offsets[loop + 1]]
+            middle = first + min(np.searchsorted(loop_distances, middle_distance), len(loop_distances) - 1)
+            gap = np.hypot(*(self._locations[self.loop_nodes[middle], :2] - arc_middle))
+            if best is None or gap < best[0]:
+                best = (gap, forward)
+
+        node_ids = self.loop_nodes[self._path(start, end, best[1])]
+        return node_ids, self._locations[node_ids]
@@ -0,0 +1,121 @@
+"""Flat array views of a grid's nodes and cells used by the mappers."""
+# 1. Standard python modules
+
+# 2. Third party modules
+import numpy as np
+
+# 3. Aquaveo modules
+
+# 4. Local modules
+from standard_interface_template.mapping.snap_cache import grid_fingerprint
+
+__copyright__ = "(C) Copyright Aquaveo 2020"
+__license__ = "All rights reserved"
+
+
+def _cell_starts(cellstream):
+    """
+    Find where each cell starts in a cell stream.
+
+    Each cell in the stream is [cell type, number of points, point ids...], so the start of each cell depends on all
+    the cells before it. The starts are found by pointer doubling: after each pass every known start can jump twice as
+    many cells ahead, so only log2(number of cells) vectorized passes are needed.
+
+    Args:
+        cellstream (:obj:`numpy.ndarray`): The grid cell stream.
+
+    Returns:
+        (:obj:`numpy.ndarray`): The index of the cell type entry of each cell in the stream.
+    """
+    size = len(cellstream)
+    if size == 0:
+        return np.empty(0, dtype=np.int64)
+    # jump[i] is where the next cell would start if a cell started at i. The last entry is a sentinel for the end.
+    jump = np.full(size + 1, size, dtype=np.int64)
+    jump[:size - 1] = np.arange(2, size + 1) + cellstream[1:]
+    np.clip(jump, 0, size, out=jump)
+    is_start = np.zeros(size + 1, dtype=bool)
+    is_start[0] = True
+    num_starts = 1
+    while True:
+        is_start[jump[is_start]] = True
+        new_num_starts = np.count_nonzero(is_start)
+        if new_num_starts == num_starts:
+            break
+        num_starts = new_num_starts
+        jump = jump[jump]
+    return np.flatnonzero(is_start[:size])
+
+
+class GridArrays:
+    """
+    Node and cell arrays of a grid, built once and shared by the mappers.
+
+    Attributes:
+        locations (:obj:`numpy.ndarray`): The (num_nodes, 3) node locations.
+        cellstream (:obj:`numpy.ndarray`): The grid cell stream.
+        cell_sizes (:obj:`numpy.ndarray`): The number of points of each cell.
+        cell_point_offsets (:obj:`numpy.ndarray`): Offsets of each cell's points in cell_points.
+        cell_points (:obj:`numpy.ndarray`): The point ids of every cell, in cell order.
+    """
+
+    def __init__(self, ugrid):
+        """
+        Constructor.
+
+        Args:
+            ugrid (:obj:`xms.grid.ugrid.UGrid`): The grid.
+        """
+        self.locations = np.asarray(ugrid.locations, dtype=np.float64).reshape(-1, 3)
+        self.cellstream = np.asarray(ugrid.cellstream, dtype=np.int64)
+        starts = _cell_starts(self.cellstream)
+        self.cell_sizes = self.cellstream[starts + 1] if len(starts) else np.empty(0, dtype=np.int64)
+        self.cell_point_offsets = np.zeros(len(starts) + 1, dtype=np.int64)
+        np.cumsum(self.cell_sizes, out=self.cell_point_offsets[1:])
+        is_point = np.ones(len(self.cellstream), dtype=bool)
+        is_point[starts] = False
+        is_point[starts + 1] = False
+        self.cell_points = self.cellstream[is_point]
+        self._fingerprint = None
+        self._edge_length = None
+
+    @property
+    def cell_count(self):
+        """
+        Get the number of cells in the grid.
+
+        Returns:
+            (int): The number of cells.
+        """
+        return len(self.cell_sizes)
+
+    @property
+    def edge_length(self):
+        """
+        Get the typical length of the grid's cell edges in the xy plane.
+
+        Returns:
+            (float): The median cell edge length, 0.0 if the grid has no cells.
+        """
+        if self._edge_length is None:
+            # Edges between consecutive points of each cell. The closing edge of each cell is left out, which does
+            # not matter for a typical length.
+            in_cell = np.ones(max(len(self.cell_points) - 1, 0), dtype=bool)
+            in_cell[self.cell_point_offsets[1:-1] - 1] = False
+            starts = self.locations[self.cell_points[:-1][in_cell], :2]
+            ends = self.locations[self.cell_points[1:][in_cell], :2]
+            lengths = np.hypot(*(ends - starts).T)
+            self._edge_length = float(np.median(lengths)) if len(lengths) else 0.0
+        return self._edge_length
+
+    @property
+    def fingerprint(self):
+        """
+        Get a fingerprint of the grid's node locations and cell definitions.
+
+        Returns:
+            (str): The grid fingerprint.
+        """
+        if self._fingerprint is None:
+            self._fingerprint = grid_fingerprint(self.locations, self.cellstream)
+        return self._fingerprint
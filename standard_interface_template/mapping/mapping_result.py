@@ -0,0 +1,208 @@
+"""The output of mapping coverages to the Standard Interface domain."""
+# 1. Standard python modules
+import os
+
+# 2. Third party modules
+import numpy as np
+
+# 3. Aquaveo modules
+
+# 4. Local modules
+
+__copyright__ = "(C) Copyright Aquaveo 2020"
+__license__ = "All rights reserved"
+
+
+class MappingResult:
+    """
+    Grid ids mapped to materials and boundary condition arcs and points, stored as flat arrays.
+
+    Material to cell and arc to node relationships are stored in compressed sparse row form: the ids of the i-th
+    material (or arc) are ids[offsets[i]:offsets[i + 1]].
+
+    Attributes:
+        cell_materials (:obj:`numpy.ndarray`): The material id of each grid cell.
+        material_ids (:obj:`numpy.ndarray`): The sorted ids of the mapped materials, including any mapped to no cells.
+        material_offsets (:obj:`numpy.ndarray`): Offsets of each material's cells in material_cells.
+        material_cells (:obj:`numpy.ndarray`): The cell ids of each material, in ascending order.
+        arc_ids (:obj:`numpy.ndarray`): The ids of the snapped arcs, in export order.
+        arc_comp_ids (:obj:`numpy.ndarray`): The boundary conditions component id of each snapped arc.
+        arc_offsets (:obj:`numpy.ndarray`): Offsets of each arc's nodes in arc_nodes.
+        arc_nodes (:obj:`numpy.ndarray`): The grid node ids of each arc, in order along the arc.
+        point_ids (:obj:`numpy.ndarray`): The ids of the mapped points, in export order.
+        point_comp_ids (:obj:`numpy.ndarray`): The boundary conditions component id of each mapped point.
+        point_nodes (:obj:`numpy.ndarray`): The grid node id nearest to each point.
+    """
+    _array_names = ['cell_materials', 'material_ids', 'material_offsets', 'material_cells', 'arc_ids',
+                    'arc_comp_ids', 'arc_offsets', 'arc_nodes', 'point_ids', 'point_comp_ids', 'point_nodes']
+
+    def __init__(self):
+        """Constructor."""
+        self.cell_materials = np.empty(0, dtype=np.int32)
+        self.material_ids = np.empty(0, dtype=np.int32)
+        self.material_offsets = np.zeros(1, dtype=np.int64)
+        self.material_cells = np.empty(0, dtype=np.int32)
+        self.arc_ids = np.empty(0, dtype=np.int32)
+        self.arc_comp_ids = np.empty(0, dtype=np.int32)
+        self.arc_offsets = np.zeros(1, dtype=np.int64)
+        self.arc_nodes = np.empty(0, dtype=np.int32)
+        self.point_ids = np.empty(0, dtype=np.int32)
+        self.point_comp_ids = np.empty(0, dtype=np.int32)
+        self.point_nodes = np.empty(0, dtype=np.int32)
+
+    def set_cell_materials(self, cell_materials, material_ids=None):
+        """
+        Set the material of every cell and build the material to cells lookup from it.
+
+        Args:
+            cell_materials (:obj:`list`): The material id of each grid cell.
+            material_ids (:obj:`list`): Ids of materials that were mapped, even if no cells ended up using them.
+        """
+        self.cell_materials = np.asarray(cell_materials, dtype=np.int32)
+        self.material_cells = np.argsort(self.cell_materials, kind='stable').astype(np.int32)
+        self.material_ids, counts = np.unique(self.cell_materials, return_counts=True)
+        if material_ids is not None:
+            used_ids = self.material_ids
+            self.material_ids = np.union1d(used_ids, np.asarray(material_ids, dtype=np.int32)).astype(np.int32)
+            used_counts = counts
+            counts = np.zeros(len(self.material_ids), dtype=np.int64)
+            counts[np.searchsorted(self.material_ids, used_ids)] = used_counts
+        self.material_offsets = np.zeros(len(counts) + 1, dtype=np.int64)
+        np.cumsum(counts, out=self.material_offsets[1:])
+
+    def set_material_cells(self, material_cells, num_cells):
+        """
+        Set the cells of each material.
+
+        Args:
+            material_cells (:obj:`dict`): The material id to the cell ids of the grid that use that material.
+            num_cells (int): The number of cells in the grid. Cells without a material are given a material id of -1.
+        """
+        cell_materials = np.full(num_cells, -1, dtype=np.int32)
+        for material_id, cells in material_cells.items():
+            cell_materials[np.asarray(cells, dtype=np.int64)] = material_id
+        self.set_cell_materials(cell_materials, list(material_cells))
+
+    def has_material(self, material_id):
+        """
+        Check if a material was mapped, even if no cells use it.
+
+        Args:
+            material_id (int): The material id.
+
+        Returns:
+            (bool): True if the material was mapped.
+        """
+        index = np.searchsorted(self.material_ids, material_id)
+        return bool(index < len(self.material_ids) and self.material_ids[index] == material_id)
+
+    def cells_of_material(self, material_id):
+        """
+        Get the cells that use a material.
+
+        Args:
+            material_id (int): The material id.
+
+        Returns:
+            (:obj:`numpy.ndarray`): View of the ascending cell ids of the material. Empty if the material is not used.
+        """
+        index = np.searchsorted(self.material_ids, material_id)
+        if index >= len(self.material_ids) or self.material_ids[index] != material_id:
+            return self.material_cells[0:0]
+        return self.material_cells[self.material_offsets[index]:self.material_offsets[index + 1]]
+
+    def set_arc_nodes(self, arc_ids, comp_ids, arc_nodes):
+        """
+        Set the grid nodes snapped to each boundary conditions arc.
+
+        Args:
+            arc_ids (:obj:`list`): The ids of the snapped arcs, in export order.
+            comp_ids (:obj:`list`): The boundary conditions component id of each arc.
+            arc_nodes (:obj:`list`): The grid node ids of each arc.
+        """
+        self.arc_ids = np.asarray(arc_ids, dtype=np.int32)
+        self.arc_comp_ids = np.asarray(comp_ids, dtype=np.int32)
+        self.arc_offsets = np.zeros(len(arc_nodes) + 1, dtype=np.int64)
+        np.cumsum([len(nodes) for nodes in arc_nodes], out=self.arc_offsets[1:])
+        if arc_nodes:
+            self.arc_nodes = np.concatenate([np.asarray(nodes, dtype=np.int32) for nodes in arc_nodes])
+        else:
+            self.arc_nodes = np.empty(0, dtype=np.int32)
+
+    def nodes_of_arc(self, index):
+        """
+        Get the grid nodes snapped to an arc.
+
+        Args:
+            index (int): Position of the arc in arc_ids.
+
+        Returns:
+            (:obj:`numpy.ndarray`): View of the node ids of the arc.
+        """
+        return self.arc_nodes[self.arc_offsets[index]:self.arc_offsets[index + 1]]
+
+    def arcs(self):
+        """
+        Iterate over the snapped arcs in export order.
+
+        Yields:
+            (:obj:`tuple`): The arc id, its component id and a view of its grid node ids.
+        """
+        for index in range(len(self.arc_ids)):
+            yield int(self.arc_ids[index]), int(self.arc_comp_ids[index]), self.nodes_of_arc(index)
+
+    def set_point_nodes(self, point_ids, comp_ids, point_nodes):
+        """
+        Set the grid node mapped to each boundary conditions point.
+
+        Args:
+            point_ids (:obj:`list`): The ids of the mapped points, in export order.
+            comp_ids (:obj:`list`): The boundary conditions component id of each point.
+            point_nodes (:obj:`list`): The grid node id of each point.
+        """
+        self.point_ids = np.asarray(point_ids, dtype=np.int32)
+        self.point_comp_ids = np.asarray(comp_ids, dtype=np.int32)
+        self.point_nodes = np.asarray(point_nodes, dtype=np.int32)
+
+    def points(self):
+        """
+        Iterate over the mapped points in export order.
+
+        Yields:
+            (:obj:`tuple`): The point id, its component id and its grid node id.
+        """
+        yield from zip(self.point_ids.tolist(), self.point_comp_ids.tolist(), self.point_nodes.tolist())
+
+    def save(self, filename, key=''):
+        """
+        Write the mapping result to a .npz file.
+
+        Args:
+            filename (str): The file to write.
+            key (str): Identifies the inputs the result was mapped from, see load().
+        """
+        temp_file = f'{filename}.tmp'
+        with open(temp_file, 'wb') as file:
+            np.savez(file, key=np.array(key), **{name: getattr(self, name) for name in self._array_names})
+        os.replace(temp_file, filename)
+
+    @classmethod
+    def load(cls, filename, key=None):
+        """
+        Read a mapping result written by save().
+
+        Args:
+            filename (str): The file to read.
+            key (str): If not None, the key the result must have been saved with.
+
+        Returns:
+            (:obj:`MappingResult`): The mapping result, or None if it was saved with a different key.
+        """
+        result = cls()
+        with np.load(filename, allow_pickle=False) as npz:
+            if key is not None and str(npz['key'] if 'key' in npz else '') != key:
+                return None
+            for name in cls._array_names:
+                if name in npz:  # Files written before a kind of feature was mapped do not have its arrays.
+                    setattr(result, name, npz[name])
+        return result
@@ -0,0 +1,55 @@
+"""Run the snap and write stages of several coverage mappers."""
+# 1. Standard python modules
+from concurrent.futures import ThreadPoolExecutor
+
+# 2. Third party modules
+
+# 3. Aquaveo modules
+
+# 4. Local modules
+
+__copyright__ = "(C) Copyright Aquaveo 2020"
+__license__ = "All rights reserved"
+
+
+def run_mapping_stages(stages, logger):
+    """
+    Runs the snap stage of each mapper one after another, then their write stages side by side.
+
+    The snap stages use the C++ grid, which is not known to be safe to use from several threads, so they run in the
+    calling thread. The write stages only build display files from arrays, so they run in a thread each.
+
+    Args:
+        stages (:obj:`list` of :obj:`tuple`): The (name, snap, write) of each mapper. snap() returns the snapped mapper,
+            or None if there is nothing to map. write(mapper) returns the mapper's result, or None if there is none.
+        logger (:obj:`logging.Logger`): Errors of a mapper are logged to the child logger with the mapper's name.
+
+    Returns:
+        (:obj:`list`): The results of the mappers that returned one, in the order of the stages.
+    """
+    snapped = []
+    for name, snap, write in stages:
+        try:
+            mapper = snap()
+        except Exception:
+            logger.getChild(name).exception('Error generating snap.')
+            continue
+        if mapper is not None:
+            snapped.append((name, write, mapper))
+
+    futures = []
+    if snapped:
+        with ThreadPoolExecutor(max_workers=len(snapped), thread_name_prefix='CoverageMapper') as executor:
+            futures = [(name, executor.submit(write, mapper)) for name, write, mapper in snapped]
+
+    # Collect the results in a fixed order, regardless of which mapper finished first.
+    results = []
+    for name, future in futures:
+        try:
+            result = future.result()
+        except Exception:
+            logger.getChild(name).exception('Error generating snap.')
+            continue
+        if result is not None:
+            results.append(result)
+    return results
@@ -1,21 +1,26 @@
 """Map Material coverage locations and attributes to the Standard Interface domain."""
 # 1. Standard python modules
+from concurrent.futures import ThreadPoolExecutor
 import os
 import shutil
 import uuid
 
 # 2. Third party modules
+import numpy as np
 
 # 3. Aquaveo modules
 from data_objects.parameters import Component
 from xms.snap.snap_polygon import SnapPolygon
-from xmscomponents.display.display_options_io import read_display_options_from_json, write_display_options_to_json
 from xmscomponents.display.display_options_io import write_display_option_polygon_locations
 from xmsguipy.data.category_display_option_list import CategoryDisplayOptionList
 from xmsguipy.data.target_type import TargetType
 
 # 4. Local modules
+from standard_interface_template.components.display_options_cache import read_display_options, write_display_options
 from standard_interface_template.components.materials_mapped_component import MaterialsMappedComponent
+from standard_interface_template.mapping.dissolve import dissolve_cells
+from standard_interface_template.mapping.snap_cache import (polygon_fingerprint, polygon_materials,
+                                                             polygons_fingerprint, SNAP_CACHE_FILE, SnapCache)
 
 __copyright__ = "(C) Copyright Aquaveo 2020"
 __license__ = "All rights reserved"
@@ -33,29 +38,47 @@ class MaterialMapper:
             generate_snap (bool): Flag for whether to generate the snap component.
         """
         self._generate_snap = generate_snap
-        self._logger = coverage_mapper._logger
+        self._logger = coverage_mapper._logger.getChild('materials')
         self._co_grid = coverage_mapper.co_grid
+        self._grid_arrays = coverage_mapper.grid_arrays
         self._new_comp_unique_name = 'Materials_Mapped_Component'
         self._material_component_file = coverage_mapper.material_component.main_file
         self._material_coverage = coverage_mapper.material_coverage
         self._material_component = coverage_mapper.material_component
-        self._snap_poly = SnapPolygon()
-        self._snap_poly.set_grid(grid=self._co_grid, target_cells=False)
-        self._snap_poly.add_polygons(polygons=self._material_coverage.GetPolygons())
+        self._snap_cache = SnapCache(os.path.join(os.path.dirname(self._material_component_file), SNAP_CACHE_FILE),
+                                     coverage_mapper.grid_arrays.fingerprint)
         self._comp_main_file = ''
-        self._poly_to_cells = {}
+        self._mapping_result = coverage_mapper.mapping_result
         self._comp_path = ''
-        self._mat_df = self._material_component.data.coverage_data.to_dataframe()
-        self._mat_comp_ids = self._mat_df['material_id'].to_list()
-        self._mat_names = self._mat_df['name'].to_list()
+        self._mat_comp_ids = self._material_component.data.column('material_id').tolist()
+        self._mat_names = self._material_component.data.column('name').tolist()
         self.mapped_comp_uuid = None
         self.mapped_material_display_uuid = None
         self.grid_wkt = wkt
 
     def do_map(self):
-        """Creates the mapped material component."""
+        """
+        Creates the mapped material component.
+
+        Returns:
+            (:obj:`tuple`): The data_objects component and the mapped component, or (None, None) if no snap preview is
+            generated.
+        """
+        self.snap()
+        return self.create_snap_component()
+
+    def snap(self):
+        """Maps the cells of the grid to materials. Uses the C++ grid, so only call from one thread at a time."""
         self._get_polygon_cells()
 
+    def create_snap_component(self):
+        """
+        Writes the snap preview of the mapped materials. Only uses arrays of the grid, so safe to call from any thread.
+
+        Returns:
+            (:obj:`tuple`): The data_objects component and the mapped component, or (None, None) if no snap preview is
+            generated.
+        """
         if self._generate_snap:
             self._create_component_folder_and_copy_display_options()
             self._create_drawing()
@@ -74,55 +97,95 @@ class MaterialMapper:
         return None, None  # pragma: no cover
 
     def _create_drawing(self):
-        """Uses cell ids to get cell point coords to draw polygons for materials mapped to cells."""
-        ugrid = self._co_grid.ugrid
-        for comp_id, cell_ids in self._poly_to_cells.items():
-            poly_list = []
-            for cid in cell_ids:
-                cell_locs = ugrid.get_cell_locations(cid)
-                locs_list = [item for sublist in cell_locs for item in sublist]
-                if len(locs_list) < 9:
-                    continue  # pragma: no cover
-                # repeat the first point
-                locs_list.append(locs_list[0])
-                locs_list.append(locs_list[1])
-                locs_list.append(locs_list[2])
-                outer_dict = {'outer': locs_list}
-                poly_list.append(outer_dict)
-            filename = os.path.join(self._comp_path, f'display_ids/material_{comp_id}.matid')
-            write_display_option_polygon_locations(filename, poly_list)
+        """Draws the outlines of the cells mapped to each material."""
+        material_ids = self._mapping_result.material_ids.tolist()
+        with ThreadPoolExecutor(thread_name_prefix='MaterialMapper') as executor:
+            for future in [executor.submit(self._write_material_drawing, comp_id) for comp_id in material_ids]:
+                future.result()
+
+    def _write_material_drawing(self, comp_id):
+        """
+        Writes the display file of the cells mapped to a material.
+
+        Adjacent cells are dissolved into outline polygons so the display has one polygon per connected area of the
+        material instead of one per cell.
+
+        Args:
+            comp_id (int): The material id.
+        """
+        cell_ids = self._mapping_result.cells_of_material(comp_id)
+        poly_list = dissolve_cells(self._grid_arrays, cell_ids)
+        filename = os.path.join(self._comp_path, f'display_ids/material_{comp_id}.matid')
+        write_display_option_polygon_locations(filename, poly_list)
 
     def _get_polygon_cells(self):
         """Uses xmssnap to get the cells for each polygon."""
         self._logger.info('Mapping material coverage to mesh.')
-        num_cells = self._co_grid.ugrid.cell_count
-        cell_flag = [True] * num_cells
         polys = self._material_coverage.GetPolygons()
-        for poly in polys:
-            pid = poly.get_id()
-            cells = self._snap_poly.get_cells_in_polygon(pid)
-            comp_id = self._material_component.get_comp_id(TargetType.polygon, pid)
-            if comp_id is None:
-                comp_id = 0  # pragma: no cover
-            if comp_id not in self._poly_to_cells:
-                self._poly_to_cells[comp_id] = []
-            self._poly_to_cells[comp_id].extend(cells)
-            for cid in cells:
-                cell_flag[cid] = False
-        # add all unassigned cells to comp_id = 0 (unassigned_material)
-        if 0 not in self._poly_to_cells:
-            self._poly_to_cells[0] = []  # pragma: no cover
-        for i in range(len(cell_flag)):
-            if cell_flag[i]:
-                self._poly_to_cells[0].append(i)
-        if len(self._poly_to_cells[0]) > 0:
-            cells = [x + 1 for x in self._poly_to_cells[0]]
+        poly_ids = [poly.get_id() for poly in polys]
+        fingerprints = [polygon_fingerprint(poly) for poly in polys]
+        comp_ids = polygon_materials(poly_ids, self._material_component.get_feature_id_map(TargetType.polygon))
+
+        # Coverages built from the cells of this grid (on import) know the material of each cell until the polygons
+        # or their materials change.
+        cell_materials = self._material_component.data.get_cell_materials(
+            self._grid_arrays.fingerprint, polygons_fingerprint(poly_ids, fingerprints, comp_ids)
+        )
+        if cell_materials is not None:
+            self._logger.info('Using the cell materials stored with the coverage.')
+        else:
+            # Cells not in any polygon, or in a polygon without a material, have comp_id = 0 (unassigned material)
+            cell_materials = np.zeros(self._grid_arrays.cell_count, dtype=np.int32)
+            poly_cells = self._get_cells_of_polygons(polys, fingerprints)
+            for pid, comp_id in zip(poly_ids, comp_ids):
+                cell_materials[poly_cells[pid]] = comp_id
+        # Like materials with cells, the unassigned material and materials of polygons that contain no cells are
+        # exported with a (possibly empty) list of cells.
+        self._mapping_result.set_cell_materials(cell_materials, [0] + comp_ids)
+
+        unassigned_cells = self._mapping_result.cells_of_material(0)
+        if len(unassigned_cells) > 0:
+            cells = (unassigned_cells + 1).tolist()
             self._logger.info(f'\n\nThe following elements were assigned to the "unassigned" material.\n'
                               f'Element ids: {cells}.\n')
         for i in range(1, len(self._mat_comp_ids)):
-            if self._mat_comp_ids[i] not in self._poly_to_cells or not self._poly_to_cells[self._mat_comp_ids[i]]:
+            if len(self._mapping_result.cells_of_material(self._mat_comp_ids[i])) == 0:
                 self._logger.info(f'\n\nMaterial: {self._mat_names[i]} was not assigned to any elements.\n')
 
+    def _get_cells_of_polygons(self, polys, fingerprints):
+        """
+        Gets the cells of each polygon, only snapping polygons that were added or modified since the last run.
+
+        Args:
+            polys (:obj:`list`): The polygons of the material coverage.
+            fingerprints (:obj:`list`): The geometry fingerprint of each polygon.
+
+        Returns:
+            (:obj:`dict`): The polygon id to the array of cell ids in the polygon.
+        """
+        poly_cells = {}
+        changed_polys = []
+        for poly, fingerprint in zip(polys, fingerprints):
+            pid = poly.get_id()
+            cached = self._snap_cache.get(pid, fingerprint)
+            if cached is None:
+                changed_polys.append((poly, fingerprint))
+            else:
+                poly_cells[pid] = cached[0]
+
+        if changed_polys:
+            self._logger.info(f'Snapping {len(changed_polys)} of {len(polys)} polygons to mesh.')
+            snap_poly = SnapPolygon()
+            snap_poly.set_grid(grid=self._co_grid, target_cells=False)
+            snap_poly.add_polygons(polygons=[poly for poly, _ in changed_polys])
+            for poly, fingerprint in changed_polys:
+                pid = poly.get_id()
+                cells = np.asarray(snap_poly.get_cells_in_polygon(pid), dtype=np.int64)
+                self._snap_cache.set(pid, fingerprint, cells)
+                poly_cells[pid] = cells
+        self._snap_cache.save(poly_cells.keys())
+        return poly_cells
+
     def _create_component_folder_and_copy_display_options(self):
         """Creates a folder for the mapped material component and copies display options from the material coverage."""
         if self.mapped_comp_uuid is None:
@@ -141,9 +204,8 @@ class MaterialMapper:
         mat_comp_display_file = os.path.join(mat_comp_path, 'materials_coverage_display_options.json')
         comp_display_file = os.path.join(self._comp_path, 'materials_coverage_display_options.json')
         if os.path.isfile(mat_comp_display_file):
-            shutil.copyfile(mat_comp_display_file, comp_display_file)
             categories = CategoryDisplayOptionList()  # Generates a random UUID key for the display list
-            json_dict = read_display_options_from_json(comp_display_file)
+            json_dict = read_display_options(mat_comp_display_file)  # Written below, so no need to copy it first.
             if self.mapped_material_display_uuid is None:
                 json_dict['uuid'] = str(uuid.uuid4())  # pragma: no cover
             else:
@@ -153,7 +215,7 @@ class MaterialMapper:
             # Set projection of free locations to be that of the mesh/current display
             categories.projection = {'wkt': self.grid_wkt}
             categories.from_dict(json_dict)
-            write_display_options_to_json(comp_display_file, categories)
+            write_display_options(comp_display_file, categories)
             self._comp_main_file = comp_display_file
         else:
             self._logger.info('Could not find materials_coverage_display_options.json file')  # pragma: no cover
@@ -0,0 +1,186 @@
+"""Nearest grid node lookup through a bucketed spatial hash."""
+# 1. Standard python modules
+
+# 2. Third party modules
+import numpy as np
+
+# 3. Aquaveo modules
+
+# 4. Local modules
+
+__copyright__ = "(C) Copyright Aquaveo 2020"
+__license__ = "All rights reserved"
+
+
+class NodeSpatialHash:
+    """
+    Nodes binned into square buckets in the xy plane for nearest node queries.
+
+    The bucket size is picked so a bucket holds about one node, so a query only has to look at the nodes in the few
+    buckets around it instead of all the nodes.
+    """
+    _batch_size = 4096  # Queries resolved together, to bound the size of the candidate arrays.
+
+    def __init__(self, locations, node_ids=None):
+        """
+        Constructor.
+
+        Args:
+            locations (:obj:`numpy.ndarray`): The (n, 3) or (n, 2) locations of the nodes.
+            node_ids (:obj:`numpy.ndarray`): The id of each node, returned by queries. Defaults to the node indices.
+        """
+        locations = np.asarray(locations, dtype=np.float64)
+        self._xy = locations.reshape(len(locations), -1)[:, :2] if len(locations) else np.empty((0, 2))
+        self._node_ids = np.arange(len(self._xy)) if node_ids is None else np.asarray(node_ids, dtype=np.int64)
+        if len(self._xy) == 0:
+            self._origin = np.zeros(2)
+            self._bucket_size = 1.0
+            self._dims = np.ones(2, dtype=np.int64)
+        else:
+            self._origin = self._xy.min(axis=0)
+            extent = self._xy.max(axis=0) - self._origin
+            area = float(np.prod(np.maximum(extent, np.finfo(np.float64).eps * max(extent.max(), 1.0))))
+            self._bucket_size = max(np.sqrt(area / len(self._xy)), float(extent.max()) / 1.0e6, 1.0e-12)
+            self._dims = np.floor(extent / self._bucket_size).astype(np.int64) + 1
+
+        # Sort the nodes by bucket key, so the nodes of a bucket are one contiguous run.
+        keys = self._keys(self._bucket_coords(self._xy))
+        self._order = np.argsort(keys, kind='stable')
+        self._bucket_keys, self._bucket_starts, counts = np.unique(keys[self._order], return_index=True,
+                                                                   return_counts=True)
+        self._bucket_ends = self._bucket_starts + counts
+
+    def _bucket_coords(self, xy):
+        """
+        Get the bucket column and row of locations.
+
+        Args:
+            xy (:obj:`numpy.ndarray`): The (n, 2) locations.
+
+        Returns:
+            (:obj:`numpy.ndarray`): The (n, 2) bucket coordinates. May be outside the grid of buckets.
+        """
+        return np.floor((xy - self._origin) / self._bucket_size).astype(np.int64)
+
+    def _keys(self, coords):
+        """
+        Get the bucket keys of bucket coordinates.
+
+        Args:
+            coords (:obj:`numpy.ndarray`): The (n, 2) bucket coordinates.
+
+        Returns:
+            (:obj:`numpy.ndarray`): The key of each bucket, -1 for buckets outside the grid of buckets.
+        """
+        inside = np.all((coords >= 0) & (coords < self._dims), axis=1)
+        return np.where(inside, coords[:, 1] * self._dims[0] + coords[:, 0], -1)
+
+    def nearest(self, x, y):
+        """
+        Get the node nearest to a location.
+
+        Args:
+            x (float): The x coordinate.
+            y (float): The y coordinate.
+
+        Returns:
+            (int): The id of the nearest node, -1 if there are no nodes.
+        """
+        return int(self.nearest_nodes([(x, y)])[0])
+
+    def nearest_nodes(self, locations):
+        """
+        Get the nodes nearest to a batch of locations.
+
+        Args:
+            locations (:obj:`numpy.ndarray`): The (n, 2) or (n, 3) query locations.
+
+        Returns:
+            (:obj:`numpy.ndarray`): The id of the nearest node to each location, -1 if there are no nodes.
+        """
+        locations = np.asarray(locations, dtype=np.float64)
+        xy = locations.reshape(len(locations), -1)[:, :2] if len(locations) else np.empty((0, 2))
+        nearest = np.full(len(xy), -1, dtype=np.int64)
+        if len(self._xy) == 0:
+            return nearest
+        for start in range(0, len(xy), self._batch_size):
+            nearest[start:start + self._batch_size] = self._nearest_batch(xy[start:start + self._batch_size])
+        return nearest
+
+    def _nearest_batch(self, xy):
+        """
+        Get the nodes nearest to a batch of locations.
+
+        The square of buckets searched around each query grows until the nearest node found is closer than any node
+        outside the square could be.
+
+        Args:
+            xy (:obj:`numpy.ndarray`): The (n, 2) query locations.
+
+        Returns:
+            (:obj:`numpy.ndarray`): The id of the nearest node to each location.
+        """
+        nearest = np.full(len(xy), -1, dtype=np.int64)
+        pending = np.arange(len(xy))
+        coords = self._bucket_coords(xy)
+        radius = 1
+        # Once the squares cover more buckets than there are occupied buckets, checking every node is cheaper.
+        budget = max(len(self._bucket_keys), 9 * self._batch_size)
+        while len(pending) and (2 * radius + 1)**2 * len(pending) <= budget:
+            best_index, best_dist = self._search(xy[pending], coords[pending], radius)
+            # Anything outside the searched square is farther than the query's distance to the square's edge.
+            low = (coords[pending] - radius) * self._bucket_size + self._origin
+            high = (coords[pending] + radius + 1) * self._bucket_size + self._origin
+            reach = np.minimum(xy[pending] - low, high - xy[pending]).min(axis=1)
+            done = (best_index >= 0) & (best_dist <= reach)
+            nearest[pending[done]] = self._node_ids[best_index[done]]
+            pending = pending[~done]
+            radius *= 2
+
+        # Queries far from any node are checked against every node.
+        for index in pending.tolist():
+            offsets = self._xy - xy[index]
+            nearest[index] = self._node_ids[int(np.argmin(np.einsum('ij,ij->i', offsets, offsets)))]
+        return nearest
+
+    def _search(self, xy, coords, radius):
+        """
+        Find the nearest node in the square of buckets around each query.
+
+        Args:
+            xy (:obj:`numpy.ndarray`): The (n, 2) query locations.
+            coords (:obj:`numpy.ndarray`): The (n, 2) bucket coordinates of the queries.
+            radius (int): Number of buckets searched on each side of the query's bucket.
+
+        Returns:
+            (:obj:`tuple`): The index of the nearest node found for each query (-1 if none) and its distance.
+        """
+        steps = np.arange(-radius, radius + 1)
+        offsets = np.stack(np.meshgrid(steps, steps), axis=-1).reshape(-1, 2)
+        query_buckets = (coords[:, np.newaxis, :] + offsets).reshape(-1, 2)
+        keys = self._keys(query_buckets)
+        slots = np.searchsorted(self._bucket_keys, keys)
+        slots = np.minimum(slots, len(self._bucket_keys) - 1)
+        found = (keys >= 0) & (self._bucket_keys[slots] == keys)
+        starts = np.where(found, self._bucket_starts[slots], 0)
+        counts = np.where(found, self._bucket_ends[slots] - self._bucket_starts[slots], 0)
+
+        # Expand every (query, bucket) pair into its candidate nodes.
+        candidate_queries = np.repeat(np.arange(len(query_buckets)) // len(offsets), counts)
+        run_starts = np.cumsum(counts) - counts
+        positions = np.arange(counts.sum()) - np.repeat(run_starts, counts) + np.repeat(starts, counts)
+        candidates = self._order[positions]
+        deltas = self._xy[candidates] - xy[candidate_queries]
+        distances = np.hypot(deltas[:, 0], deltas[:, 1])
+
+        best_index = np.full(len(xy), -1, dtype=np.int64)
+        best_dist = np.full(len(xy), np.inf)
+        if len(candidates):
+            # Sort by query then distance, the first candidate of each query is its nearest.
+            ranked = np.lexsort((distances, candidate_queries))
+            first = np.ones(len(ranked), dtype=bool)
+            first[1:] = candidate_queries[ranked[1:]] != candidate_queries[ranked[:-1]]
+            winners = ranked[first]
+            best_index[candidate_queries[winners]] = candidates[winners]
+            best_dist[candidate_queries[winners]] = distances[winners]
+        return best_index, best_dist
@@ -0,0 +1,71 @@
+"""Simplify polylines for display."""
+# 1. Standard python modules
+
+# 2. Third party modules
+import numpy as np
+
+# 3. Aquaveo modules
+
+# 4. Local modules
+
+__copyright__ = "(C) Copyright Aquaveo 2020"
+__license__ = "All rights reserved"
+
+
+# Fraction of the typical mesh edge length a simplified display line may stray from the snapped nodes.
+DISPLAY_TOLERANCE_FACTOR = 0.25
+
+
+def _segment_distances(points, start, end):
+    """
+    Get the distance in the xy plane of points from a line segment.
+
+    Args:
+        points (:obj:`numpy.ndarray`): The (n, 2) point locations.
+        start (:obj:`numpy.ndarray`): The segment start location.
+        end (:obj:`numpy.ndarray`): The segment end location.
+
+    Returns:
+        (:obj:`numpy.ndarray`): The distance of each point from the segment.
+    """
+    direction = end - start
+    length_squared = float(np.dot(direction, direction))
+    offsets = points - start
+    if length_squared == 0.0:
+        return np.hypot(offsets[:, 0], offsets[:, 1])
+    t = np.clip(offsets @ direction / length_squared, 0.0, 1.0)
+    nearest = offsets - t[:, np.newaxis] * direction
+    return np.hypot(nearest[:, 0], nearest[:, 1])
+
+
+def simplify_polyline(locations, tolerance):
+    """
+    Remove points of a polyline that are within a tolerance of the simplified line (Douglas-Peucker).
+
+    Args:
+        locations (:obj:`numpy.ndarray`): The (n, 3) locations of the polyline.
+        tolerance (float): The largest distance in the xy plane a removed point may be from the simplified line.
+
+    Returns:
+        (:obj:`numpy.ndarray`): The locations of the kept points, always including the first and last.
+    """
+    locations = np.asarray(locations, dtype=np.float64).reshape(-1, 3)
+    num_points = len(locations)
+    if num_points < 3 or tolerance <= 0.0:
+        return locations
+    xy = locations[:, :2]
+    keep = np.zeros(num_points, dtype=bool)
+    keep[0] = keep[-1] = True
+    stack = [(0, num_points - 1)]
+    while stack:
+        first, last = stack.pop()
+        if last - first < 2:
+            continue
+        distances = _segment_distances(xy[first + 1:last], xy[first], xy[last])
+        farthest = int(np.argmax(distances))
+        if distances[farthest] > tolerance:
+            split = first + 1 + farthest
+            keep[split] = True
+            stack.append((first, split))
+            stack.append((split, last))
+    return locations[keep]
@@ -0,0 +1,243 @@
+"""Snap results of coverage features cached between mapping runs."""
+# 1. Standard python modules
+import hashlib
+import os
+
+# 2. Third party modules
+import numpy as np
+
+# 3. Aquaveo modules
+
+# 4. Local modules
+
+__copyright__ = "(C) Copyright Aquaveo 2020"
+__license__ = "All rights reserved"
+
+
+SNAP_CACHE_FILE = 'snap_cache.npz'
+SNAPPER_VERSION = 2  # Increment when snapping changes, so features snapped the old way are snapped again.
+
+
+def _hash_arrays(arrays):
+    """
+    Get a fingerprint of a sequence of arrays.
+
+    Args:
+        arrays (:obj:`list`): The arrays (or array-like sequences) to hash.
+
+    Returns:
+        (str): Hex digest of the array contents.
+    """
+    hasher = hashlib.blake2b(digest_size=16)
+    for array in arrays:
+        array = np.ascontiguousarray(array)
+        hasher.update(str(array.shape).encode())
+        hasher.update(array.tobytes())
+    return hasher.hexdigest()
+
+
+def arc_locations(arc):
+    """
+    Get the coordinates of an arc's start node, vertices and end node.
+
+    Args:
+        arc (:obj:`data_objects.parameters.Arc`): The arc.
+
+    Returns:
+        (:obj:`list`): The [x, y, z] locations of the arc, in order.
+    """
+    points = [arc.get_start_node()] + list(arc.get_vertices()) + [arc.get_end_node()]
+    return [[point.get_x(), point.get_y(), point.get_z()] for point in points]
+
+
+def grid_fingerprint(locations, cellstream):
+    """
+    Get a fingerprint of a grid's node locations and cell definitions.
+
+    Args:
+        locations (:obj:`numpy.ndarray`): The grid node locations.
+        cellstream (:obj:`numpy.ndarray`): The grid cell stream.
+
+    Returns:
+        (str): The grid fingerprint.
+    """
+    return _hash_arrays([np.asarray(locations, dtype=np.float64), np.asarray(cellstream, dtype=np.int64)])
+
+
+def arc_fingerprint(arc):
+    """
+    Get a fingerprint of an arc's geometry.
+
+    Args:
+        arc (:obj:`data_objects.parameters.Arc`): The arc.
+
+    Returns:
+        (str): The arc fingerprint.
+    """
+    return _hash_arrays([np.asarray(arc_locations(arc), dtype=np.float64)])
+
+
+def polygon_fingerprint(polygon):
+    """
+    Get a fingerprint of a polygon's outer and inner boundary geometry.
+
+    Args:
+        polygon (:obj:`data_objects.parameters.Polygon`): The polygon.
+
+    Returns:
+        (str): The polygon fingerprint.
+    """
+    rings = [polygon.get_arcs()] + list(polygon.get_interior_arcs())
+    arrays = []
+    for ring in rings:
+        for arc in ring:
+            arrays.append(np.asarray(arc_locations(arc), dtype=np.float64))
+        arrays.append(np.empty((0, 3)))  # Separate the rings.
+    return _hash_arrays(arrays)
+
+
+def polygons_fingerprint(polygon_ids, polygon_fingerprints, comp_ids):
+    """
+    Get a fingerprint of the geometry and component ids of all the polygons of a coverage.
+
+    Args:
+        polygon_ids (:obj:`list`): The polygon ids.
+        polygon_fingerprints (:obj:`list`): The geometry fingerprint of each polygon.
+        comp_ids (:obj:`list`): The component id of each polygon.
+
+    Returns:
+        (str): The fingerprint.
+    """
+    polygon_ids = np.asarray(polygon_ids, dtype=np.int64)
+    order = np.argsort(polygon_ids, kind='stable')
+    return _hash_arrays([
+        polygon_ids[order],
+        np.asarray(comp_ids, dtype=np.int64)[order],
+        np.asarray(polygon_fingerprints, dtype='U32')[order],
+    ])
+
+
+def polygon_materials(polygon_ids, id_map):
+    """
+    Get the material of each polygon, for mapping the polygons and for storing the cell materials on import.
+
+    Args:
+        polygon_ids (:obj:`list`): The polygon ids.
+        id_map (:obj:`FeatureIdMap`): The material id of the polygons with a material.
+
+    Returns:
+        (:obj:`list` of int): The material id of each polygon. Polygons without a material (or with a negative one)
+        are in the unassigned material, 0.
+    """
+    return id_map.get_comp_ids(polygon_ids, 0).tolist()
+
+
+class SnapCache:
+    """Grid ids snapped to each feature of a coverage, keyed by feature id and geometry fingerprint."""
+
+    def __init__(self, filename, grid_fingerprint):
+        """
+        Constructor.
+
+        Args:
+            filename (str): The file the cache is stored in.
+            grid_fingerprint (str): Fingerprint of the grid the features are snapped to. Anything cached for a
+                different grid, or by a different SNAPPER_VERSION, is discarded.
+        """
+        self._filename = filename
+        self._grid_fingerprint = grid_fingerprint
+        self._features = {}  # {feature_id: (fingerprint, ids, locations)}
+        self._modified = False
+        self._load()
+
+    def _load(self):
+        """Read the cache file if it exists and belongs to the current grid."""
+        if not os.path.isfile(self._filename):
+            return
+        try:
+            with np.load(self._filename, allow_pickle=False) as npz:
+                if str(npz['grid_fingerprint']) != self._grid_fingerprint:
+                    return
+                snapper_version = int(npz['snapper_version']) if 'snapper_version' in npz else 1
+                if snapper_version != SNAPPER_VERSION:
+                    return
+                feature_ids = npz['feature_ids']
+                fingerprints = npz['fingerprints']
+                offsets = npz['offsets']
+                ids = npz['ids']
+                locations = npz['locations'] if 'locations' in npz else None
+        except (OSError, KeyError, ValueError):
+            return  # An unreadable cache is the same as no cache.
+        for i, feature_id in enumerate(feature_ids.tolist()):
+            start, end = offsets[i], offsets[i + 1]
+            feature_locs = locations[start:end] if locations is not None else None
+            self._features[feature_id] = (str(fingerprints[i]), ids[start:end], feature_locs)
+
+    def get(self, feature_id, fingerprint):
+        """
+        Get the snapped grid ids of a feature if its geometry has not changed.
+
+        Args:
+            feature_id (int): The feature id.
+            fingerprint (str): The current geometry fingerprint of the feature.
+
+        Returns:
+            (:obj:`tuple`): The snapped ids and locations (None if not cached), or None if the feature was added or
+            modified since the cache was written.
+        """
+        cached = self._features.get(feature_id)
+        if cached is None or cached[0] != fingerprint:
+            return None
+        return cached[1], cached[2]
+
+    def set(self, feature_id, fingerprint, ids, locations=None):
+        """
+        Store the snapped grid ids of a feature.
+
+        Args:
+            feature_id (int): The feature id.
+            fingerprint (str): The geometry fingerprint of the feature.
+            ids (:obj:`list`): The grid ids snapped to the feature.
+            locations (:obj:`list`): The locations of the snapped grid ids, if they should be kept.
+        """
+        ids = np.asarray(ids, dtype=np.int64).reshape(-1)
+        if locations is not None:
+            locations = np.asarray(locations, dtype=np.float64).reshape(-1, 3)
+        self._features[feature_id] = (fingerprint, ids, locations)
+        self._modified = True
+
+    def save(self, feature_ids):
+        """
+        Write the cache, dropping features that no longer exist in the coverage.
+
+        Args:
+            feature_ids (:obj:`iterable`): Ids of all the features currently in the coverage.
+        """
+        live_ids = set(feature_ids)
+        removed = [feature_id for feature_id in self._features if feature_id not in live_ids]
+        for feature_id in removed:
+            del self._features[feature_id]
+        if not self._modified and not removed and os.path.isfile(self._filename):
+            return
+
+        keys = sorted(self._features)
+        entries = [self._features[key] for key in keys]
+        sizes = [len(entry[1]) for entry in entries]
+        offsets = np.zeros(len(entries) + 1, dtype=np.int64)
+        np.cumsum(sizes, out=offsets[1:])
+        arrays = {
+            'grid_fingerprint': np.array(self._grid_fingerprint),
+            'snapper_version': np.array(SNAPPER_VERSION),
+            'feature_ids': np.array(keys, dtype=np.int64),
+            'fingerprints': np.array([entry[0] for entry in entries], dtype='U32'),
+            'offsets': offsets,
+            'ids': np.concatenate([entry[1] for entry in entries]) if entries else np.empty(0, dtype=np.int64),
+        }
+        if entries and all(entry[2] is not None for entry in entries):
+            arrays['locations'] = np.concatenate([entry[2] for entry in entries])
+
+        temp_file = f'{self._filename}.tmp'
+        with open(temp_file, 'wb') as file:
+            np.savez(file, **arrays)
+        os.replace(temp_file, self._filename)
+        self._modified = False
@@ -0,0 +1,116 @@
+"""For testing."""
+
+# 1. Standard python libraries
+import os
+import tempfile
+import unittest
+
+# 2. Third party libraries
+
+# 3. Aquaveo libraries
+from xmscomponents.display.display_options_io import read_display_option_ids
+from xmsguipy.data.target_type import TargetType
+
+# 4. Local libraries
+from standard_interface_template.components.boundary_coverage_component import BoundaryCoverageComponent
+
+__copyright__ = "(C) Copyright Aquaveo 2020"
+__license__ = "All rights reserved"
+
+
+class BoundaryCoverageComponentTests(unittest.TestCase):
+    """Tests assigning component ids to boundary condition features."""
+
+    def setUp(self):
+        """Creates a boundary conditions coverage component with a display ids folder in a temporary folder."""
+        self._dir = tempfile.TemporaryDirectory()
+        comp_dir = os.path.join(self._dir.name, 'bc_comp_uuid')
+        self._id_dir = os.path.join(comp_dir, 'display_ids')
+        os.makedirs(self._id_dir)
+        self.component = BoundaryCoverageComponent(os.path.join(comp_dir, 'bc_comp.nc'))
+        self.component.cov_uuid = 'cov_uuid'
+
+    def tearDown(self):
+        """Removes the temporary folder."""
+        self.component.data.close()
+        self._dir.cleanup()
+
+    def _read_id_files(self):
+        """Returns the component ids in each display id file."""
+        return {
+            disp_name: read_display_option_ids(os.path.join(self._id_dir, f'{disp_name}.display_ids'))
+            for disp_name in ['A', 'B', 'C']
+        }
+
+    def _age_id_files(self):
+        """Sets the modified time of the display id files back, so a rewrite can be seen."""
+        for disp_name in ['A', 'B', 'C']:
+            os.utime(os.path.join(self._id_dir, f'{disp_name}.display_ids'), ns=(0, 0))
+
+    def _rewritten_id_files(self):
+        """Returns the display id files written since they were aged."""
+        return [
+            disp_name for disp_name in ['A', 'B', 'C']
+            if os.stat(os.path.join(self._id_dir, f'{disp_name}.display_ids')).st_mtime_ns != 0
+        ]
+
+    def test_update_component_ids(self):
+        """Tests that the ids are sent to XMS and can be looked up from comp_to_xms and the feature id map."""
+        self.component.update_component_ids(TargetType.arc, [4, 2, 9], [0, 0, 0])
+        comp_id = self.component.data.get_or_add_comp_id('B', 'x')
+        self.component.update_component_ids(TargetType.arc, [9, 5], comp_id)
+
+        self.assertEqual(self.component.update_ids['cov_uuid'][TargetType.arc], {2: 0, 4: 0, 5: comp_id, 9: comp_id})
+        comp_to_xms = self.component.comp_to_xms['cov_uuid'][TargetType.arc]
+        self.assertEqual({key: sorted(ids) for key, ids in comp_to_xms.items()}, {0: [2, 4], comp_id: [5, 9]})
+        id_map = self.component.get_feature_id_map(TargetType.arc)
+        self.assertEqual(id_map.get_comp_ids([2, 4, 5, 9, 7], -1).tolist(), [0, 0, comp_id, comp_id, -1])
+        self.assertNotIn(TargetType.point, self.component.comp_to_xms['cov_uuid'])
+
+    def test_update_component_id(self):
+        """Tests that setting the id of one feature updates the loaded lookup arrays."""
+        self.component.update_component_ids(TargetType.point, [1, 2], [0, 0])
+        self.component.get_feature_id_map(TargetType.point)
+        comp_id = self.component.data.get_or_add_comp_id('C', 'y')
+        self.component.update_component_id(TargetType.point, 2, comp_id)
+        self.assertEqual(self.component.get_feature_id_map(TargetType.point).get_comp_ids([1, 2]).tolist(),
+                         [0, comp_id])
+        self.assertEqual(self.component.update_ids['cov_uuid'][TargetType.point], {1: 0, 2: comp_id})
+
+    def test_update_writes_id_files(self):
+        """Tests that assigning a new component id writes the display id file of its display option."""
+        self.component.update_component_ids(TargetType.arc, [1], 0)
+        self.assertEqual(self._read_id_files(), {'A': [0], 'B': [], 'C': []})
+
+        comp_id = self.component.data.get_or_add_comp_id('B', 'x')
+        self.component.update_component_ids(TargetType.arc, [1, 2], comp_id)
+        self.assertEqual(self._read_id_files(), {'A': [0], 'B': [comp_id], 'C': []})
+
+    def test_existing_id_leaves_id_files(self):
+        """Tests that assigning a component id already in the display id files does not write them."""
+        comp_id = self.component.data.get_or_add_comp_id('B', 'x')
+        self.component.update_id_files()
+        self._age_id_files()
+        self.assertEqual(self.component.data.get_or_add_comp_id('B', 'x'), comp_id)
+        self.component.update_component_ids(TargetType.arc, [1, 2], comp_id)
+        self.component.update_id_files([])
+        self.assertEqual(self._rewritten_id_files(), [])
+
+    def test_new_id_rewrites_its_id_file(self):
+        """Tests that only the display id file of a new component id's display option is written."""
+        self.component.data.get_or_add_comp_id('B', 'x')
+        self.component.update_id_files()
+        self._age_id_files()
+        comp_id = self.component.data.get_or_add_comp_id('C', 'y')
+        self.component.update_id_files(['C'])
+        self.assertEqual(self._rewritten_id_files(), ['C'])
+        self.assertEqual(self._read_id_files(), {'A': [0], 'B': [1], 'C': [comp_id]})
+
+    def test_missing_id_file_written(self):
+        """Tests that a display id file that does not exist is written, even if its display option did not change."""
+        self.component.update_id_files()
+        self._age_id_files()
+        os.remove(os.path.join(self._id_dir, 'B.display_ids'))
+        self.component.update_id_files(['C'])
+        self.assertEqual(self._rewritten_id_files(), ['B', 'C'])
+        self.assertEqual(self._read_id_files(), {'A': [0], 'B': [], 'C': []})
@@ -0,0 +1,90 @@
+"""For testing."""
+
+# 1. Standard python libraries
+import os
+import tempfile
+import unittest
+
+# 2. Third party libraries
+
+# 3. Aquaveo libraries
+
+# 4. Local libraries
+from standard_interface_template.components.display_id_files import (
+    display_id_file, display_options_missing_ids, display_options_to_write, material_id_file,
+    material_id_files_to_update
+)
+
+__copyright__ = "(C) Copyright Aquaveo 2020"
+__license__ = "All rights reserved"
+
+
+class DisplayIdFilesTests(unittest.TestCase):
+    """Tests for choosing the display id files that must be written."""
+
+    def setUp(self):
+        """Creates a display ids folder with the files of display options A and B, and of material 0."""
+        self._dir = tempfile.TemporaryDirectory()
+        self.id_dir = self._dir.name
+        for filename in [display_id_file(self.id_dir, 'A'), display_id_file(self.id_dir, 'B'),
+                         material_id_file(self.id_dir, 0)]:
+            with open(filename, 'w'):
+                pass
+
+    def tearDown(self):
+        """Removes the temporary folder."""
+        self._dir.cleanup()
+
+    def test_file_names(self):
+        """Tests the names of the display id files."""
+        self.assertEqual(display_id_file('ids', 'C'), os.path.join('ids', 'C.display_ids'))
+        self.assertEqual(material_id_file('ids', 3), os.path.join('ids', 'material_3.matid'))
+
+    def test_unchanged_display_options(self):
+        """Tests that only the display options without a file are written when none changed."""
+        self.assertEqual(display_options_to_write(self.id_dir, ['A', 'B', 'C'], []), ['C'])
+
+    def test_changed_display_option(self):
+        """Tests that a changed display option is written, along with those without a file."""
+        self.assertEqual(display_options_to_write(self.id_dir, ['A', 'B', 'C'], ['B']), ['B', 'C'])
+        self.assertEqual(display_options_to_write(self.id_dir, ['A', 'B', 'C'], None), ['A', 'B', 'C'])
+
+    def test_missing_display_option_file(self):
+        """Tests that a removed file is written again."""
+        os.remove(display_id_file(self.id_dir, 'A'))
+        self.assertEqual(display_options_to_write(self.id_dir, ['A', 'B'], ['B']), ['A', 'B'])
+
+    def test_existing_id_not_missing(self):
+        """Tests that assigning component ids already in their files writes nothing, and reads only their files."""
+        listed = {'A': {0, 2}, 'B': {1}}
+        read = []
+
+        def listed_ids(display_option):
+            read.append(display_option)
+            return listed[display_option]
+
+        self.assertEqual(display_options_missing_ids([0, 2], {0: 'A', 2: 'A'}, listed_ids), [])
+        self.assertEqual(set(read), {'A'})
+
+    def test_new_id_missing(self):
+        """Tests that only the display option of a new component id is written."""
+        listed = {'A': {0, 2}, 'B': {1}, 'C': set()}
+        display_option_of = {1: 'B', 3: 'C', 4: None}
+        self.assertEqual(display_options_missing_ids([1, 3, 4], display_option_of, listed.get), ['C'])
+
+    def test_existing_material_untouched(self):
+        """Tests that an existing material with a file is not written."""
+        self.assertEqual(material_id_files_to_update(self.id_dir, [0], [0]), ([], []))
+
+    def test_added_material_written(self):
+        """Tests that only an added material is written."""
+        self.assertEqual(material_id_files_to_update(self.id_dir, [0], [0, 3]), ([3], []))
+
+    def test_missing_material_file_written(self):
+        """Tests that an existing material without a file is written."""
+        os.remove(material_id_file(self.id_dir, 0))
+        self.assertEqual(material_id_files_to_update(self.id_dir, [0, 3], [0, 3]), ([0, 3], []))
+
+    def test_deleted_material_removed(self):
+        """Tests that a deleted material is returned for its file to be removed, and negative ids are skipped."""
+        self.assertEqual(material_id_files_to_update(self.id_dir, [0, 3, 5], [0, 5, -1]), ([5], [3]))
@@ -0,0 +1,105 @@
+"""For testing."""
+
+# 1. Standard python libraries
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+# 2. Third party libraries
+
+# 3. Aquaveo libraries
+
+# 4. Local libraries
+from standard_interface_template.components import display_options_cache
+from standard_interface_template.components.display_options_cache import (
+    read_category_list, read_display_options, write_display_options
+)
+
+__copyright__ = "(C) Copyright Aquaveo 2020"
+__license__ = "All rights reserved"
+
+
+class DisplayOptionsCacheTests(unittest.TestCase):
+    """Tests for parsing display options files only when they change."""
+
+    def setUp(self):
+        """Copies the default boundary conditions display options to a temporary folder, and counts parses."""
+        self._dir = tempfile.TemporaryDirectory()
+        self._filename = os.path.join(self._dir.name, 'display_options.json')
+        default_file = os.path.join(os.path.dirname(display_options_cache.__file__), os.pardir, 'gui', 'resources',
+                                    'default_data', 'default_boundary_coverage_display_options.json')
+        shutil.copyfile(default_file, self._filename)
+        display_options_cache._cache.clear()
+
+        self._read_json = display_options_cache.read_display_options_from_json
+        self.parsed = []
+
+        def read_json(filename):
+            self.parsed.append(filename)
+            return self._read_json(filename)
+
+        display_options_cache.read_display_options_from_json = read_json
+
+    def tearDown(self):
+        """Restores the parser and removes the temporary folder."""
+        display_options_cache.read_display_options_from_json = self._read_json
+        display_options_cache._cache.clear()
+        self._dir.cleanup()
+
+    def _edit_file(self, label_on):
+        """Rewrites the file with a different label setting for the first category."""
+        with open(self._filename) as file:
+            json_dict = json.load(file)
+        json_dict['categories'][0]['label_on'] = label_on
+        with open(self._filename, 'w') as file:
+            json.dump(json_dict, file)
+
+    def test_parsed_once(self):
+        """Tests that an unchanged file is only parsed the first time it is read."""
+        first = read_display_options(self._filename)
+        second = read_display_options(self._filename)
+        self.assertEqual(first, second)
+        self.assertEqual(len(self.parsed), 1)
+
+    def test_changed_size_reparsed(self):
+        """Tests that a file is parsed again when its size changes."""
+        self.assertEqual(read_display_options(self._filename)['categories'][0]['label_on'], 1)
+        self._edit_file(label_on=10)
+        self.assertEqual(read_display_options(self._filename)['categories'][0]['label_on'], 10)
+        self.assertEqual(len(self.parsed), 2)
+
+    def test_changed_modified_time_reparsed(self):
+        """Tests that a file is parsed again when its modified time changes, even if its size does not."""
+        self._edit_file(label_on=1)
+        read_display_options(self._filename)
+        size = os.path.getsize(self._filename)
+        self._edit_file(label_on=0)
+        self.assertEqual(os.path.getsize(self._filename), size)
+        os.utime(self._filename, ns=(0, 0))  # Not the time it was cached at, even on file systems with coarse times.
+        self.assertEqual(read_display_options(self._filename)['categories'][0]['label_on'], 0)
+        self.assertEqual(len(self.parsed), 2)
+
+    def test_read_returns_copy(self):
+        """Tests that editing what was read does not change what is read next."""
+        json_dict = read_display_options(self._filename)
+        json_dict['categories'][0]['options']['red'] = 99
+        json_dict['categories'].append({})
+        json_dict['is_ids'] = 0
+        reread = read_display_options(self._filename)
+        self.assertIsNot(reread, json_dict)
+        self.assertEqual(reread['categories'][0]['options']['red'], 0)
+        self.assertEqual(len(reread['categories']), len(json_dict['categories']) - 1)
+        self.assertEqual(reread['is_ids'], 1)
+        self.assertEqual(len(self.parsed), 1)
+
+    def test_write_updates_cache(self):
+        """Tests that a written file is read back from the cache, with what was written."""
+        categories = read_category_list(self._filename)
+        categories.categories[0].description = 'Inflow'
+        write_display_options(self._filename, categories)
+        num_parsed = len(self.parsed)
+        self.assertEqual(read_display_options(self._filename)['categories'][0]['description'], 'Inflow')
+        self.assertEqual(read_category_list(self._filename).uuid, categories.uuid)
+        self.assertEqual(len(self.parsed), num_parsed)
@@ -0,0 +1,60 @@
+"""For testing."""
+
+# 1. Standard python libraries
+import unittest
+
+# 2. Third party libraries
+
+# 3. Aquaveo libraries
+
+# 4. Local libraries
+from standard_interface_template.components.feature_id_map import FeatureIdMap, move_features
+
+__copyright__ = "(C) Copyright Aquaveo 2020"
+__license__ = "All rights reserved"
+
+
+class FeatureIdMapTests(unittest.TestCase):
+    """Tests looking up the component ids of coverage features."""
+
+    def test_get_comp_ids(self):
+        """Tests that features without a component id get the default."""
+        id_map = FeatureIdMap.from_comp_to_xms({3: [10, 2], 5: [7], -1: [4]})
+        self.assertEqual(id_map.att_ids.tolist(), [2, 4, 7, 10])
+        self.assertEqual(id_map.get_comp_ids([7, 10, 2, 4, 99, 0]).tolist(), [5, 3, 3, 0, 0, 0])
+        self.assertEqual(id_map.get_comp_ids([99, 7], default=-1).tolist(), [-1, 5])
+        self.assertEqual(id_map.get_comp_id(2), 3)
+
+    def test_empty(self):
+        """Tests lookups when no features have component ids."""
+        id_map = FeatureIdMap.from_comp_to_xms({})
+        self.assertEqual(id_map.get_comp_ids([1, 2]).tolist(), [0, 0])
+
+    def test_to_comp_to_xms(self):
+        """Tests that the component id to XMS feature ids dict is rebuilt from the arrays."""
+        comp_to_xms = {3: [2, 10], 5: [7], -1: [4]}
+        self.assertEqual(FeatureIdMap.from_comp_to_xms(comp_to_xms).to_comp_to_xms(), comp_to_xms)
+        self.assertEqual(FeatureIdMap([], []).to_comp_to_xms(), {})
+
+    def test_update(self):
+        """Tests setting the component ids of existing and new features."""
+        id_map = FeatureIdMap.from_comp_to_xms({3: [2, 10], 5: [7]})
+        att_ids = id_map.att_ids
+        id_map.update([10, 2], [5, 4])
+        self.assertIs(id_map.att_ids, att_ids)  # Existing features are changed in place.
+        self.assertEqual(id_map.to_comp_to_xms(), {4: [2], 5: [7, 10]})
+        id_map.update([10, 8, 8], [3, 1, 6])
+        self.assertEqual(id_map.to_comp_to_xms(), {3: [10], 4: [2], 5: [7], 6: [8]})
+        id_map.update([], [])
+        self.assertEqual(id_map.att_ids.tolist(), [2, 7, 8, 10])
+
+    def test_move_features(self):
+        """Tests moving features between the component id lists, and adding features not in them yet."""
+        comp_to_xms = {3: [2, 10], 5: [7]}
+        comp_of_att = {2: 3, 10: 3, 7: 5}
+        move_features(comp_to_xms, comp_of_att, [10, 8, 7, 8], [5, 1, 5, 4])
+        self.assertEqual(comp_to_xms, {3: [2], 4: [8], 5: [7, 10]})
+        self.assertEqual(comp_of_att, {2: 3, 7: 5, 8: 4, 10: 5})
+        move_features(comp_to_xms, comp_of_att, [2], [4])
+        self.assertEqual(comp_to_xms, {4: [8, 2], 5: [7, 10]})
+        self.assertEqual(FeatureIdMap.from_comp_to_xms(comp_to_xms).to_comp_to_xms(), {4: [2, 8], 5: [7, 10]})
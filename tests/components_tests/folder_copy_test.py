@@ -0,0 +1,70 @@
+"""For testing."""
+
+# 1. Standard python libraries
+import os
+import tempfile
+import unittest
+
+# 2. Third party libraries
+
+# 3. Aquaveo libraries
+
+# 4. Local libraries
+from standard_interface_template.components import folder_copy
+from standard_interface_template.components.folder_copy import copy_folder
+
+__copyright__ = "(C) Copyright Aquaveo 2020"
+__license__ = "All rights reserved"
+
+
+class FolderCopyTests(unittest.TestCase):
+    """Tests for copying a component folder to a save location."""
+
+    def setUp(self):
+        """Creates a component folder with a subfolder."""
+        self._dir = tempfile.TemporaryDirectory()
+        self._src = os.path.join(self._dir.name, 'src')
+        self._dst = os.path.join(self._dir.name, 'dst')
+        os.makedirs(os.path.join(self._src, 'display_ids'))
+        self._write('main.nc', b'x' * 1000)
+        self._write(os.path.join('display_ids', 'A.display_ids'), b'ids')
+
+    def tearDown(self):
+        """Removes the folders."""
+        self._dir.cleanup()
+
+    def _write(self, name, data):
+        """Writes a file in the source folder."""
+        with open(os.path.join(self._src, name), 'wb') as file:
+            file.write(data)
+
+    def _read(self, name):
+        """Reads a file in the destination folder."""
+        with open(os.path.join(self._dst, name), 'rb') as file:
+            return file.read()
+
+    def test_copy_and_skip(self):
+        """Test that only new and changed files are copied again."""
+        copied = copy_folder(self._src, self._dst)
+        self.assertEqual(len(copied), 2)
+        self.assertEqual(self._read(os.path.join('display_ids', 'A.display_ids')), b'ids')
+        self.assertEqual(copy_folder(self._src, self._dst), [])
+
+        self._write('main.nc', b'y' * 1000)
+        self._write('new.json', b'{}')
+        copied = copy_folder(self._src, self._dst)
+        self.assertEqual(sorted(os.path.basename(file) for file in copied), ['main.nc', 'new.json'])
+        self.assertEqual(self._read('main.nc'), b'y' * 1000)
+        self.assertFalse(any(file.endswith('.partial') for file in os.listdir(self._dst)))
+
+    def test_parallel_large_files(self):
+        """Test that large files are copied."""
+        old_size = folder_copy.LARGE_FILE_BYTES
+        folder_copy.LARGE_FILE_BYTES = 100
+        try:
+            self._write('big.nc', bytes(range(256)) * 1000)
+            self.assertEqual(len(copy_folder(self._src, self._dst)), 3)
+        finally:
+            folder_copy.LARGE_FILE_BYTES = old_size
+        self.assertEqual(self._read('big.nc'), bytes(range(256)) * 1000)
+        self.assertEqual(self._read('main.nc'), b'x' * 1000)
@@ -0,0 +1,65 @@
+"""For testing."""
+
+# 1. Standard python libraries
+import os
+import tempfile
+import unittest
+
+# 2. Third party libraries
+
+# 3. Aquaveo libraries
+from xmscomponents.display.display_options_io import read_display_option_ids
+
+# 4. Local libraries
+from standard_interface_template.components.materials_coverage_component import MaterialsCoverageComponent
+
+__copyright__ = "(C) Copyright Aquaveo 2020"
+__license__ = "All rights reserved"
+
+
+class MaterialsCoverageComponentTests(unittest.TestCase):
+    """Tests writing the display id files of the materials."""
+
+    def setUp(self):
+        """Creates a materials coverage component with the file of the unassigned material."""
+        self._dir = tempfile.TemporaryDirectory()
+        comp_dir = os.path.join(self._dir.name, 'mat_comp_uuid')
+        self._id_dir = os.path.join(comp_dir, 'display_ids')
+        os.makedirs(self._id_dir)
+        self.component = MaterialsCoverageComponent(os.path.join(comp_dir, 'mat_comp.nc'))
+        self.assertEqual(self.component.update_display_id_files([], [0]), [])
+        os.utime(self._id_file(0), ns=(0, 0))  # So a rewrite can be seen.
+
+    def tearDown(self):
+        """Removes the temporary folder."""
+        self.component.data.close()
+        self._dir.cleanup()
+
+    def _id_file(self, material_id):
+        """Returns the display id file of a material."""
+        return os.path.join(self._id_dir, f'material_{material_id}.matid')
+
+    def test_existing_material_untouched(self):
+        """Tests that the file of a material that was not added is not written."""
+        self.assertEqual(self.component.update_display_id_files([0], [0]), [])
+        self.assertEqual(os.stat(self._id_file(0)).st_mtime_ns, 0)
+
+    def test_added_material_written(self):
+        """Tests that only the file of an added material is written."""
+        self.assertEqual(self.component.update_display_id_files([0], [0, 3]), [])
+        self.assertEqual(read_display_option_ids(self._id_file(3)), [3])
+        self.assertEqual(os.stat(self._id_file(0)).st_mtime_ns, 0)
+
+    def test_missing_file_written(self):
+        """Tests that the file of an existing material is written if it is missing."""
+        os.remove(self._id_file(0))
+        self.component.update_display_id_files([0], [0])
+        self.assertEqual(read_display_option_ids(self._id_file(0)), [0])
+
+    def test_deleted_material_removed(self):
+        """Tests that the file of a deleted material is removed, and the material returned."""
+        self.component.update_display_id_files([0], [0, 3])
+        self.assertEqual(self.component.update_display_id_files([0, 3], [0]), [3])
+        self.assertFalse(os.path.isfile(self._id_file(3)))
+        self.assertEqual(os.stat(self._id_file(0)).st_mtime_ns, 0)
+        self.assertEqual(sorted(os.listdir(self._id_dir)), ['material_0.matid'])
@@ -0,0 +1,80 @@
+"""For testing."""
+
+# 1. Standard python libraries
+import unittest
+
+# 2. Third party libraries
+
+# 3. Aquaveo libraries
+
+# 4. Local libraries
+from standard_interface_template.components.query_session import QuerySession
+
+__copyright__ = "(C) Copyright Aquaveo 2020"
+__license__ = "All rights reserved"
+
+
+class RecordingQuery:
+    """Query that records its calls and answers gets with the items selected so far."""
+
+    def __init__(self):
+        """Constructor."""
+        self.calls = []
+        self._selected = []
+
+    def get_context(self):
+        """Gets the current context."""
+        self.calls.append('get_context')
+        return object()
+
+    def set_context(self, context):
+        """Sets the current context."""
+        self.calls.append('set_context')
+        self._selected = []
+
+    def select(self, item):
+        """Selects an item."""
+        self.calls.append('select')
+        self._selected.append(item)
+
+    def get(self, *args):
+        """Gets values."""
+        self.calls.append('get')
+        return {args[0] if args else 'none': list(self._selected)}
+
+    def send(self):
+        """Sends the build."""
+        return 'sent'
+
+
+class QuerySessionTests(unittest.TestCase):
+    """Tests memoizing and counting the round trips of a query."""
+
+    def test_memoize_get(self):
+        """Tests that repeating a get from the same named context and selections does not go to XMS."""
+        query = RecordingQuery()
+        session = QuerySession(query)
+        start = session.get_context()
+        session.name_context(start, QuerySession.START_CONTEXT)
+        for _ in range(2):
+            session.set_context(start)
+            session.select('Parent')
+            self.assertEqual(session.get('uuid'), {'uuid': ['Parent']})
+        self.assertEqual(query.calls.count('get'), 1)
+        self.assertEqual(session.memoized, 1)
+        session.get_uncached('uuid')
+        self.assertEqual(query.calls.count('get'), 2)
+        self.assertEqual(session.stats['select'][0], 2)
+        self.assertEqual(session.round_trips, len(query.calls))
+        self.assertEqual(session.send(), 'sent')
+
+    def test_unnamed_context(self):
+        """Tests that gets are not memoized after setting a context that was not named."""
+        query = RecordingQuery()
+        session = QuerySession(query)
+        other = session.get_context()
+        for _ in range(2):
+            session.set_context(other)
+            session.get()
+        self.assertEqual(query.calls.count('get'), 2)
+        self.assertEqual(session.memoized, 0)
@@ -0,0 +1,94 @@
+"""For testing."""
+
+# 1. Standard python libraries
+import os
+import tempfile
+import unittest
+
+# 2. Third party libraries
+import pandas as pd
+import xarray as xr
+
+# 3. Aquaveo libraries
+
+# 4. Local libraries
+from standard_interface_template.data.chunked_table import (
+    append_table_rows, decode_strings, encode_strings, table_fingerprint, write_table
+)
+
+__copyright__ = "(C) Copyright Aquaveo 2020"
+__license__ = "All rights reserved"
+
+
+def _table(comp_ids, options):
+    """Returns a table like the boundary conditions coverage data."""
+    return pd.DataFrame({'comp_id': comp_ids, 'user_option': options}).to_xarray()
+
+
+class ChunkedTableTests(unittest.TestCase):
+    """Tests for appending rows to a stored table."""
+
+    def setUp(self):
+        """Writes a two row table to a temporary file."""
+        self._dir = tempfile.TemporaryDirectory()
+        self._filename = os.path.join(self._dir.name, 'data.nc')
+        xr.Dataset().to_netcdf(self._filename, group='info', mode='w')
+        write_table(self._filename, 'cov_data', _table([0, 1], ['A', 'B']))
+
+    def tearDown(self):
+        """Removes the temporary file."""
+        self._dir.cleanup()
+
+    def _read(self):
+        """Returns the stored table."""
+        with xr.open_dataset(self._filename, group='cov_data') as dataset:
+            return dataset.load()
+
+    def test_append(self):
+        """Test that only the new rows are added."""
+        table = xr.concat([_table([0, 1], ['A', 'B']), _table([2, 3], ['C', 'é'])], 'index')
+        self.assertTrue(append_table_rows(self._filename, 'cov_data', table, {'index': 2}))
+        stored = self._read()
+        self.assertEqual(stored.comp_id.values.tolist(), [0, 1, 2, 3])
+        self.assertEqual(stored.user_option.values.tolist(), ['A', 'B', 'C', 'é'])
+
+    def test_stale_row_count(self):
+        """Test that nothing is appended when the file does not have the expected rows."""
+        table = _table([0, 1, 2], ['A', 'B', 'C'])
+        self.assertFalse(append_table_rows(self._filename, 'cov_data', table, {'index': 1}))
+        self.assertEqual(self._read().comp_id.values.tolist(), [0, 1])
+
+    def test_schema_change(self):
+        """Test that nothing is appended when the columns changed."""
+        table = _table([0, 1, 2], ['A', 'B', 'C']).assign(user_text=('index', ['a', 'b', 'c']))
+        self.assertFalse(append_table_rows(self._filename, 'cov_data', table, {'index': 2}))
+        self.assertFalse(append_table_rows(self._filename, 'missing', table, {'index': 2}))
+        self.assertEqual(self._read().comp_id.values.tolist(), [0, 1])
+
+    def test_encoded_strings(self):
+        """Test that encoded columns round trip and new strings are appended to their table."""
+        encoded, tables = encode_strings(_table([0, 1, 2], ['B', 'A', 'B']), ['user_option'])
+        self.assertEqual(encoded.user_option.values.tolist(), [0, 1, 0])
+        self.assertEqual(tables, {'user_option': ['B', 'A']})
+        write_table(self._filename, 'encoded', encoded)
+
+        table = _table([0, 1, 2, 3, 4], ['B', 'A', 'B', 'C', 'A'])
+        appended, new_tables = encode_strings(table, ['user_option'], tables)
+        self.assertEqual(new_tables, {'user_option': ['B', 'A', 'C']})
+        self.assertTrue(append_table_rows(self._filename, 'encoded', appended, dict(encoded.sizes)))
+
+        with xr.open_dataset(self._filename, group='encoded') as dataset:
+            decoded, codes = decode_strings(dataset.load(), ['user_option'])
+        self.assertEqual(decoded.user_option.values.tolist(), ['B', 'A', 'B', 'C', 'A'])
+        self.assertNotIn('user_option_strings', decoded.variables)
+        self.assertEqual(codes['user_option'][0].tolist(), [0, 1, 0, 2, 1])
+        self.assertEqual(decode_strings(table, ['user_option'])[0].user_option.values.tolist(),
+                         ['B', 'A', 'B', 'C', 'A'])
+
+    def test_fingerprint(self):
+        """Test that the fingerprint survives a round trip and changes with the content."""
+        table = _table([0, 1], ['A', 'B'])
+        self.assertEqual(table_fingerprint(self._read()), table_fingerprint(table))
+        self.assertNotEqual(table_fingerprint(_table([0, 1], ['A', 'C'])), table_fingerprint(table))
+        self.assertNotEqual(table_fingerprint(_table([0, 1], ['AB', ''])), table_fingerprint(table))
+        self.assertNotEqual(table_fingerprint(_table([0, 2], ['A', 'B'])), table_fingerprint(table))
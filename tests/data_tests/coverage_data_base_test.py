@@ -0,0 +1,116 @@
+"""For testing."""
+
+# 1. Standard python libraries
+import os
+import tempfile
+import unittest
+
+# 2. Third party libraries
+import pandas as pd
+
+# 3. Aquaveo libraries
+
+# 4. Local libraries
+from standard_interface_template.data.boundary_coverage_data import BoundaryCoverageData
+from standard_interface_template.data.coverage_data_base import CoverageDataBase
+
+__copyright__ = "(C) Copyright Aquaveo 2020"
+__license__ = "All rights reserved"
+
+
+def _cov_data(comp_ids, options, texts):
+    """Returns coverage data with a row for each component id."""
+    return pd.DataFrame({'comp_id': comp_ids, 'user_option': options, 'user_text': texts}).to_xarray()
+
+
+class CoverageDataBaseTests(unittest.TestCase):
+    """Tests for the row index and column views of the coverage data."""
+
+    def setUp(self):
+        """Creates boundary conditions coverage data in a temporary folder."""
+        self._dir = tempfile.TemporaryDirectory()
+        self.data = BoundaryCoverageData(os.path.join(self._dir.name, 'bc_comp.nc'))
+        self.data.coverage_data = _cov_data([0, 3, 5, 3], ['A', 'B', 'C', 'A'], ['Default', 'x', 'y', 'z'])
+
+    def tearDown(self):
+        """Removes the temporary folder."""
+        self.data.close()
+        self._dir.cleanup()
+
+    def test_default_cov_data_is_abstract(self):
+        """Tests that a data class must say what its default coverage data is."""
+        class NoDefaults(CoverageDataBase):
+            pass
+
+        with self.assertRaises(TypeError):
+            NoDefaults(os.path.join(self._dir.name, 'no_defaults.nc'))
+
+    def test_column(self):
+        """Tests that a column is returned in row order, and the same array is returned until it changes."""
+        self.assertEqual(self.data.column('comp_id').tolist(), [0, 3, 5, 3])
+        self.assertEqual(self.data.column('user_option').tolist(), ['A', 'B', 'C', 'A'])
+        self.assertIs(self.data.column('comp_id'), self.data.column('comp_id'))
+
+    def test_row_of(self):
+        """Tests that an id gives its first row, and an unknown id gives None."""
+        self.assertEqual(self.data.row_of(0), 0)
+        self.assertEqual(self.data.row_of(3), 1)
+        self.assertEqual(self.data.row_of(5), 2)
+        self.assertIsNone(self.data.row_of(4))
+
+    def test_value(self):
+        """Tests getting a column value by id."""
+        self.assertEqual(self.data.value(5, 'user_option'), 'C')
+        self.assertEqual(self.data.value(3, 'user_text'), 'x')
+        self.assertIsNone(self.data.value(4, 'user_text'))
+        self.assertEqual(self.data.value(4, 'user_text', 'missing'), 'missing')
+
+    def test_setter_invalidates_views(self):
+        """Tests that replacing the coverage data throws away the index and column views built from the old data."""
+        self.assertEqual(self.data.row_of(5), 2)
+        self.assertEqual(self.data.column('user_option').tolist(), ['A', 'B', 'C', 'A'])
+        self.assertEqual(self.data.ids_where('user_option', 'A').tolist(), [0, 3])
+
+        self.data.coverage_data = _cov_data([0, 5], ['A', 'B'], ['Default', 'w'])
+        self.assertEqual(self.data.row_of(5), 1)
+        self.assertIsNone(self.data.row_of(3))
+        self.assertEqual(self.data.value(5, 'user_option'), 'B')
+        self.assertEqual(self.data.column('user_option').tolist(), ['A', 'B'])
+        self.assertEqual(self.data.ids_where('user_option', 'A').tolist(), [0])
+
+    def test_append_rows_invalidates_views(self):
+        """Tests that appended rows can be found by id."""
+        self.assertIsNone(self.data.row_of(7))
+        self.data.append_rows(_cov_data([7], ['B'], ['v']))
+        self.assertEqual(self.data.row_of(7), 4)
+        self.assertEqual(self.data.value(7, 'user_text'), 'v')
+        self.assertEqual(self.data.column('comp_id').tolist(), [0, 3, 5, 3, 7])
+
+    def test_getter_read_only(self):
+        """Tests that the coverage data returned by the getter cannot change the coverage data."""
+        with self.assertRaises(ValueError):
+            self.data.coverage_data['user_text'].values[1] = 'changed'
+        cov_data = self.data.coverage_data
+        cov_data['user_text'] = ('index', ['a', 'b', 'c', 'd'])
+        self.assertEqual(self.data.value(3, 'user_text'), 'x')
+        self.assertEqual(self.data.column('user_text').tolist(), ['Default', 'x', 'y', 'z'])
+
+    def test_changed_row_rewritten(self):
+        """Tests that a stored row changed through the setter is written on the next commit."""
+        self.data.commit()
+        self.data.append_rows(_cov_data([7], ['B'], ['v']))
+        df = self.data.coverage_data.to_dataframe().copy()
+        df.loc[1, 'user_text'] = 'changed'
+        self.data.coverage_data = df.to_xarray()
+        self.data.commit()
+
+        stored = BoundaryCoverageData(self.data._filename)
+        self.assertEqual(stored.column('user_text').tolist(), ['Default', 'changed', 'y', 'z', 'v'])
+        stored.close()
+
+    def test_compact(self):
+        """Tests that rows no feature uses are removed, keeping the default row and the component ids."""
+        self.assertEqual(self.data.compact({5}), 2)
+        self.assertEqual(self.data.column('comp_id').tolist(), [0, 5])
+        self.assertEqual(self.data.value(5, 'user_text'), 'y')
+        self.assertEqual(self.data.compact({5}), 0)
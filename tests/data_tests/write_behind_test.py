@@ -0,0 +1,124 @@
+"""For testing."""
+
+# 1. Standard python libraries
+import os
+import tempfile
+import threading
+import time
+import unittest
+
+# 2. Third party libraries
+import pandas as pd
+
+# 3. Aquaveo libraries
+
+# 4. Local libraries
+from standard_interface_template.data import write_behind
+from standard_interface_template.data.boundary_coverage_data import BoundaryCoverageData
+
+__copyright__ = "(C) Copyright Aquaveo 2020"
+__license__ = "All rights reserved"
+
+
+class BlockingCoverageData(BoundaryCoverageData):
+    """Coverage data whose commit waits to be released once it has started."""
+
+    def __init__(self, filename):
+        """
+        Initializes the data class.
+
+        Args:
+            filename (str): The name of the main file that data is stored in.
+        """
+        self.started = threading.Event()
+        self.release = threading.Event()
+        super().__init__(filename)
+
+    def _commit_coverage_data(self):
+        """Waits to be released before writing the coverage data."""
+        self.started.set()
+        self.release.wait(5.0)
+        super()._commit_coverage_data()
+
+
+class WriteBehindTests(unittest.TestCase):
+    """Tests for committing data classes from a background thread."""
+
+    def setUp(self):
+        """Creates a temporary folder and shortens the write behind delay."""
+        self._dir = tempfile.TemporaryDirectory()
+        self._filename = os.path.join(self._dir.name, 'bc_comp.nc')
+        self._delay = write_behind.WRITE_BEHIND_DELAY
+        write_behind.WRITE_BEHIND_DELAY = 0.05
+
+    def tearDown(self):
+        """Writes anything still pending, restores the delay and removes the temporary folder."""
+        write_behind.flush_pending()
+        write_behind.WRITE_BEHIND_DELAY = self._delay
+        self._dir.cleanup()
+
+    def _stored(self):
+        """Returns the revision and component ids in the file, as read by a new instance."""
+        data = BoundaryCoverageData(self._filename)
+        stored = data.revision, data.column('comp_id').tolist()
+        data.close()
+        return stored
+
+    def test_commits_coalesced(self):
+        """Tests that commits requested in quick succession are written once, after the delay."""
+        data = BoundaryCoverageData(self._filename)
+        for user_text in ['a', 'b', 'c']:
+            data.get_or_add_comp_id('B', user_text)
+            data.commit_later()
+        self.assertFalse(os.path.isfile(self._filename))
+        time.sleep(0.5)
+        self.assertEqual(self._stored(), (1, [0, 1, 2, 3]))
+
+    def test_flush(self):
+        """Tests that flush writes a pending commit now, and does nothing when none is pending."""
+        data = BoundaryCoverageData(self._filename)
+        data.get_or_add_comp_id('B', 'a')
+        data.commit_later()
+        data.flush()
+        self.assertEqual(self._stored(), (1, [0, 1]))
+        data.flush()
+        time.sleep(0.2)
+        self.assertEqual(self._stored(), (1, [0, 1]))
+
+    def test_new_instance_flushes_pending(self):
+        """Tests that a new instance of a file reads the commit another instance has not written yet."""
+        write_behind.WRITE_BEHIND_DELAY = 60.0
+        data = BoundaryCoverageData(self._filename)
+        data.info.attrs['cov_uuid'] = 'coverage'
+        data.get_or_add_comp_id('B', 'a')
+        data.commit_later()
+        other = BoundaryCoverageData(self._filename)
+        self.assertEqual(other.cov_uuid, 'coverage')
+        self.assertEqual(other.column('comp_id').tolist(), [0, 1])
+        self.assertEqual(other.revision, 1)
+        other.close()
+
+    def test_mutation_waits_for_commit(self):
+        """Tests that data changed while a commit is being written is not mixed into it, and is written next."""
+        data = BlockingCoverageData(self._filename)
+        data.get_or_add_comp_id('B', 'a')
+        data.commit_later()
+        flush_thread = threading.Thread(target=data.flush)
+        flush_thread.start()
+        self.assertTrue(data.started.wait(5.0))
+
+        def mutate():
+            data.append_rows(pd.DataFrame({'comp_id': [2], 'user_option': ['C'], 'user_text': ['b']}).to_xarray())
+
+        mutate_thread = threading.Thread(target=mutate)
+        mutate_thread.start()
+        mutate_thread.join(0.2)
+        self.assertTrue(mutate_thread.is_alive())  # Blocked until the commit is written.
+        data.release.set()
+        flush_thread.join(5.0)
+        mutate_thread.join(5.0)
+        self.assertEqual(self._stored(), (1, [0, 1]))
+        self.assertEqual(data.column('comp_id').tolist(), [0, 1, 2])
+
+        data.commit()
+        self.assertEqual(self._stored(), (2, [0, 1, 2]))
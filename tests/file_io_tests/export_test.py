@@ -18,6 +18,7 @@ from standard_interface_template.file_io.boundary_conditions_writer import Bound
 from standard_interface_template.file_io.geometry_writer import GeometryWriter
 from standard_interface_template.file_io.materials_writer import MaterialsWriter
 from standard_interface_template.file_io.simulation_writer import SimulationWriter
+from standard_interface_template.mapping.mapping_result import MappingResult
 
 __copyright__ = "(C) Copyright Aquaveo 2020"
 __license__ = "All rights reserved"
@@ -65,9 +66,9 @@ class ExportTests(unittest.TestCase):
         bc_component_file = os.path.join(input_folder, 'boundary_coverage_comp.nc')
         bc_data = BoundaryCoverageComponent(bc_component_file)
         output_file = 'test.example_boundary'
-        arc_to_ids = {1: 1}
-        arc_points = {1: (18, 19, 20)}
-        writer = BoundaryConditionsWriter(output_file, arc_to_ids, arc_points, bc_data)
+        mapping_result = MappingResult()
+        mapping_result.set_arc_nodes([1], [1], [(18, 19, 20)])
+        writer = BoundaryConditionsWriter(output_file, mapping_result, bc_data)
         writer.write()
         self.assertTrue(filecmp.cmp(output_file, os.path.join(baseline_folder, output_file)))
 
@@ -84,7 +85,23 @@ class ExportTests(unittest.TestCase):
                         0: [9, 10, 14, 16, 17, 32, 39, 41, 42, 43, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56,
                             57, 58, 59, 60, 61, 62, 63, 64, 65, 66, 67, 68, 69, 70, 71, 72, 73, 74, 75, 76, 77, 78, 79,
                             80, 81, 82, 83, 84, 85, 86, 87]}
-        writer = MaterialsWriter(output_file, mat_to_cells, mat_data)
+        mapping_result = MappingResult()
+        mapping_result.set_material_cells(mat_to_cells, 88)
+        writer = MaterialsWriter(output_file, mapping_result, mat_data)
+        writer.write()
+        self.assertTrue(filecmp.cmp(output_file, os.path.join(baseline_folder, output_file)))
+
+    def test_export_materials_file_empty_material(self):
+        """Tests that a material mapped to no cells is exported with an empty list of cells."""
+        folder = 'export_materials'
+        input_folder = os.path.join(os.getcwd(), 'input', folder)
+        baseline_folder = os.path.join(os.getcwd(), 'baselines', folder)
+        mat_component_file = os.path.join(input_folder, 'materials_coverage_comp.nc')
+        mat_data = MaterialsCoverageComponent(mat_component_file)
+        output_file = 'test.example_materials_empty'
+        mapping_result = MappingResult()
+        mapping_result.set_material_cells({0: list(range(88)), 1: []}, 88)
+        writer = MaterialsWriter(output_file, mapping_result, mat_data)
         writer.write()
         self.assertTrue(filecmp.cmp(output_file, os.path.join(baseline_folder, output_file)))
 
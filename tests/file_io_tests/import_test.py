@@ -133,3 +133,14 @@ class ImportTests(unittest.TestCase):
         scalar_values = reader.read_solution_scalar_values(input_folder)
         # The file we are reading has 63 values in it; all of them are 0.0.
         self.assertEqual(scalar_values, [0.0] * 63)
+
+    def test_import_boundary_conditions_file_with_points(self):
+        """Tests that point boundary conditions are read apart from the arc boundary conditions."""
+        folder = 'import_boundary_conditions'
+        input_folder = os.path.join(os.getcwd(), 'input', folder)
+        input_file = os.path.join(input_folder, 'test_points.example_boundary')
+        reader = BoundaryConditionsReader()
+        reader.read(input_file)
+        self.assertEqual(reader.arcs, {1: [18, 19, 20]})
+        self.assertEqual(reader.data, {'comp_id': [1], 'user_option': ['C'], 'user_text': ['Hello World!']})
+        self.assertEqual(reader.points, {4: {'user_option': 'B', 'user_text': 'At a node', 'node': 6}})
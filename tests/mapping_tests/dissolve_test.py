@@ -0,0 +1,68 @@
+"""For testing."""
+
+# 1. Standard python libraries
+import types
+import unittest
+
+# 2. Third party libraries
+import numpy as np
+
+# 3. Aquaveo libraries
+
+# 4. Local libraries
+from standard_interface_template.mapping.dissolve import dissolve_cells
+from standard_interface_template.mapping.grid_arrays import GridArrays
+
+__copyright__ = "(C) Copyright Aquaveo 2020"
+__license__ = "All rights reserved"
+
+
+def _quad_grid(num_cols, num_rows):
+    """
+    Builds a grid of unit quads.
+
+    Args:
+        num_cols (int): Number of cells in x.
+        num_rows (int): Number of cells in y.
+
+    Returns:
+        (:obj:`GridArrays`): The grid.
+    """
+    xs, ys = np.meshgrid(np.arange(num_cols + 1.0), np.arange(num_rows + 1.0))
+    locations = np.column_stack([xs.ravel(), ys.ravel(), np.zeros(xs.size)])
+    cols, rows = np.meshgrid(np.arange(num_cols), np.arange(num_rows))
+    first = (rows * (num_cols + 1) + cols).ravel()
+    cellstream = np.column_stack([np.full(first.size, 9), np.full(first.size, 4), first, first + 1,
+                                  first + num_cols + 2, first + num_cols + 1]).ravel()
+    return GridArrays(types.SimpleNamespace(locations=locations, cellstream=cellstream))
+
+
+class DissolveTests(unittest.TestCase):
+    """Tests merging cells into outline polygons."""
+
+    def test_block(self):
+        """Tests that a block of cells becomes a single rectangle."""
+        grid = _quad_grid(3, 3)
+        polygons = dissolve_cells(grid, np.arange(9))
+        self.assertEqual(len(polygons), 1)
+        outer = np.reshape(polygons[0]['outer'], (-1, 3))
+        self.assertEqual(len(outer), 5)  # Four corners and the closing point
+        self.assertEqual(outer[0].tolist(), outer[-1].tolist())
+        self.assertEqual(sorted(map(tuple, outer[:-1, :2].tolist())), [(0, 0), (0, 3), (3, 0), (3, 3)])
+        self.assertEqual(polygons[0]['inner'], [])
+
+    def test_hole(self):
+        """Tests that a missing middle cell becomes a hole."""
+        grid = _quad_grid(3, 3)
+        polygons = dissolve_cells(grid, [0, 1, 2, 3, 5, 6, 7, 8])
+        self.assertEqual(len(polygons), 1)
+        self.assertEqual(len(polygons[0]['inner']), 1)
+        inner = np.reshape(polygons[0]['inner'][0], (-1, 3))
+        self.assertEqual(sorted(map(tuple, inner[:-1, :2].tolist())), [(1, 1), (1, 2), (2, 1), (2, 2)])
+
+    def test_separate_areas(self):
+        """Tests that cells that do not share an edge stay separate polygons."""
+        grid = _quad_grid(3, 1)
+        polygons = dissolve_cells(grid, [0, 2])
+        self.assertEqual(len(polygons), 2)
+        self.assertEqual(dissolve_cells(grid, []), [])
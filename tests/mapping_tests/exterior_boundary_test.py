@@ -0,0 +1,82 @@
+"""For testing."""
+
+# 1. Standard python libraries
+import types
+import unittest
+
+# 2. Third party libraries
+import numpy as np
+
+# 3. Aquaveo libraries
+
+# 4. Local libraries
+from standard_interface_template.mapping.exterior_boundary import ExteriorBoundary
+from standard_interface_template.mapping.grid_arrays import GridArrays
+
+__copyright__ = "(C) Copyright Aquaveo 2020"
+__license__ = "All rights reserved"
+
+
+def _quad_grid(num_cols, num_rows, skip_cells=()):
+    """
+    Builds a grid of unit quads.
+
+    Args:
+        num_cols (int): Number of cells in x.
+        num_rows (int): Number of cells in y.
+        skip_cells (:obj:`tuple`): Cells, numbered row by row, left out to make holes.
+
+    Returns:
+        (:obj:`GridArrays`): The grid.
+    """
+    xs, ys = np.meshgrid(np.arange(num_cols + 1.0), np.arange(num_rows + 1.0))
+    locations = np.column_stack([xs.ravel(), ys.ravel(), np.zeros(xs.size)])
+    cols, rows = np.meshgrid(np.arange(num_cols), np.arange(num_rows))
+    first = np.delete((rows * (num_cols + 1) + cols).ravel(), list(skip_cells))
+    cellstream = np.column_stack([np.full(first.size, 9), np.full(first.size, 4), first, first + 1,
+                                  first + num_cols + 2, first + num_cols + 1]).ravel()
+    return GridArrays(types.SimpleNamespace(locations=locations, cellstream=cellstream))
+
+
+class ExteriorBoundaryTests(unittest.TestCase):
+    """Tests snapping arcs to the exterior boundary of a grid."""
+
+    def setUp(self):
+        """Builds a 3x2 grid of unit quads. Node ids are row * 4 + column."""
+        self.boundary = ExteriorBoundary(_quad_grid(3, 2))
+
+    def test_loops(self):
+        """Tests the boundary loop and the distance along it."""
+        self.assertEqual(len(self.boundary.loop_offsets), 2)
+        self.assertEqual(sorted(self.boundary.loop_nodes.tolist()), [0, 1, 2, 3, 4, 7, 8, 9, 10, 11])
+        self.assertEqual(self.boundary.loop_lengths.tolist(), [10.0])
+        self.assertEqual(self.boundary.distances[0], 0.0)
+
+    def test_snap_follows_arc(self):
+        """Tests that the nodes between the arc's ends are taken on the side the arc runs along."""
+        bottom = [(0.1, -0.2, 0.0), (1.5, -0.3, 0.0), (3.1, 0.1, 0.0)]
+        node_ids, locations = self.boundary.snap(bottom)
+        self.assertEqual(node_ids.tolist(), [0, 1, 2, 3])
+        self.assertEqual(locations[-1].tolist(), [3.0, 0.0, 0.0])
+
+        around_top = [(0.1, -0.2, 0.0), (-0.5, 2.5, 0.0), (3.5, 2.5, 0.0), (3.1, 0.1, 0.0)]
+        node_ids, _ = self.boundary.snap(around_top)
+        self.assertEqual(node_ids.tolist(), [0, 4, 8, 9, 10, 11, 7, 3])
+
+    def test_snap_same_node(self):
+        """Tests that arcs whose ends snap to the same node are left for xmssnap."""
+        self.assertIsNone(self.boundary.snap([(0.0, 0.0, 0.0), (0.1, 0.1, 0.0)]))
+
+    def test_hole_is_not_exterior(self):
+        """Tests that the loop around a hole in the grid is not part of the exterior boundary."""
+        boundary = ExteriorBoundary(_quad_grid(3, 3, skip_cells=[4]))  # Node ids are row * 4 + column.
+        self.assertEqual(len(boundary.loop_offsets), 2)
+        self.assertNotIn(5, boundary.loop_nodes.tolist())
+        self.assertIsNone(boundary.snap([(1.1, 1.1, 0.0), (1.5, 1.2, 0.0), (1.9, 1.1, 0.0)]))
+
+    def test_snap_tolerance(self):
+        """Tests that arcs with an end far from the boundary are left for xmssnap."""
+        self.assertEqual(self.boundary.tolerance, 1.0)
+        self.assertIsNone(self.boundary.snap([(0.1, -0.2, 0.0), (1.5, -0.3, 0.0), (3.0, -1.5, 0.0)]))
+        boundary = ExteriorBoundary(_quad_grid(3, 2), tolerance=2.0)
+        self.assertEqual(boundary.snap([(0.1, -0.2, 0.0), (3.0, -1.5, 0.0)])[0].tolist(), [0, 1, 2, 3])
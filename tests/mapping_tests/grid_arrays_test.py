@@ -0,0 +1,43 @@
+"""For testing."""
+
+# 1. Standard python libraries
+import types
+import unittest
+
+# 2. Third party libraries
+
+# 3. Aquaveo libraries
+
+# 4. Local libraries
+from standard_interface_template.mapping.grid_arrays import GridArrays
+
+__copyright__ = "(C) Copyright Aquaveo 2020"
+__license__ = "All rights reserved"
+
+
+class GridArraysTests(unittest.TestCase):
+    """Tests the flat array views of a grid."""
+
+    def setUp(self):
+        """Builds a grid with a quad and two triangles."""
+        locations = [(0.0, 0.0, 0.0), (1.0, 0.0, 0.0), (1.0, 1.0, 0.0), (0.0, 1.0, 0.0), (2.0, 0.0, 0.0),
+                     (2.0, 1.0, 0.0)]
+        cellstream = [9, 4, 0, 1, 2, 3, 5, 3, 1, 4, 2, 5, 3, 4, 5, 2]
+        self.grid = GridArrays(types.SimpleNamespace(locations=locations, cellstream=cellstream))
+
+    def test_cells(self):
+        """Tests decoding the cell stream."""
+        self.assertEqual(self.grid.cell_count, 3)
+        self.assertEqual(self.grid.cell_sizes.tolist(), [4, 3, 3])
+        self.assertEqual(self.grid.cell_point_offsets.tolist(), [0, 4, 7, 10])
+        self.assertEqual(self.grid.cell_points.tolist(), [0, 1, 2, 3, 1, 4, 2, 4, 5, 2])
+
+    def test_fingerprint(self):
+        """Tests that the fingerprint changes with the grid geometry."""
+        moved = GridArrays(types.SimpleNamespace(locations=self.grid.locations + 1.0, cellstream=self.grid.cellstream))
+        self.assertNotEqual(self.grid.fingerprint, moved.fingerprint)
+        self.assertEqual(self.grid.fingerprint, self.grid.fingerprint)
+
+    def test_edge_length(self):
+        """Tests the typical edge length of the grid."""
+        self.assertAlmostEqual(self.grid.edge_length, 1.0)
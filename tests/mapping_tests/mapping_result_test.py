@@ -0,0 +1,86 @@
+"""For testing."""
+
+# 1. Standard python libraries
+import os
+import tempfile
+import unittest
+
+# 2. Third party libraries
+
+# 3. Aquaveo libraries
+
+# 4. Local libraries
+from standard_interface_template.mapping.mapping_result import MappingResult
+
+__copyright__ = "(C) Copyright Aquaveo 2020"
+__license__ = "All rights reserved"
+
+
+class MappingResultTests(unittest.TestCase):
+    """Tests the array storage of mapped coverages."""
+
+    def test_material_cells(self):
+        """Tests looking up the cells of each material."""
+        result = MappingResult()
+        result.set_cell_materials([2, 0, 2, 1, 0, 2])
+        self.assertEqual(result.cells_of_material(0).tolist(), [1, 4])
+        self.assertEqual(result.cells_of_material(1).tolist(), [3])
+        self.assertEqual(result.cells_of_material(2).tolist(), [0, 2, 5])
+        self.assertEqual(result.cells_of_material(3).tolist(), [])
+        self.assertTrue(result.has_material(1))
+        self.assertFalse(result.has_material(3))
+
+    def test_materials_without_cells(self):
+        """Tests that materials mapped to no cells are kept."""
+        result = MappingResult()
+        result.set_cell_materials([2, 0, 2], [0, 5, 2])
+        self.assertEqual(result.material_ids.tolist(), [0, 2, 5])
+        self.assertTrue(result.has_material(5))
+        self.assertEqual(result.cells_of_material(5).tolist(), [])
+        self.assertEqual(result.cells_of_material(2).tolist(), [0, 2])
+        self.assertFalse(result.has_material(1))
+
+    def test_material_cells_from_dict(self):
+        """Tests that cells missing from the material dict get material -1."""
+        result = MappingResult()
+        result.set_material_cells({0: [3, 1], 4: [0]}, 5)
+        self.assertEqual(result.cell_materials.tolist(), [4, 0, -1, 0, -1])
+        self.assertEqual(result.cells_of_material(0).tolist(), [1, 3])
+
+    def test_arcs(self):
+        """Tests iterating over the arcs in export order."""
+        result = MappingResult()
+        result.set_arc_nodes([3, 1], [7, 0], [[5, 6, 7], [9]])
+        arcs = [(arc_id, comp_id, nodes.tolist()) for arc_id, comp_id, nodes in result.arcs()]
+        self.assertEqual(arcs, [(3, 7, [5, 6, 7]), (1, 0, [9])])
+
+    def test_points(self):
+        """Tests iterating over the points in export order."""
+        result = MappingResult()
+        result.set_point_nodes([4, 2], [0, 3], [11, 8])
+        self.assertEqual(list(result.points()), [(4, 0, 11), (2, 3, 8)])
+
+    def test_save_and_load(self):
+        """Tests writing and reading a mapping result."""
+        result = MappingResult()
+        result.set_cell_materials([1, 1, 0])
+        result.set_arc_nodes([1], [2], [[0, 1]])
+        result.set_point_nodes([5], [1], [2])
+        with tempfile.TemporaryDirectory() as temp_dir:
+            filename = os.path.join(temp_dir, 'mapping_result.npz')
+            result.save(filename)
+            loaded = MappingResult.load(filename)
+        self.assertEqual(loaded.cells_of_material(1).tolist(), [0, 1])
+        self.assertEqual(loaded.nodes_of_arc(0).tolist(), [0, 1])
+        self.assertEqual(loaded.arc_comp_ids.tolist(), [2])
+        self.assertEqual(list(loaded.points()), [(5, 1, 2)])
+
+    def test_load_with_key(self):
+        """Tests that a result saved for other inputs is not loaded."""
+        result = MappingResult()
+        result.set_cell_materials([2])
+        with tempfile.TemporaryDirectory() as temp_dir:
+            filename = os.path.join(temp_dir, 'mapping_result.npz')
+            result.save(filename, key='grid-a')
+            self.assertIsNone(MappingResult.load(filename, key='grid-b'))
+            self.assertEqual(MappingResult.load(filename, key='grid-a').cell_materials.tolist(), [2])
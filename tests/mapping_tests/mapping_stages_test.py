@@ -0,0 +1,63 @@
+"""For testing."""
+
+# 1. Standard python libraries
+import logging
+import threading
+import time
+import unittest
+
+# 2. Third party libraries
+
+# 3. Aquaveo libraries
+
+# 4. Local libraries
+from standard_interface_template.mapping.mapping_stages import run_mapping_stages
+
+__copyright__ = "(C) Copyright Aquaveo 2020"
+__license__ = "All rights reserved"
+
+
+class MappingStagesTests(unittest.TestCase):
+    """Tests running the snap and write stages of the coverage mappers."""
+
+    def setUp(self):
+        """Sets up the logger the mappers log to."""
+        self.logger = logging.getLogger('mapping_stages_test')
+
+    def test_results_in_stage_order(self):
+        """Tests that results are in the order of the stages, even if a later mapper finishes first."""
+        snap_threads = []
+
+        def snap(name):
+            snap_threads.append(threading.current_thread())
+            return name
+
+        def write(delay):
+            def write_mapper(mapper):
+                time.sleep(delay)
+                return mapper
+            return write_mapper
+
+        stages = [
+            ('slow', lambda: snap('slow'), write(0.2)),
+            ('empty', lambda: None, write(0.0)),
+            ('fast', lambda: snap('fast'), write(0.0)),
+            ('no_result', lambda: snap('no_result'), lambda mapper: None),
+        ]
+        self.assertEqual(run_mapping_stages(stages, self.logger), ['slow', 'fast'])
+        self.assertEqual(snap_threads, [threading.current_thread()] * 3)
+
+    def test_errors_logged_by_mapper(self):
+        """Tests that an error is logged under the mapper it came from, and the other mappers still finish."""
+        def fail(*args):
+            raise RuntimeError('bad')
+
+        stages = [
+            ('materials', fail, lambda mapper: 'materials'),
+            ('boundary_conditions', lambda: 'boundary_conditions', fail),
+            ('other', lambda: 'other', lambda mapper: mapper),
+        ]
+        with self.assertLogs(self.logger, 'ERROR') as logs:
+            self.assertEqual(run_mapping_stages(stages, self.logger), ['other'])
+        self.assertEqual([record.name for record in logs.records],
+                         ['mapping_stages_test.materials', 'mapping_stages_test.boundary_conditions'])
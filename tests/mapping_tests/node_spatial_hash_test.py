@@ -0,0 +1,35 @@
+"""For testing."""
+
+# 1. Standard python libraries
+import unittest
+
+# 2. Third party libraries
+import numpy as np
+
+# 3. Aquaveo libraries
+
+# 4. Local libraries
+from standard_interface_template.mapping.node_spatial_hash import NodeSpatialHash
+
+__copyright__ = "(C) Copyright Aquaveo 2020"
+__license__ = "All rights reserved"
+
+
+class NodeSpatialHashTests(unittest.TestCase):
+    """Tests nearest node lookups."""
+
+    def test_matches_brute_force(self):
+        """Tests that batched queries inside and far outside the nodes find the nearest node."""
+        rng = np.random.default_rng(42)
+        nodes = np.concatenate([rng.random((500, 3)) * 10.0, rng.random((5, 3)) * 1000.0])
+        queries = np.concatenate([rng.random((200, 2)) * 10.0, rng.random((50, 2)) * 1000.0, [(-1.0e5, 5.0)]])
+        spatial_hash = NodeSpatialHash(nodes)
+        expected = [np.argmin(np.sum((nodes[:, :2] - query)**2, axis=1)) for query in queries]
+        self.assertEqual(spatial_hash.nearest_nodes(queries).tolist(), expected)
+
+    def test_node_ids(self):
+        """Tests single queries returning the given node ids."""
+        spatial_hash = NodeSpatialHash([(0.0, 0.0, 0.0), (5.0, 5.0, 0.0)], node_ids=[7, 9])
+        self.assertEqual(spatial_hash.nearest(4.0, 4.5), 9)
+        self.assertEqual(spatial_hash.nearest(-1.0, 0.0), 7)
+        self.assertEqual(NodeSpatialHash([]).nearest(1.0, 1.0), -1)
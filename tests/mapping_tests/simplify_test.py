@@ -0,0 +1,33 @@
+"""For testing."""
+
+# 1. Standard python libraries
+import unittest
+
+# 2. Third party libraries
+import numpy as np
+
+# 3. Aquaveo libraries
+
+# 4. Local libraries
+from standard_interface_template.mapping.simplify import simplify_polyline
+
+__copyright__ = "(C) Copyright Aquaveo 2020"
+__license__ = "All rights reserved"
+
+
+class SimplifyTests(unittest.TestCase):
+    """Tests simplifying display polylines."""
+
+    def test_drops_points_within_tolerance(self):
+        """Tests that nearly straight runs collapse to their end points and corners are kept."""
+        locations = [(0.0, 0.0, 0.0), (1.0, 0.05, 0.0), (2.0, -0.05, 0.0), (3.0, 0.0, 0.0), (3.0, 1.0, 0.0),
+                     (3.05, 2.0, 0.0), (3.0, 3.0, 0.0)]
+        simplified = simplify_polyline(locations, 0.1)
+        self.assertEqual(simplified[:, :2].tolist(), [[0.0, 0.0], [3.0, 0.0], [3.0, 3.0]])
+
+    def test_keeps_points_outside_tolerance(self):
+        """Tests that points farther than the tolerance from the simplified line are kept."""
+        locations = np.array([(0.0, 0.0, 0.0), (1.0, 0.5, 0.0), (2.0, 0.0, 0.0)])
+        self.assertEqual(len(simplify_polyline(locations, 0.1)), 3)
+        self.assertEqual(len(simplify_polyline(locations, 1.0)), 2)
+        self.assertEqual(len(simplify_polyline(locations, 0.0)), 3)
@@ -0,0 +1,136 @@
+"""For testing."""
+
+# 1. Standard python libraries
+import os
+import tempfile
+import unittest
+
+# 2. Third party libraries
+import numpy as np
+
+# 3. Aquaveo libraries
+
+# 4. Local libraries
+from standard_interface_template.components.feature_id_map import FeatureIdMap
+from standard_interface_template.mapping.snap_cache import (arc_fingerprint, polygon_materials, polygons_fingerprint,
+                                                             SnapCache)
+
+__copyright__ = "(C) Copyright Aquaveo 2020"
+__license__ = "All rights reserved"
+
+
+class _Point:
+    """Stand-in for a coverage point."""
+
+    def __init__(self, x, y):
+        """Constructor."""
+        self._x = x
+        self._y = y
+
+    def get_x(self):
+        """Returns the x coordinate."""
+        return self._x
+
+    def get_y(self):
+        """Returns the y coordinate."""
+        return self._y
+
+    def get_z(self):
+        """Returns the z coordinate."""
+        return 0.0
+
+
+class _Arc:
+    """Stand-in for a coverage arc."""
+
+    def __init__(self, points):
+        """Constructor."""
+        self._points = points
+
+    def get_start_node(self):
+        """Returns the start node."""
+        return self._points[0]
+
+    def get_end_node(self):
+        """Returns the end node."""
+        return self._points[-1]
+
+    def get_vertices(self):
+        """Returns the vertices."""
+        return self._points[1:-1]
+
+
+class SnapCacheTests(unittest.TestCase):
+    """Tests the snap cache used for incremental mapping."""
+
+    def setUp(self):
+        """Sets up each individual test."""
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self._filename = os.path.join(self._temp_dir.name, 'snap_cache.npz')
+
+    def tearDown(self):
+        """Removes all created files after the tests have run."""
+        self._temp_dir.cleanup()
+
+    def test_arc_fingerprint(self):
+        """Tests that only geometry changes change an arc fingerprint."""
+        arc = _Arc([_Point(0.0, 0.0), _Point(1.0, 1.0), _Point(2.0, 0.0)])
+        same_arc = _Arc([_Point(0.0, 0.0), _Point(1.0, 1.0), _Point(2.0, 0.0)])
+        moved_arc = _Arc([_Point(0.0, 0.0), _Point(1.0, 1.5), _Point(2.0, 0.0)])
+        self.assertEqual(arc_fingerprint(arc), arc_fingerprint(same_arc))
+        self.assertNotEqual(arc_fingerprint(arc), arc_fingerprint(moved_arc))
+
+    def test_polygons_fingerprint(self):
+        """Tests that polygon order does not matter but materials do."""
+        fingerprint = polygons_fingerprint([1, 2], ['aa', 'bb'], [3, 0])
+        self.assertEqual(fingerprint, polygons_fingerprint([2, 1], ['bb', 'aa'], [0, 3]))
+        self.assertNotEqual(fingerprint, polygons_fingerprint([1, 2], ['aa', 'bb'], [3, 4]))
+        self.assertNotEqual(fingerprint, polygons_fingerprint([1, 2], ['aa', 'cc'], [3, 0]))
+
+    def test_polygon_materials(self):
+        """Tests that polygons without a material get the same material when mapped as when imported."""
+        poly_ids = [1, 2, 3, 4]
+        imported = polygon_materials(poly_ids, FeatureIdMap([1, 4], [3, 4]))
+        mapped = polygon_materials(poly_ids, FeatureIdMap.from_comp_to_xms({3: [1], 4: [4], -1: [2]}))
+        self.assertEqual(imported, [3, 0, 0, 4])
+        self.assertEqual(mapped, imported)
+        fingerprints = ['aa', 'bb', 'cc', 'dd']
+        self.assertEqual(polygons_fingerprint(poly_ids, fingerprints, mapped),
+                         polygons_fingerprint(poly_ids, fingerprints, imported))
+
+    def test_round_trip(self):
+        """Tests that unchanged features are read back from the cache."""
+        cache = SnapCache(self._filename, 'grid')
+        cache.set(1, 'abc', [3, 4, 5], [[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [2.0, 0.0, 0.0]])
+        cache.set(2, 'def', [6], [[3.0, 0.0, 0.0]])
+        cache.save([1, 2])
+
+        cache = SnapCache(self._filename, 'grid')
+        ids, locations = cache.get(1, 'abc')
+        self.assertEqual(ids.tolist(), [3, 4, 5])
+        self.assertEqual(locations.tolist(), [[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [2.0, 0.0, 0.0]])
+        self.assertIsNone(cache.get(2, 'modified'))
+
+    def test_removed_features_and_grid_changes(self):
+        """Tests that removed features and results for other grids are discarded."""
+        cache = SnapCache(self._filename, 'grid')
+        cache.set(1, 'abc', [3, 4, 5])
+        cache.set(2, 'def', [6])
+        cache.save([1, 2])
+        cache.save([1])
+
+        cache = SnapCache(self._filename, 'grid')
+        self.assertIsNone(cache.get(2, 'def'))
+        self.assertEqual(cache.get(1, 'abc')[0].tolist(), [3, 4, 5])
+        self.assertIsNone(SnapCache(self._filename, 'new grid').get(1, 'abc'))
+
+    def test_older_snapper(self):
+        """Tests that features snapped by an older snapper are discarded."""
+        cache = SnapCache(self._filename, 'grid')
+        cache.set(1, 'abc', [3, 4, 5])
+        cache.save([1])
+        with np.load(self._filename) as npz:
+            arrays = {name: npz[name] for name in npz.files if name != 'snapper_version'}
+        with open(self._filename, 'wb') as file:
+            np.savez(file, **arrays)  # As written before the snapper version was stored.
+        self.assertIsNone(SnapCache(self._filename, 'grid').get(1, 'abc'))